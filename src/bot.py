@@ -1,4 +1,5 @@
 import discord
+from discord import app_commands
 from discord.ext import commands
 import json
 import os
@@ -10,7 +11,13 @@ from keep_alive import keep_alive
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from mo_co import config, database, season_manager, game_data
+from mo_co import config, database, season_manager, game_data, async_db, pedia
+from mo_co.write_buffer import WRITE_BUFFER
+from mo_co.leaderboard import LEADERBOARD
+from mo_co.render import RENDER
+from mo_co.state_backend import STATE
+from mo_co.game_clock import CLOCK
+from mo_co.metrics import METRICS, track_interaction
 
 
 ADMIN_ID = (
@@ -20,28 +27,123 @@ ADMIN_ID = (
 )
 
 
-class MoCoBot(commands.Bot):
+class InstrumentedTree(app_commands.CommandTree):
+    """Times every slash command, with the database work it triggers."""
+
+    async def _call(self, interaction):
+        name = (interaction.data or {}).get("name", "unknown")
+        with track_interaction("command", name):
+            await super()._call(interaction)
+
+
+def _item_name(view, item):
+    if not type(item).__module__.startswith("discord."):
+        return type(item).__name__
+    callback = getattr(item.callback, "callback", item.callback)
+    return f"{type(view).__name__}.{getattr(callback, '__name__', 'callback')}"
+
+
+def instrument_views():
+    """
+    Time every component and modal callback. discord.py runs them all through
+    View._scheduled_task / Modal._scheduled_task, so wrapping those two covers
+    every view in the bot without touching each class.
+    """
+    if getattr(discord.ui.View, "_moco_timed", False):
+        return
+    view_task = discord.ui.View._scheduled_task
+    modal_task = discord.ui.Modal._scheduled_task
+
+    async def timed_view_task(self, item, interaction):
+        with track_interaction("component", _item_name(self, item)):
+            await view_task(self, item, interaction)
+
+    async def timed_modal_task(self, interaction, *args):
+        with track_interaction("modal", type(self).__name__):
+            await modal_task(self, interaction, *args)
+
+    discord.ui.View._scheduled_task = timed_view_task
+    discord.ui.Modal._scheduled_task = timed_modal_task
+    discord.ui.View._moco_timed = True
+
+
+BotBase = commands.AutoShardedBot if config.SHARDED else commands.Bot
+
+
+class MoCoBot(BotBase):
+    """
+    Set SHARD_COUNT (or SHARDED=1 for Discord's recommended count) to run as
+    an AutoShardedBot. To spread shards over several processes, give each one
+    its own SHARD_IDS and STATE_BACKEND=sqlite so they share live game state.
+    The process that owns shard 0 syncs commands and runs the global loops.
+    """
+
     def __init__(self):
         intents = discord.Intents.default()
         intents.messages = True
 
+        shard_options = {}
+        if config.SHARDED:
+            shard_options["shard_count"] = config.SHARD_COUNT or None
+            if config.SHARD_IDS:
+                shard_options["shard_ids"] = config.SHARD_IDS
+                if STATE.name == "memory":
+                    print(
+                        "WARNING: SHARD_IDS set with STATE_BACKEND=memory; "
+                        "live game state will not be shared between processes."
+                    )
+
         super().__init__(
             command_prefix=commands.when_mentioned,
             intents=intents,
             application_id=config.APPLICATION_ID,
+            tree_cls=InstrumentedTree,
+            **shard_options,
         )
-        self.config_cache = {}
+        self.config_cache = database.CONFIG_CACHE
         self.blacklist_cache = {}
         self.guild_blacklist_cache = {}
 
+        instrument_views()
+        METRICS.add_source("loop_lag", async_db.LAG_MONITOR.snapshot)
+        METRICS.add_source("db_pool", database.get_pool_stats)
+        METRICS.add_source("game_clock", lambda: CLOCK.stats)
+        METRICS.add_source("render", lambda: RENDER.stats)
+        METRICS.add_source("write_buffer", lambda: WRITE_BUFFER.stats)
+        METRICS.add_source("known_users", self._known_user_stats)
+
+    @staticmethod
+    def _known_user_stats():
+        return dict(database.KNOWN_USERS_STATS, size=len(database.KNOWN_USERS))
+
+    @property
+    def active_elites(self):
+        return STATE.get("events", "elites", [])
+
+    @active_elites.setter
+    def active_elites(self, value):
+        STATE.set("events", "elites", value)
+
+    @property
+    def active_world_events(self):
+        return STATE.get("events", "world", {})
+
+    @active_world_events.setter
+    def active_world_events(self, value):
+        STATE.set("events", "world", value)
+
     def update_cache(self, key, value):
         """Manually update cache from commands (admin)"""
-        self.config_cache[key] = value
+        database.cache_config_value(key, value)
 
     async def setup_hook(self):
         database.init_db()
         season_manager.init_season()
 
+        migrated = pedia.migrate_legacy_pedia()
+        if migrated:
+            print(f"Migrated {migrated} mo.copedia records to pedia tables.")
+
         print("Loading global configuration cache...")
         configs, u_bans, g_bans = database.load_global_cache()
         self.config_cache = configs
@@ -101,19 +203,38 @@ class MoCoBot(commands.Bot):
                 print(f"Failed to load extension {ext}: {e}")
 
         self.tree.interaction_check = self.global_interaction_check
-        await self.tree.sync()
-        print("Slash commands synced and ready.")
+        if config.PRIMARY_SHARD:
+            await self.tree.sync()
+            print("Slash commands synced and ready.")
 
     async def on_ready(self):
+        async_db.LAG_MONITOR.start()
+        WRITE_BUFFER.start()
+        LEADERBOARD.start()
+        RENDER.start(self)
         print(f"Logged in as {self.user} (ID: {self.user.id})")
+        if config.SHARDED:
+            print(f"Shards {self.shard_ids} of {self.shard_count} ({STATE.name} state)")
+
+    async def close(self):
+        try:
+            await WRITE_BUFFER.flush_async()
+            await async_db.call_write(database.flush_display_names)
+        except Exception as e:
+            print(f"Final write-behind flush failed: {e}")
+        await super().close()
 
     async def on_interaction(self, interaction: discord.Interaction):
         """Silently update user display name in background to keep leaderboards fresh."""
         try:
-            if interaction.user:
-                database.register_user(
-                    interaction.user.id, interaction.user.display_name
-                )
+            user = interaction.user
+            if not user:
+                return
+            if user.id in database.KNOWN_USERS:
+                # Cache hit: no queries, a rename is only queued.
+                database.register_user(user.id, user.display_name)
+            else:
+                await async_db.register_user(user.id, user.display_name)
         except:
             pass
 
@@ -121,7 +242,7 @@ class MoCoBot(commands.Bot):
         if interaction.user.id == ADMIN_ID:
             return True
 
-        m_mode = self.config_cache.get("maintenance_mode", "0")
+        m_mode = database.get_config("maintenance_mode", "0")
         if m_mode == "1":
             if interaction.type == discord.InteractionType.autocomplete:
                 return False
@@ -182,6 +303,7 @@ class MoCoBot(commands.Bot):
 
 
 if __name__ == "__main__":
-    keep_alive()
+    if config.PRIMARY_SHARD:
+        keep_alive()
     bot = MoCoBot()
     bot.run(config.TOKEN)
@@ -1,6 +1,7 @@
-from flask import Flask
+from flask import Flask, Response
 from threading import Thread
 import logging
+from mo_co.metrics import METRICS
 
 
 log = logging.getLogger("werkzeug")
@@ -14,6 +15,11 @@ def home():
     return "I am alive! Mo.hunt Bot is running."
 
 
+@app.route("/metrics")
+def metrics():
+    return Response(METRICS.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
 def run():
     app.run(host="0.0.0.0", port=8080)
 
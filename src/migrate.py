@@ -3,6 +3,7 @@ import os
 import sys
 import libsql_experimental as libsql
 from dotenv import load_dotenv
+from mo_co import database
 
 
 load_dotenv()
@@ -16,6 +17,7 @@ TABLES = [
     "users",
     "inventory",
     "gear_kits",
+    "equipped_slots",
     "loadouts",
     "inbox_messages",
     "season_config",
@@ -28,6 +30,7 @@ TABLES = [
     "user_blacklist",
     "guild_blacklist",
     "user_snapshots",
+    *database.PEDIA_TABLES,
 ]
 
 
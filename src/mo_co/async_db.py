@@ -0,0 +1,148 @@
+"""
+Awaitable facade over mo_co.database.
+
+    await async_db.get_user_data(uid)
+    await async_db.update_user_stats(uid, {...})
+    await async_db.call_write(utils.add_user_xp, uid, 500)
+
+Reads run on a small reader pool. Writes run on a single writer thread so they
+stay in submission order and never race each other on the same user row.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from mo_co import config, database
+
+
+READ_PREFIXES = ("get_", "is_", "has_", "load_")
+
+_READERS = ThreadPoolExecutor(
+    max_workers=config.DB_READ_WORKERS, thread_name_prefix="moco-db-read"
+)
+_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="moco-db-write")
+
+_stats_lock = threading.Lock()
+STATS = {
+    "read": {"calls": 0, "queue_total": 0.0, "run_total": 0.0, "run_max": 0.0},
+    "write": {"calls": 0, "queue_total": 0.0, "run_total": 0.0, "run_max": 0.0},
+    "inline": {"calls": 0, "queue_total": 0.0, "run_total": 0.0, "run_max": 0.0},
+}
+
+
+def _record(kind, queued, ran):
+    with _stats_lock:
+        s = STATS[kind]
+        s["calls"] += 1
+        s["queue_total"] += queued
+        s["run_total"] += ran
+        s["run_max"] = max(s["run_max"], ran)
+
+
+def _timed(kind, submitted, func, args, kwargs):
+    started = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _record(kind, started - submitted, time.perf_counter() - started)
+
+
+async def _submit(executor, kind, func, *args, **kwargs):
+    if not config.DB_ASYNC:
+        return _timed("inline", time.perf_counter(), func, args, kwargs)
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    job = functools.partial(
+        context.run, _timed, kind, time.perf_counter(), func, args, kwargs
+    )
+    return await loop.run_in_executor(executor, job)
+
+
+async def call_read(func, *args, **kwargs):
+    return await _submit(_READERS, "read", func, *args, **kwargs)
+
+
+async def call_write(func, *args, **kwargs):
+    return await _submit(_WRITER, "write", func, *args, **kwargs)
+
+
+_wrappers = {}
+
+
+def __getattr__(name):
+    if name in _wrappers:
+        return _wrappers[name]
+    func = getattr(database, name, None)
+    if name.startswith("_") or not callable(func):
+        raise AttributeError(f"module 'mo_co.async_db' has no attribute '{name}'")
+
+    runner = call_read if name.startswith(READ_PREFIXES) else call_write
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await runner(func, *args, **kwargs)
+
+    _wrappers[name] = wrapper
+    return wrapper
+
+
+class LoopLagMonitor:
+    """Samples how late the event loop wakes up, i.e. how long it was blocked."""
+
+    def __init__(self, interval=0.5, window=600):
+        self.interval = interval
+        self.samples = deque(maxlen=window)
+        self.task = None
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - started - self.interval))
+
+    def snapshot(self):
+        if not self.samples:
+            return {"samples": 0, "avg_ms": 0, "p95_ms": 0, "max_ms": 0}
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return {
+            "samples": len(ordered),
+            "avg_ms": round(sum(ordered) * 1000 / len(ordered), 2),
+            "p95_ms": round(p95 * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2),
+        }
+
+
+LAG_MONITOR = LoopLagMonitor()
+
+
+def get_stats():
+    """
+    `read`/`write` are DB calls moved off the loop (their run time is what
+    used to block it); `inline` is the same calls with DB_ASYNC=0.
+    """
+    with _stats_lock:
+        data = {}
+        for kind, s in STATS.items():
+            calls = s["calls"]
+            data[kind] = {
+                "calls": calls,
+                "queue_avg_ms": (
+                    round(s["queue_total"] * 1000 / calls, 2) if calls else 0
+                ),
+                "run_avg_ms": round(s["run_total"] * 1000 / calls, 2) if calls else 0,
+                "run_max_ms": round(s["run_max"] * 1000, 2),
+                "run_total_ms": round(s["run_total"] * 1000, 1),
+            }
+    data["loop_lag"] = LAG_MONITOR.snapshot()
+    data["enabled"] = config.DB_ASYNC
+    return data
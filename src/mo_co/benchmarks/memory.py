@@ -0,0 +1,165 @@
+"""
+Memory held by combat entities, measured with tracemalloc.
+
+    python -m mo_co.benchmarks.memory [--count 2000] [--json]
+
+Builds `count` entities of each kind offline, with no Discord connection and
+no database, and reports the bytes each one keeps alive. It also reports the
+footprint of one active rift: four players, a four-mob wave with its boss,
+and two summons.
+
+Each row is printed next to the dict-backed baseline in memory_baseline.json,
+measured with this same script at the commit before the entities got
+__slots__ (checkout that commit, copy this file in, run with --json, and
+paste the output into "bytes" to refresh it).
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from types import SimpleNamespace
+from mo_co import database
+from mo_co.combat_engine import CombatEngine, CombatEntity
+from mo_co.dojo_engine import DojoMob
+from mo_co.rift_engine import RiftBot, RiftMob, RiftPlayer, RiftSummon
+
+
+BOT = SimpleNamespace(emoji_map={}, get_user=lambda user_id: None)
+ENGINE = CombatEngine(BOT)
+
+KIT = {
+    "weapon_id": 1,
+    "gadget_1_id": 2,
+    "gadget_2_id": 3,
+    "gadget_3_id": None,
+    "passive_1_id": 4,
+    "passive_2_id": 5,
+    "passive_3_id": None,
+    "ring_1_id": 6,
+    "ring_2_id": None,
+    "ring_3_id": None,
+    "elite_module_id": None,
+}
+INVENTORY = {
+    1: {"item_id": "monster_slugger", "level": 30},
+    2: {"item_id": "monster_taser", "level": 30},
+    3: {"item_id": "vitamin_shot", "level": 30},
+    4: {"item_id": "smelly_socks", "level": 30},
+    5: {"item_id": "vampire_teeth", "level": 30},
+    6: {"item_id": "major_damage_ring", "level": 30},
+}
+USER = {"xp": 250000, "current_title": "Hunter"}
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "memory_baseline.json")
+
+
+def hunt_player():
+    player = CombatEntity(ENGINE, "Hunter", is_player=True, is_bot=True)
+    player.setup_stats(
+        30,
+        weapon={"id": "monster_slugger", "modifier": "Standard", "level": 30},
+        gadgets=[{"id": "monster_taser", "lvl": 30}, {"id": "vitamin_shot", "lvl": 30}],
+        passives={"smelly_socks": 30, "vampire_teeth": 30},
+        rings=[{"id": "major_damage_ring", "lvl": 30}],
+    )
+    return player
+
+
+def hunt_monster():
+    mob = CombatEntity(ENGINE, "Slasher", source_id="slasher")
+    mob.apply_modifier("Overcharged")
+    mob.setup_stats(30, hp=12000)
+    return mob
+
+
+def rift_player():
+    return RiftPlayer(BOT, 1, 1500, name="Hunter", context=(USER, KIT, INVENTORY))
+
+
+def rift_bot():
+    return RiftBot(BOT, "Jax", 30, 1500, 4000)
+
+
+def rift_mob():
+    return RiftMob(BOT, "Slasher", 30)
+
+
+def rift_summon():
+    return RiftSummon("Wolf", 2000, 1500, 20.0, "🐺", 1, "wolf_stick")
+
+
+def dojo_mob():
+    return DojoMob(BOT, "Slasher", 30)
+
+
+def active_rift():
+    return (
+        [rift_player() for _ in range(4)],
+        [rift_mob() for _ in range(4)] + [RiftMob(BOT, "Bone Smasher", 32, True)],
+        [rift_summon() for _ in range(2)],
+    )
+
+
+ENTITIES = {
+    "hunt_player": hunt_player,
+    "hunt_monster": hunt_monster,
+    "rift_player": rift_player,
+    "rift_bot": rift_bot,
+    "rift_mob": rift_mob,
+    "rift_summon": rift_summon,
+    "dojo_mob": dojo_mob,
+    "active_rift": active_rift,
+}
+
+
+def bytes_per_object(factory, count):
+    factory()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [factory() for _ in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(kept)
+    tracemalloc.stop()
+    del kept
+    return used // count
+
+
+def load_baseline():
+    with open(BASELINE_PATH) as f:
+        return json.load(f)
+
+
+def run(count=2000):
+    """{name: {"before": baseline bytes or None, "after": measured bytes}}."""
+    database.seed_config_cache({})
+    before = load_baseline()["bytes"]
+    return {
+        name: {"before": before.get(name), "after": bytes_per_object(f, count)}
+        for name, f in ENTITIES.items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Combat entity memory benchmark")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(args.count)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    commit = load_baseline()["commit"]
+    print(f"{'bytes':<14} {'before':>8} {'after':>8}  (before: {commit})")
+    for name, r in results.items():
+        if r["before"]:
+            saved = f"-{100 - r['after'] * 100 // r['before']}%"
+            print(f"{name:<14} {r['before']:>8,} {r['after']:>8,}  {saved}")
+        else:
+            print(f"{name:<14} {'-':>8} {r['after']:>8,}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+EXPLAIN QUERY PLAN check for the hot queries.
+
+    python -m mo_co.benchmarks.query_plans [--json]
+
+Builds a small synthetic database with the current schema and migrations,
+asks SQLite how it would run each query below, and fails (exit status 1)
+when one of them scans a table instead of using an index, or sorts with a
+temporary b-tree. The SQL is copied from the helpers named in the keys; keep
+it in step when they change.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from mo_co import database
+from mo_co.benchmarks import synthetic
+
+
+HOT_QUERIES = {
+    "get_user_inventory": ("SELECT * FROM inventory WHERE user_id = ?", (1,)),
+    "count_inventory": (
+        f"SELECT COUNT(*), SUM({database._ITEM_GP}) FROM inventory i JOIN item_meta m ON m.item_id = i.item_id WHERE i.user_id = ?",
+        (1,),
+    ),
+    "get_all_kits": (
+        "SELECT * FROM gear_kits WHERE user_id=? ORDER BY slot_index ASC",
+        (1,),
+    ),
+    "get_active_kit": (
+        "SELECT * FROM gear_kits WHERE user_id=? AND slot_index=?",
+        (1, 1),
+    ),
+    "get_user_inbox": (
+        "SELECT * FROM inbox_messages WHERE user_id = ? AND expires_at > datetime('now') AND is_claimed = 0 ORDER BY sent_at DESC",
+        (1,),
+    ),
+    "get_leaderboard_data": (
+        "SELECT user_id, display_name, xp, elite_xp, is_elite, prestige_level, current_title FROM users WHERE account_state = 'LEGIT' ORDER BY xp DESC LIMIT 100",
+        (),
+    ),
+    "get_active_user_count": (
+        "SELECT COUNT(*) FROM users WHERE last_hunt_time > ?",
+        ("2024-01-01T00:00:00",),
+    ),
+    "recent_hunters": (
+        "SELECT user_id, display_name, xp, is_elite, prestige_level, current_title, last_hunt_time FROM users ORDER BY last_hunt_time DESC LIMIT 25",
+        (),
+    ),
+    "promo_claimed": (
+        "SELECT 1 FROM promo_history WHERE user_id=? AND code_key=?",
+        (1, "CODE"),
+    ),
+    "unequip_lookup": (
+        "SELECT kit_id, slot, user_id FROM equipped_slots WHERE instance_id IN (?, ?)",
+        (1, 2),
+    ),
+    "unequip_gear_kits": (
+        "UPDATE gear_kits SET ring_1_id = NULL WHERE kit_id = ?",
+        (1,),
+    ),
+    "unequip_loadouts": (
+        "UPDATE loadouts SET ring_1_id = CASE WHEN ring_1_id IN (?) THEN NULL ELSE ring_1_id END WHERE user_id = ?",
+        (1, 1),
+    ),
+    "sync_equipped": (
+        f"SELECT * FROM ({database._EQUIPPED_ROWS}) WHERE user_id = ?",
+        (1,),
+    ),
+}
+
+
+def _problems(details):
+    bad = []
+    for detail in details:
+        if detail.startswith("SCAN ") and "INDEX" not in detail:
+            bad.append(detail)
+        elif detail.startswith("USE TEMP B-TREE"):
+            bad.append(detail)
+    return bad
+
+
+def check(conn):
+    """{query name: {"plan": [...], "ok": bool}} for every hot query."""
+    results = {}
+    for name, (sql, params) in HOT_QUERIES.items():
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        details = [r[3] for r in rows]
+        results[name] = {"plan": details, "ok": not _problems(details)}
+    return results
+
+
+def run(path, users=1000):
+    synthetic.use_database(path)
+    synthetic.populate(path, users)
+    with database.get_connection() as conn:
+        conn.execute("ANALYZE")
+        return check(conn)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hot query index check")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="moco_plans_") as tmp:
+        results = run(os.path.join(tmp, "moco_v2.db"))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, result in results.items():
+            status = "ok" if result["ok"] else "FAIL"
+            print(f"{status:<5} {name:<22} {' | '.join(result['plan'])}")
+    if not all(r["ok"] for r in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
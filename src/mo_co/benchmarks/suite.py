@@ -0,0 +1,356 @@
+"""
+Offline benchmarks for the engines and the database hot paths.
+
+    python -m mo_co.benchmarks.suite [--out report.json] [--only hunt_roll,...]
+        [--seconds 2] [--sizes 10000,100000] [--db PATH] [--quick]
+
+Runs against a synthetic moco_v2.db (see benchmarks.synthetic) built in a
+temporary directory, with no Discord connection. The database starts with
+the first --sizes entry worth of hunters and grows to the last one for the
+leaderboard builds, so that benchmark runs last. --db keeps the database
+instead; --quick is a smoke test with short runs and a tenth of the sizes.
+
+- hunt_roll: Hunting._spawn_monster + _roll_modifier + _generate_loot, per kill.
+- progression: Hunting.update_progression, per kill.
+- combat: CombatEngine hunt fights (hunter vs. overcharged monster) per second.
+- rift_tick: RiftInstance._tick with four players in the boss wave.
+- pedia_kill: pedia.track_kill as pedia_monsters grows.
+- user_context: get_full_user_context vs. the legacy per-row helpers.
+- query_plans: EXPLAIN QUERY PLAN of the hot queries (see query_plans.py).
+- leaderboard: LeaderboardCache.rebuild at each --sizes entry.
+
+The JSON report carries the git commit, so reports from two commits can be
+diffed directly.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from mo_co import config, database, game_data, metrics, pedia, utils
+from mo_co.benchmarks import query_plans, synthetic
+from mo_co.cogs.hunting import Hunting
+from mo_co.combat_engine import CombatEngine, CombatEntity
+from mo_co.game_data import scaling
+from mo_co.leaderboard import LeaderboardCache
+from mo_co.rift_engine import RiftInstance
+
+
+BOT = SimpleNamespace(
+    emoji_map={},
+    active_world_events={},
+    get_user=lambda user_id: None,
+    get_cog=lambda name: None,
+)
+
+RIFT = "rift_dead_end"
+PEDIA_SIZES = (0, 10000, 100000, 500000)
+
+
+def _rate(fn, seconds):
+    """Call fn() back to back for about `seconds`."""
+    ops = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while True:
+        fn()
+        ops += 1
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+    elapsed = now - started
+    return {
+        "ops": ops,
+        "ops_per_s": round(ops / elapsed, 1),
+        "mean_us": round(elapsed * 1e6 / ops, 1),
+    }
+
+
+def _queries(fn):
+    with metrics.track_interaction("benchmark", fn.__name__) as scope:
+        fn()
+    return scope.queries
+
+
+def _hunting():
+    # Skip Hunting.__init__: it starts the NPC loop, which needs a running bot.
+    cog = Hunting.__new__(Hunting)
+    cog.bot = BOT
+    return cog
+
+
+def bench_hunt_roll(ctx, seconds):
+    cog = _hunting()
+    worlds = [w for w in game_data.WORLDS if w.get("unlock_lvl", 1) > 6]
+    uid = ctx.user_ids[0]
+    u_data, kit, inv = database.get_full_user_context(uid)
+    passives = utils.get_active_passives(uid, kit, inv)
+    player_gp = utils.get_total_gp(uid, kit, inv)
+    player_lvl, _, _ = utils.get_level_info(u_data["xp"])
+    state = {"i": 0}
+
+    def kill():
+        w = worlds[state["i"] % len(worlds)]
+        state["i"] += 1
+        monster_id, lvl, is_boss = cog._spawn_monster(
+            w["id"], w["type"], w["unlock_lvl"], user_id=uid
+        )
+        cog._roll_modifier(w["id"], is_boss, uid, passives_cache=passives)
+        cog._generate_loot(
+            u_data,
+            monster_id,
+            is_boss,
+            1.0,
+            player_lvl,
+            lvl,
+            world_id=w["id"],
+            player_gp=player_gp,
+        )
+
+    return _rate(kill, seconds)
+
+
+def bench_progression(ctx, seconds):
+    cog = _hunting()
+    world = game_data.WORLDS[0]
+    users = ctx.user_ids[:500]
+    state = {"i": 0}
+
+    def kill():
+        uid = users[state["i"] % len(users)]
+        state["i"] += 1
+        cog.update_progression(uid, "Slasher", world["id"], "Standard", "Normal")
+
+    result = _rate(kill, seconds)
+    result["queries"] = _queries(kill)
+    return result
+
+
+def _hunt_fight():
+    engine = CombatEngine(BOT)
+    player = CombatEntity(engine, "Hunter", is_player=True, is_bot=True)
+    player.setup_stats(
+        30,
+        weapon={"id": "monster_slugger", "modifier": "Standard", "level": 30},
+        gadgets=[{"id": "monster_taser", "lvl": 30}, {"id": "vitamin_shot", "lvl": 30}],
+        passives={"smelly_socks": 30, "vampire_teeth": 30},
+        rings=[{"id": "major_damage_ring", "lvl": 30}],
+    )
+    engine.add_entity(player, "A")
+    mob = CombatEntity(engine, "Slasher", source_id="slasher")
+    mob.apply_modifier("Overcharged")
+    m_hp, m_atk, _ = scaling.get_hunt_monster_stats(36, "Overcharged", False, 900, 900)
+    mob.setup_stats(36, hp=m_hp)
+    mob.attack_pwr = m_atk
+    engine.add_entity(mob, "B")
+    engine.simulate_battle()
+
+
+def bench_combat(ctx, seconds):
+    return _rate(_hunt_fight, seconds)
+
+
+def _boss_rift(user_ids):
+    lobby = {
+        "leader": user_ids[0],
+        "rift": RIFT,
+        "members": list(user_ids),
+        "member_info": {uid: {"name": f"Hunter {uid}"} for uid in user_ids},
+    }
+    rift = RiftInstance(BOT, None, lobby)
+    rift._finish = lambda success: None
+    rift.wave_index = len(rift.rift_def["waves"]) - 1
+    rift.mobs = rift._spawn_wave(rift.wave_index)
+    return rift
+
+
+def bench_rift_tick(ctx, seconds):
+    squad = ctx.user_ids[:4]
+    ticks, spent = 0, 0.0
+    while spent < seconds:
+        rift = _boss_rift(squad)
+        while rift.active and rift.turn_count < 30:
+            started = time.perf_counter()
+            rift._tick()
+            spent += time.perf_counter() - started
+            ticks += 1
+    return {
+        "ticks": ticks,
+        "ticks_per_s": round(ticks / spent, 1),
+        "mean_us": round(spent * 1e6 / ticks, 1),
+    }
+
+
+def bench_pedia_kill(ctx, seconds):
+    users = ctx.user_ids[:1000]
+    rng = random.Random(0)
+    results = {}
+    for rows in ctx.pedia_sizes:
+        synthetic.add_pedia(ctx.path, rows, users)
+
+        def kill():
+            pedia.track_kill(
+                rng.choice(users),
+                f"Monster {rng.randrange(50)}",
+                is_overcharged=rng.random() < 0.05,
+            )
+
+        results[str(rows)] = _rate(kill, seconds / len(ctx.pedia_sizes))
+    return results
+
+
+def _legacy_context(uid):
+    user = database.get_user_data(uid)
+    kit = database.get_active_kit(uid)
+    items = {}
+    for slot in database.GEAR_SLOT_COLUMNS + ("ride_id",):
+        if kit[slot]:
+            items[kit[slot]] = database.get_item_instance(kit[slot])
+    return user, kit, items
+
+
+def bench_user_context(ctx, seconds):
+    rng = random.Random(0)
+    users = ctx.user_ids
+
+    def bulk():
+        database.get_full_user_context(rng.choice(users))
+
+    def legacy():
+        _legacy_context(rng.choice(users))
+
+    results = {}
+    for name, fn in (("get_full_user_context", bulk), ("legacy_n_plus_1", legacy)):
+        database.invalidate_kit()
+        results[name] = _rate(fn, seconds / 2)
+        results[name]["queries"] = _queries(fn)
+    return results
+
+
+def bench_query_plans(ctx, seconds):
+    with database.get_connection() as conn:
+        return query_plans.check(conn)
+
+
+def bench_leaderboard(ctx, seconds):
+    cache = LeaderboardCache(config.LEADERBOARD_REFRESH, config.LEADERBOARD_SIZE)
+    results = {}
+    for size in ctx.sizes:
+        if size > len(ctx.user_ids):
+            ctx.user_ids += synthetic.populate(
+                ctx.path, size - len(ctx.user_ids), seed=size
+            )
+        runs = []
+        for _ in range(3):
+            started = time.perf_counter()
+            cache.rebuild()
+            runs.append((time.perf_counter() - started) * 1000)
+        results[str(size)] = {
+            "min_ms": round(min(runs), 1),
+            "mean_ms": round(sum(runs) / len(runs), 1),
+        }
+    return results
+
+
+BENCHMARKS = {
+    "hunt_roll": bench_hunt_roll,
+    "progression": bench_progression,
+    "combat": bench_combat,
+    "rift_tick": bench_rift_tick,
+    "pedia_kill": bench_pedia_kill,
+    "user_context": bench_user_context,
+    "query_plans": bench_query_plans,
+    "leaderboard": bench_leaderboard,
+}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(path, names=None, seconds=2.0, sizes=(10000, 100000), quick=False):
+    """Build the synthetic database at path, run the benchmarks, return the report."""
+    if quick:
+        seconds, sizes = min(seconds, 0.5), tuple(s // 10 for s in sizes)
+    database.seed_config_cache({})
+    synthetic.use_database(path)
+    ctx = SimpleNamespace(
+        path=path,
+        sizes=sorted(sizes),
+        pedia_sizes=PEDIA_SIZES[:3] if quick else PEDIA_SIZES,
+        user_ids=synthetic.populate(path, min(sizes)),
+    )
+
+    results = {}
+    for name in BENCHMARKS:
+        if names and name not in names:
+            continue
+        started = time.perf_counter()
+        results[name] = BENCHMARKS[name](ctx, seconds)
+        print(f"{name:<13} {time.perf_counter() - started:6.1f}s", file=sys.stderr)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.datetime.utcnow().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "seconds": seconds,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Engine and database benchmarks")
+    parser.add_argument("--out", help="write the JSON report here")
+    parser.add_argument("--only", help="comma-separated: " + ",".join(BENCHMARKS))
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--db", help="build the synthetic database at this path")
+    parser.add_argument("--quick", action="store_true")
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.only.split(",")] if args.only else None
+    unknown = [n for n in names or [] if n not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+    if args.db and os.path.exists(args.db):
+        parser.error(f"{args.db} already exists")
+
+    with tempfile.TemporaryDirectory(prefix="moco_bench_") as tmp:
+        report = run(
+            args.db or os.path.join(tmp, "moco_v2.db"),
+            names,
+            seconds=args.seconds,
+            sizes=[int(s) for s in args.sizes.split(",")],
+            quick=args.quick,
+        )
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
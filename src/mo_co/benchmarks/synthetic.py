@@ -0,0 +1,125 @@
+"""
+Synthetic moco_v2.db for the offline benchmarks.
+
+    synthetic.use_database("/tmp/bench.db")
+    user_ids = synthetic.populate("/tmp/bench.db", 10000)
+
+use_database() points mo_co.database at a local SQLite file and creates the
+schema with init_db(). populate() bulk-loads hunters that look like real
+accounts: an active gear kit with six equipped items, spare inventory, a
+spread of XP, a few elites and flagged accounts. add_pedia() fills the
+pedia_monsters table up to a given row count.
+"""
+
+import random
+import sqlite3
+from mo_co import config, database, levels
+from mo_co.pedia import PEDIA_MIGRATED
+
+
+KIT_ITEMS = (
+    ("weapon_id", "monster_slugger"),
+    ("gadget_1_id", "monster_taser"),
+    ("gadget_2_id", "vitamin_shot"),
+    ("passive_1_id", "smelly_socks"),
+    ("passive_2_id", "vampire_teeth"),
+    ("ring_1_id", "major_damage_ring"),
+)
+SPARE_ITEMS = ("monster_taser", "vitamin_shot", "smelly_socks", "major_damage_ring")
+
+CHUNK = 5000
+
+
+def use_database(path):
+    """Route every database helper in this process to the SQLite file at path."""
+    database.USE_TURSO = False
+    database.DB_PATH = path
+    database.POOL = database.ConnectionPool(
+        database._open_raw_connection,
+        size=config.DB_POOL_SIZE,
+        timeout=config.DB_POOL_TIMEOUT,
+        recycle=config.DB_POOL_RECYCLE,
+    )
+    database.invalidate_kit()
+    database.init_db()
+
+
+def _next_id(conn, table, column):
+    return (conn.execute(f"SELECT MAX({column}) FROM {table}").fetchone()[0] or 0) + 1
+
+
+def populate(path, count, spare=4, seed=0):
+    """Append `count` hunters to the database at path and return their ids."""
+    rng = random.Random(seed)
+    kit_cols = ", ".join(col for col, _ in KIT_ITEMS)
+    kit_ph = ", ".join("?" * len(KIT_ITEMS))
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA synchronous=OFF")
+    first_user = max(_next_id(conn, "users", "user_id"), 100000)
+    instance_id = _next_id(conn, "inventory", "instance_id")
+    user_ids = list(range(first_user, first_user + count))
+
+    for start in range(0, count, CHUNK):
+        users, items, kits = [], [], []
+        for uid in user_ids[start : start + CHUNK]:
+            is_elite = rng.random() < 0.05
+            users.append(
+                (
+                    uid,
+                    f"Hunter {uid}",
+                    levels.MAX_BASE_XP if is_elite else rng.randint(0, 2000000),
+                    int(is_elite),
+                    rng.randint(0, 500000) if is_elite else 0,
+                    rng.randint(0, 300) if is_elite else 0,
+                    "LEGIT" if rng.random() < 0.99 else "SANDBOX",
+                    PEDIA_MIGRATED,
+                )
+            )
+            equipped = []
+            for _, item_id in KIT_ITEMS:
+                items.append((instance_id, uid, item_id, rng.randint(1, 50)))
+                equipped.append(instance_id)
+                instance_id += 1
+            for _ in range(spare):
+                items.append(
+                    (instance_id, uid, rng.choice(SPARE_ITEMS), rng.randint(1, 50))
+                )
+                instance_id += 1
+            kits.append((uid, *equipped))
+
+        conn.executemany(
+            "INSERT INTO users (user_id, display_name, xp, is_elite, elite_xp, elite_tokens, account_state, pedia_data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            users,
+        )
+        conn.executemany(
+            "INSERT INTO inventory (instance_id, user_id, item_id, level, modifier) VALUES (?, ?, ?, ?, 'Standard')",
+            items,
+        )
+        conn.executemany(
+            f"INSERT INTO gear_kits (user_id, slot_index, name, {kit_cols}) VALUES (?, 1, 'Gear Kit 1', {kit_ph})",
+            kits,
+        )
+        conn.commit()
+    conn.close()
+    database.invalidate_kit()
+    return user_ids
+
+
+def add_pedia(path, rows, user_ids, seed=0):
+    """Grow pedia_monsters to about `rows` rows, spread over user_ids."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA synchronous=OFF")
+    have = conn.execute("SELECT COUNT(*) FROM pedia_monsters").fetchone()[0]
+    n = len(user_ids)
+    batch = [
+        (user_ids[i % n], f"Monster {i // n}", rng.randint(1, 500))
+        for i in range(have, rows)
+    ]
+    conn.executemany(
+        "INSERT OR IGNORE INTO pedia_monsters (user_id, monster_id, k) VALUES (?, ?, ?)",
+        batch,
+    )
+    conn.commit()
+    conn.close()
@@ -10,11 +10,13 @@ from discord.ui import (
     UserSelect,
     ChannelSelect,
 )
+import io
 import json
 import sqlite3
 import asyncio
 from datetime import datetime, timedelta
-from mo_co import database, config, game_data, utils, season_manager
+from mo_co import database, config, game_data, utils, season_manager, async_db, levels
+from mo_co import metrics
 from mo_co.game_data.missions import MISSIONS
 import os
 
@@ -219,6 +221,7 @@ class Admin(commands.Cog):
             "users",
             "inventory",
             "gear_kits",
+            "equipped_slots",
             "loadouts",
             "inbox_messages",
             "season_config",
@@ -231,6 +234,7 @@ class Admin(commands.Cog):
             "user_blacklist",
             "guild_blacklist",
             "user_snapshots",
+            *database.PEDIA_TABLES,
         ]
 
         log_msg = "```\n"
@@ -274,6 +278,44 @@ class Admin(commands.Cog):
         except Exception as e:
             await ctx.send(f"💥 **Critical Migration Failure:** {e}")
 
+    @commands.command(name="db_pool")
+    @commands.check(is_admin_ctx)
+    async def db_pool(self, ctx):
+        stats = database.get_pool_stats()
+        lines = [f"{k}: {v}" for k, v in stats.items()]
+        for k, v in async_db.get_stats().items():
+            lines.append(f"{k}: {v}")
+        lines.append(f"kit_cache: {len(database.KIT_CACHE)} {database.KIT_CACHE_STATS}")
+        await ctx.send("**Database Pool**\n```" + "\n".join(lines) + "```")
+
+    @commands.command(name="profile")
+    @commands.check(is_admin_ctx)
+    async def profile(self, ctx, seconds: float = 10.0, sort: str = "cumulative"):
+        """cProfile the event loop for a few seconds and upload the report."""
+        seconds = max(1.0, min(seconds, 120.0))
+        if sort not in ("cumulative", "tottime", "ncalls"):
+            sort = "cumulative"
+        await ctx.send(f"⏱️ Profiling the event loop for {seconds:.0f}s...")
+        report = await metrics.profile_loop(seconds, sort)
+        await ctx.send(
+            f"**cProfile sample** ({seconds:.0f}s, sorted by {sort})",
+            file=discord.File(io.BytesIO(report.encode()), filename="profile.txt"),
+        )
+
+    @commands.command(name="metrics")
+    @commands.check(is_admin_ctx)
+    async def metrics_summary(self, ctx, family: str = "command"):
+        """Slowest entries of one metrics family, e.g. command, component, tick."""
+        entries = metrics.METRICS.snapshot()["histograms"].get(family, {})
+        if not entries:
+            return await ctx.send(f"No samples for `{family}` yet.")
+        ranked = sorted(entries.items(), key=lambda e: e[1]["avg_ms"], reverse=True)
+        lines = [
+            f"{name[:32]:<32} n={s['count']:<6} avg={s['avg_ms']}ms max={s['max_ms']}ms"
+            for name, s in ranked[:20]
+        ]
+        await ctx.send(f"**{family}**\n```" + "\n".join(lines) + "```")
+
     @commands.command(name="admin")
     @commands.check(is_admin_ctx)
     async def admin_panel(self, ctx):
@@ -293,7 +335,8 @@ class Admin(commands.Cog):
             ).fetchall()
 
         options = []
-        for row in rows:
+        row_levels = levels.levels_for(row["xp"] for row in rows)
+        for row, lvl in zip(rows, row_levels):
             uid = row["user_id"]
             db_name = row["display_name"]
 
@@ -303,7 +346,6 @@ class Admin(commands.Cog):
             else:
                 name = db_name
 
-            lvl, _, _ = utils.get_level_info(row["xp"])
             emblem_str = utils.get_emblem(
                 lvl, bool(row["is_elite"]), row["prestige_level"]
             )
@@ -964,7 +1006,7 @@ class GMPanelView(View):
 
         elif self.tab == "global":
             embed.title = "🌐 Global Control"
-            m_mode = self.bot.config_cache.get("maintenance_mode", "0")
+            m_mode = database.get_config("maintenance_mode", "0")
             status = "🔴 ACTIVE" if m_mode == "1" else "🟢 INACTIVE"
             embed.description = f"**Maintenance Mode:** {status}\n\nUse this tab to control global bot state."
 
@@ -1110,10 +1152,11 @@ class GMPanelView(View):
                         (val, iid),
                     )
             conn.commit()
+        for iid in self.cart["inv_edit"]:
+            database.invalidate_instance(iid)
         if self.cart["inv_edit"]:
             logs.append(f"Edited {len(self.cart['inv_edit'])} items")
-        for iid in self.cart["inv_del"]:
-            database.delete_inventory_item(iid)
+        database.delete_inventory_items(self.cart["inv_del"])
         if self.cart["inv_del"]:
             logs.append(f"Deleted {len(self.cart['inv_del'])} items")
 
@@ -1846,6 +1889,7 @@ class InsertRowModal(Modal):
             with database.get_connection() as conn:
                 conn.execute(sql, values)
                 conn.commit()
+            database.table_changed(self.table)
             await interaction.response.send_message(
                 f"✅ Row added to `{self.table}`.", ephemeral=True
             )
@@ -1924,6 +1968,7 @@ class DeleteRowConfirmModal(Modal):
                     (self.pk_val,),
                 )
                 conn.commit()
+            database.table_changed(self.table)
             await i.response.send_message(
                 f"✅ Row `{self.pk_val}` deleted from `{self.table}`.",
                 ephemeral=True,
@@ -2091,6 +2136,7 @@ class RawEditorModal(Modal):
                 (self.val.value, val),
             )
             c.commit()
+        database.table_changed(tbl)
         await i.response.send_message("Updated.", ephemeral=True)
 
 
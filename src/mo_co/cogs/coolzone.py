@@ -1,12 +1,14 @@
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord.ui import View, Button, Select, Modal, TextInput
 import time
 import random
 from collections import deque
 from mo_co import database, config, utils, game_data
 from mo_co.game_data import scaling
+from mo_co.render import RENDER
+from mo_co.state_backend import STATE, SharedMap
 
 
 MAX_CHAT_LOG = 50
@@ -14,13 +16,40 @@ DISPLAY_CHAT_LINES = 8
 SYNC_RATE = 2.0
 
 
+def _new_chat_log():
+    return deque([f"System: Welcome to Cool Zone! 🧊"], maxlen=MAX_CHAT_LOG)
+
+
 class CoolZoneState:
-    """Global state shared across all servers."""
+    """
+    Global state shared across all servers.
+
+    active_hunters holds the sessions (user, message, cooldowns, stats) of
+    hunters playing through this process. The chat log and the roster shown
+    under "Hunters Nearby" live in STATE so every shard sees the same zone.
+    """
 
     def __init__(self):
         self.active_hunters = {}
-        self.chat_log = deque(maxlen=MAX_CHAT_LOG)
-        self.chat_log.append(f"System: Welcome to Cool Zone! 🧊")
+        self.roster = SharedMap("coolzone_hunters")
+        STATE.update("coolzone", "chat", lambda log: log, _new_chat_log())
+
+    @property
+    def chat_log(self):
+        return STATE.get("coolzone", "chat") or _new_chat_log()
+
+    def publish(self, user_id):
+        """Copy this hunter's public line into the shared roster."""
+        data = self.active_hunters.get(user_id)
+        if not data:
+            return
+        self.roster[user_id] = {
+            "name": data["user"].display_name,
+            "emblem": data["emblem"],
+            "join_time": data["join_time"],
+            "last_action": data["last_action"],
+            "damage_dealt": data["stats"]["damage_dealt"],
+        }
 
     def add_hunter(self, user, interaction_message):
 
@@ -46,6 +75,7 @@ class CoolZoneState:
                 "sources": {},
             },
         }
+        self.publish(user.id)
         self.add_chat(f"{emblem} **{user.display_name}** entered the zone.")
 
     def remove_hunter(self, user_id):
@@ -53,21 +83,45 @@ class CoolZoneState:
             data = self.active_hunters[user_id]
             self.add_chat(f"👋 **{data['user'].display_name}** left.")
             del self.active_hunters[user_id]
+        del self.roster[user_id]
+        RENDER.unregister(("coolzone", user_id))
 
     def add_chat(self, msg):
-        self.chat_log.append(msg)
+        def push(log):
+            log.append(msg)
+            return log
+
+        STATE.update("coolzone", "chat", push, _new_chat_log())
 
 
 ZONE_STATE = CoolZoneState()
 
 
+def zone_refresh_rate(user_id):
+    data = ZONE_STATE.active_hunters.get(user_id)
+    if not data or time.time() - data["last_action"] > 10:
+        return 10.0
+    return SYNC_RATE
+
+
 class CoolZone(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.zone_loop.start()
 
-    def cog_unload(self):
-        self.zone_loop.cancel()
+    def track_hunter(self, user_id, message):
+        """Hand the hunter's zone message to the shared render scheduler."""
+        RENDER.register(
+            ("coolzone", user_id),
+            message,
+            lambda: self._render_zone(user_id),
+            lambda: zone_refresh_rate(user_id),
+            on_gone=lambda: ZONE_STATE.remove_hunter(user_id),
+        )
+
+    def _render_zone(self, user_id):
+        if user_id not in ZONE_STATE.active_hunters:
+            return None
+        return self.generate_zone_embed(user_id), None
 
     @app_commands.command(name="coolzone", description="Enter the Social Training Area")
     async def coolzone(self, interaction: discord.Interaction):
@@ -109,6 +163,7 @@ class CoolZone(commands.Cog):
 
         view = CoolZoneView(self.bot, interaction.user.id)
         await msg.edit(embed=self.generate_zone_embed(interaction.user.id), view=view)
+        self.track_hunter(interaction.user.id, msg)
 
     def generate_zone_embed(self, user_id):
         session = ZONE_STATE.active_hunters.get(user_id)
@@ -139,7 +194,7 @@ class CoolZone(commands.Cog):
 
         hunters_text = []
         sorted_hunters = sorted(
-            ZONE_STATE.active_hunters.items(),
+            ZONE_STATE.roster.items(),
             key=lambda x: x[1]["join_time"],
             reverse=True,
         )
@@ -147,20 +202,20 @@ class CoolZone(commands.Cog):
         for uid, data in sorted_hunters[:8]:
             status_icon = "🟢" if time.time() - data["last_action"] < 60 else "💤"
             duration = max(1, time.time() - data["join_time"])
-            dps = int(data["stats"]["damage_dealt"] / duration)
+            dps = int(data["damage_dealt"] / duration)
 
             stat_str = f" | {dps:,} DPS" if dps > 0 else ""
             is_me = " **(YOU)**" if uid == user_id else ""
 
             hunters_text.append(
-                f"{status_icon} {data['emblem']} **{data['user'].display_name}**{is_me}{stat_str}"
+                f"{status_icon} {data['emblem']} **{data['name']}**{is_me}{stat_str}"
             )
 
-        if len(ZONE_STATE.active_hunters) > 8:
-            hunters_text.append(f"...and {len(ZONE_STATE.active_hunters)-8} others.")
+        if len(sorted_hunters) > 8:
+            hunters_text.append(f"...and {len(sorted_hunters)-8} others.")
 
         embed.add_field(
-            name=f"Hunters Nearby ({len(ZONE_STATE.active_hunters)})",
+            name=f"Hunters Nearby ({len(sorted_hunters)})",
             value="\n".join(hunters_text) or "Just you...",
             inline=False,
         )
@@ -173,28 +228,6 @@ class CoolZone(commands.Cog):
 
         return embed
 
-    @tasks.loop(seconds=1.0)
-    async def zone_loop(self):
-        for uid in list(ZONE_STATE.active_hunters.keys()):
-            data = ZONE_STATE.active_hunters.get(uid)
-            if not data:
-                continue
-
-            rate = utils.get_sync_rate(self.bot, data["last_action"])
-
-            last_edit = data.get("last_edit_ts", 0)
-            if time.time() - last_edit >= rate:
-                try:
-                    embed = self.generate_zone_embed(uid)
-                    await data["message"].edit(embed=embed)
-                    data["last_edit_ts"] = time.time()
-                except:
-                    ZONE_STATE.remove_hunter(uid)
-
-    @zone_loop.before_loop
-    async def before_zone(self):
-        await self.bot.wait_until_ready()
-
 
 class CoolZoneRulesView(View):
     def __init__(self, bot, user_id):
@@ -228,6 +261,7 @@ class CoolZoneRulesView(View):
         cog = self.bot.get_cog("CoolZone")
         view = CoolZoneView(self.bot, interaction.user.id)
         await msg.edit(embed=cog.generate_zone_embed(interaction.user.id), view=view)
+        cog.track_hunter(interaction.user.id, msg)
 
 
 class CoolZoneView(View):
@@ -491,6 +525,7 @@ class CombatButton(Button):
         session["stats"]["sources"][self.item_id] = session["stats"]["sources"].get(
             self.item_id, 0
         ) + (val if self.action_type == "gadget" else dmg)
+        ZONE_STATE.publish(uid)
 
         view = CoolZoneView(self.view.bot, uid)
 
@@ -564,6 +599,7 @@ class ChatModal(Modal):
         emblem = session["emblem"]
         ZONE_STATE.add_chat(f"{emblem} **{interaction.user.display_name}**: {content}")
         session["last_action"] = time.time()
+        ZONE_STATE.publish(interaction.user.id)
 
         cog = interaction.client.get_cog("CoolZone")
         embed = cog.generate_zone_embed(interaction.user.id)
@@ -574,19 +610,18 @@ class InspectSelect(Select):
     def __init__(self, bot, user_id):
         self.bot = bot
         options = []
-        candidates = list(ZONE_STATE.active_hunters.values())
+        candidates = ZONE_STATE.roster.items()
         random.shuffle(candidates)
 
         count = 0
-        for s in candidates:
+        for uid, data in candidates:
             if count >= 20:
                 break
-            u = s["user"]
-            if u.id == user_id:
+            if uid == user_id:
                 continue
 
             options.append(
-                discord.SelectOption(label=u.display_name, value=str(u.id), emoji="👤")
+                discord.SelectOption(label=data["name"], value=str(uid), emoji="👤")
             )
             count += 1
 
@@ -605,11 +640,16 @@ class InspectSelect(Select):
             )
 
         target_id = int(val)
-        target_session = ZONE_STATE.active_hunters.get(target_id)
-        if not target_session:
+        if target_id not in ZONE_STATE.roster:
             return await interaction.response.send_message("They left.", ephemeral=True)
 
-        target_user = target_session["user"]
+        target_session = ZONE_STATE.active_hunters.get(target_id)
+        if target_session:
+            target_user = target_session["user"]
+        else:
+            target_user = self.bot.get_user(target_id) or await self.bot.fetch_user(
+                target_id
+            )
         cog = self.bot.get_cog("Loadout")
         embed = cog.generate_kit_embed(target_id, target_user.display_name)
 
@@ -8,6 +8,7 @@ import math
 import random
 from datetime import datetime, timedelta
 import mo_co.pedia as pedia
+from mo_co.leaderboard import LEADERBOARD
 
 
 class Elite(commands.Cog):
@@ -592,13 +593,10 @@ class ClaimEliteProjectBtn(Button):
         xp = pdata.get("reward_xp", 0)
         tokens = pdata.get("reward_tokens", 0)
 
-        database.update_user_stats(
+        database.increment_user_fields(
             self.view.user_id,
-            {
-                "project_progress": json.dumps(prog),
-                "elite_xp": u.get("elite_xp", 0) + xp,
-                "elite_tokens": u.get("elite_tokens", 0) + tokens,
-            },
+            {"elite_xp": xp, "elite_tokens": tokens},
+            assign={"project_progress": json.dumps(prog)},
         )
 
         self.view.refresh_projects()
@@ -942,15 +940,11 @@ class EliteShopView(View):
                 )
                 return
 
-            u = dict(database.get_user_data(self.user_id))
-            if u.get("elite_tokens", 0) < cost:
+            if not database.spend_user_fields(self.user_id, {"elite_tokens": cost}):
                 return await i.response.send_message(
                     "Not enough tokens!", ephemeral=True
                 )
-
-            database.update_user_stats(
-                self.user_id, {"elite_tokens": u["elite_tokens"] - cost}
-            )
+            u = dict(database.get_user_data(self.user_id))
             msg = ""
 
             if item["type"] == "rotating":
@@ -998,13 +992,12 @@ class EliteShopView(View):
                     )
                     msg = f"✅ Acquired **{item['name']}**!"
             elif item["type"] == "consumable_xp":
-                database.update_user_stats(
-                    self.user.id,
-                    {"daily_xp_boosted": u["daily_xp_boosted"] + 10000},
+                database.increment_user_fields(
+                    self.user.id, {"daily_xp_boosted": 10000}
                 )
                 msg = "✅ **XP Booster Activated!**"
             elif item["type"] == "consumable_gold":
-                database.update_user_stats(self.user.id, {"mo_gold": u["mo_gold"] + 10})
+                database.increment_user_fields(self.user.id, {"mo_gold": 10})
                 msg = "✅ **Acquired 10 mo.gold!**"
             elif item["type"] == "title":
                 t = json.loads(u.get("owned_titles", "[]"))
@@ -1052,18 +1045,12 @@ class BulkBuyModal(Modal):
                 "Invalid quantity.", ephemeral=True
             )
         total_cost = qty * self.unit_price
-        u = dict(database.get_user_data(self.user.id))
-        if u.get("elite_tokens", 0) < total_cost:
+        if not database.spend_user_fields(
+            self.user_id, {"elite_tokens": total_cost}, gains={self.db_col: qty}
+        ):
             return await interaction.response.send_message(
                 f"Not enough tokens! Need {total_cost}.", ephemeral=True
             )
-        database.update_user_stats(
-            self.user_id,
-            {
-                "elite_tokens": u["elite_tokens"] - total_cost,
-                self.db_col: u[self.db_col] + qty,
-            },
-        )
         await interaction.response.send_message(
             f"✅ Purchased **{qty}x {self.name}** for {total_cost} Tokens!",
             ephemeral=True,
@@ -1118,16 +1105,12 @@ class EnhancerSelect(Select):
         super().__init__(placeholder="Choose item to enhance...", options=options)
 
     async def callback(self, i):
-        u = dict(database.get_user_data(i.user.id))
-        if u.get("elite_tokens", 0) < self.cost:
-            return await i.response.send_message("Not enough tokens!", ephemeral=True)
         inst_id = int(self.values[0])
         item = database.get_item_instance(inst_id)
         if not item:
             return
-        database.update_user_stats(
-            i.user.id, {"elite_tokens": u["elite_tokens"] - self.cost}
-        )
+        if not database.spend_user_fields(i.user.id, {"elite_tokens": self.cost}):
+            return await i.response.send_message("Not enough tokens!", ephemeral=True)
         mods = config.HUNT_MODS
         weights = config.HUNT_WEIGHTS
         new_mod = random.choices(mods, weights=weights, k=1)[0]
@@ -1137,6 +1120,7 @@ class EnhancerSelect(Select):
                 (new_mod, inst_id),
             )
             conn.commit()
+        database.invalidate_instance(inst_id)
         d = game_data.get_item(item["item_id"])
         await i.response.edit_message(
             content=f"✨ **Enhanced!**\n**{d['name']}** is now **[{new_mod}]**!",
@@ -1153,10 +1137,7 @@ class EliteLeaderboardView(View):
         self._load_data()
 
     def _load_data(self):
-        with database.get_connection() as conn:
-            self.data = conn.execute(
-                "SELECT user_id, elite_tokens, elite_xp, xp FROM users WHERE is_elite = 1 ORDER BY elite_tokens DESC LIMIT 10"
-            ).fetchall()
+        self.data = LEADERBOARD.ranked("Elite", limit=10)
 
     async def resolve_visible_names(self):
         self.names = {}
@@ -4,11 +4,15 @@ import random
 import asyncio
 import time
 from datetime import datetime, timedelta
-from mo_co import database, config, game_data, utils
+from mo_co import database, config, game_data, utils, async_db
 from mo_co.game_data import scaling
 from mo_co.combat_engine import CombatEngine, CombatEntity
 
 
+EVENT_CHANCE = 0.02
+EVENT_COOLDOWN = timedelta(minutes=15)
+
+
 class EventClaimView(discord.ui.View):
     def __init__(self, bot, channel_id, event_type, reward_data):
         super().__init__(timeout=300)
@@ -58,17 +62,15 @@ class EventClaimView(discord.ui.View):
         if self.event_type == "core":
             mn, mx = self.reward_data.get("min", 1), self.reward_data.get("max", 1)
             amount = random.randint(mn, mx)
-            database.update_user_stats(
-                interaction.user.id,
-                {"chaos_cores": u_data["chaos_cores"] + amount},
+            database.increment_user_fields(
+                interaction.user.id, {"chaos_cores": amount}
             )
             msg = f"{config.CHAOS_CORE_EMOJI} **You absorbed {amount} Chaos Core{'s' if amount > 1 else ''}!**"
 
         elif self.event_type == "crate":
             amount = self.reward_data.get("amount", 10)
-            database.update_user_stats(
-                interaction.user.id,
-                {"merch_tokens": u_data["merch_tokens"] + amount},
+            database.increment_user_fields(
+                interaction.user.id, {"merch_tokens": amount}
             )
             msg = f"{config.MERCH_TOKEN_EMOJI} **You found {amount} Merch Tokens!**"
 
@@ -423,14 +425,15 @@ class InvasionEventView(discord.ui.View):
 
         self.claimed_users.add(uid)
 
-        u_data = database.get_user_data(uid)
-        updates = {
-            "xp": u_data["xp"] + xp,
-            "mo_gold": u_data["mo_gold"] + gold,
-            "chaos_cores": u_data["chaos_cores"] + cores,
-            "chaos_shards": u_data["chaos_shards"] + shards,
-        }
-        database.update_user_stats(uid, updates)
+        database.increment_user_fields(
+            uid,
+            {
+                "xp": xp,
+                "mo_gold": gold,
+                "chaos_cores": cores,
+                "chaos_shards": shards,
+            },
+        )
 
         embed = discord.Embed(title="📦 Hunt Summary", color=0xF1C40F)
         embed.set_thumbnail(url=interaction.user.display_avatar.url)
@@ -486,12 +489,12 @@ class InvasionEventView(discord.ui.View):
 class ChaosEvents(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.bot.active_elites = []
-        self.bot.active_world_events = {}
         self.last_event_spawn = {}
+        self.luck_cache = {}
         self.bot.active_core_channels = set()
-        self.elite_rotation_loop.start()
-        self.world_event_loop.start()
+        if config.PRIMARY_SHARD:
+            self.elite_rotation_loop.start()
+            self.world_event_loop.start()
 
     def cog_unload(self):
         self.elite_rotation_loop.cancel()
@@ -503,21 +506,27 @@ class ChaosEvents(commands.Cog):
             return
         await self.maybe_spawn_event(message.channel, message.author.id)
 
+    def _can_spawn(self, channel_id, now):
+        if channel_id in self.bot.active_core_channels:
+            return False
+        last = self.last_event_spawn.get(channel_id)
+        return not (last and now - last < EVENT_COOLDOWN)
+
     async def maybe_spawn_event(self, channel, user_id):
         now = datetime.utcnow()
-        if channel.id in self.bot.active_core_channels:
-            return
-        last = self.last_event_spawn.get(channel.id)
-        if last and now - last < timedelta(minutes=15):
+        if not self._can_spawn(channel.id, now):
             return
 
-        base_chance = 0.02
-        passives = utils.get_active_passives(user_id)
-        if "bunch_of_dice" in passives:
-            luck = scaling.get_passive_value("bunch_of_dice", passives["bunch_of_dice"])
-            base_chance *= 1.0 + (luck / 100.0)
-
-        if random.random() > base_chance:
+        # Dice luck only raises the chance, so almost every message is turned
+        # away against the best possible luck before the author's kit is read.
+        roll = random.random()
+        max_luck = scaling.get_passive_value("bunch_of_dice", 50)
+        if roll > EVENT_CHANCE * (1.0 + max_luck / 100.0):
+            return
+        luck = await self._dice_luck(user_id)
+        if roll > EVENT_CHANCE * (1.0 + luck / 100.0):
+            return
+        if not self._can_spawn(channel.id, now):
             return
 
         self.last_event_spawn[channel.id] = now
@@ -531,6 +540,22 @@ class ChaosEvents(commands.Cog):
         else:
             await self.spawn_chaos_core(channel)
 
+    async def _dice_luck(self, user_id):
+        """Bunch of Dice luck for user_id, cached for EVENT_LUCK_TTL seconds."""
+        now = time.monotonic()
+        cached = self.luck_cache.pop(user_id, None)
+        if cached and cached[0] > now:
+            self.luck_cache[user_id] = cached
+            return cached[1]
+        passives = await async_db.call_read(utils.get_active_passives, user_id)
+        luck = 0.0
+        if "bunch_of_dice" in passives:
+            luck = scaling.get_passive_value("bunch_of_dice", passives["bunch_of_dice"])
+        if len(self.luck_cache) >= config.EVENT_LUCK_CACHE_SIZE:
+            self.luck_cache.pop(next(iter(self.luck_cache)))
+        self.luck_cache[user_id] = (now + config.EVENT_LUCK_TTL, luck)
+        return luck
+
     def get_active_user_count(self):
         try:
             with database.get_connection() as conn:
@@ -624,8 +649,8 @@ class ChaosEvents(commands.Cog):
 
     @tasks.loop(minutes=10)
     async def world_event_loop(self):
-        self.bot.active_world_events = {}
         if random.random() < 0.30:
+            self.bot.active_world_events = {}
             return
         pool = [
             w["id"]
@@ -633,10 +658,10 @@ class ChaosEvents(commands.Cog):
             if w["id"] not in ["downtown_chaos", "chaos_invasion"]
         ]
         selected = random.sample(pool, max(1, int(len(pool) * 0.33)))
-        for wid in selected:
-            self.bot.active_world_events[wid] = random.choice(
-                ["double_xp", "overcharged", "chaos"]
-            )
+        self.bot.active_world_events = {
+            wid: random.choice(["double_xp", "overcharged", "chaos"])
+            for wid in selected
+        }
 
     @world_event_loop.before_loop
     async def before_world_events(self):
@@ -6,14 +6,15 @@ import json
 import asyncio
 import time
 from datetime import datetime, timedelta
-from mo_co import config, database, game_data, utils
+from mo_co import config, database, game_data, utils, async_db
+from mo_co.write_buffer import WRITE_BUFFER
 from mo_co.combat_engine import CombatEngine, CombatEntity
 from mo_co.game_data import scaling
 from mo_co.game_data.missions import MISSIONS
 from mo_co.mission_engine import MissionEngine
 from mo_co.cogs.missions import PhoneDashboardView
 import typing
-from mo_co import pedia
+from mo_co import pedia, progression
 from mo_co.world_engine import WORLD_MGR, NPC_CONFIG
 from mo_co.game_data.projects import PROJECTS
 
@@ -52,7 +53,7 @@ def _is_relevant(target_type, target, world_id, world_type, mob_pool):
 class Hunting(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        if not self.npc_loop.is_running():
+        if config.PRIMARY_SHARD and not self.npc_loop.is_running():
             self.npc_loop.start()
 
     def cog_unload(self):
@@ -131,203 +132,65 @@ class Hunting(commands.Cog):
         completed_missions = m_state.get("completed", [])
         active_missions = m_state.get("active", [])
 
-        save_needed = False
-        triggered_missions = set()
+        event = progression.HuntEvent(
+            monster_id,
+            world_id,
+            modifier,
+            rift_time=rift_time,
+            damage_sources=damage_sources,
+            heal_sources=heal_sources,
+            loot_xp=loot_xp,
+            npc_ally=npc_ally,
+            is_shared_boss=is_shared_boss,
+        )
+        updates = {}
 
         jobs_unlocked = "chaos" in completed_missions or "chaos" in active_missions
         if jobs_unlocked:
             jobs = json.loads(u_data["active_jobs"] or "[]")
-            jobs_changed = False
-            for job in jobs:
-                if job.get("completed", False):
-                    continue
-                if "claimed" not in job:
-                    job["claimed"] = False
-                inc = False
-                t_type = job["target_type"]
-                target = job["target"]
-                if t_type == "hunt_any":
-                    inc = True
-                elif t_type == "hunt_world" and target == world_id:
-                    inc = True
-                elif t_type == "hunt_mob" and monster_id and target == monster_id:
-                    inc = True
-                elif t_type == "hunt_type":
-                    if target == "Overcharged" and (
-                        "Overcharged" in modifier or "Megacharged" in modifier
-                    ):
-                        inc = True
-                    elif (
-                        target == "Boss"
-                        and monster_id
-                        and (
-                            "boss" in str(monster_id).lower()
-                            or str(monster_id).startswith("chaos_")
-                            or monster_id in ["Draymor", "Overlord", "Big Papa"]
-                        )
-                    ):
-                        inc = True
-                if inc:
-                    job["progress"] += 1
-                    jobs_changed = True
-                    if job["progress"] >= job["count"]:
-                        job["completed"] = True
-            if jobs_changed:
-                database.update_user_stats(user_id, {"active_jobs": json.dumps(jobs)})
+            if progression.advance_jobs(jobs, event):
+                updates["active_jobs"] = json.dumps(jobs)
 
         projects_unlocked = (
             "paidovertime" in completed_missions or "paidovertime" in active_missions
         )
-        is_elite_user = bool(u_dict.get("is_elite"))
         if projects_unlocked:
             try:
-                proj_data = json.loads(u_data.get("project_progress", "{}"))
-                proj_changed = False
-                w_def = game_data.get_world(world_id)
-                w_type = w_def.get("type") if w_def else "unknown"
-                for pid, p_def in PROJECTS.items():
-                    if p_def.get("is_elite") and not is_elite_user:
-                        continue
-                    entry = proj_data.get(pid, {"prog": 0, "claimed": False})
-                    if isinstance(entry, int):
-                        entry = {"prog": entry, "claimed": False}
-                    if entry.get("claimed", False):
-                        continue
-
-                    tt = p_def["target_type"]
-                    tgt = p_def["target"]
-                    inc_amt = 0
-                    if tt == "hunt_any":
-                        inc_amt = 1
-                    elif tt == "hunt_world" and tgt == world_id:
-                        inc_amt = 1
-                    elif tt == "hunt_world_type" and tgt == w_type:
-                        inc_amt = 1
-                    elif tt == "hunt_mob" and tgt == monster_id:
-                        inc_amt = 1
-                    elif tt == "hunt_type":
-                        if tgt == "Chaos" and "Chaos" in modifier:
-                            inc_amt = 1
-                        elif tgt == "Overcharged" and (
-                            "Overcharged" in modifier or "Megacharged" in modifier
-                        ):
-                            inc_amt = 1
-                        elif tgt == "Boss" and (
-                            "boss" in str(monster_id).lower()
-                            or str(monster_id).startswith("chaos_")
-                        ):
-                            inc_amt = 1
-                    elif tt == "loot_xp":
-                        inc_amt = loot_xp
-                    elif (
-                        tt == "deal_damage_with"
-                        and damage_sources
-                        and tgt in damage_sources
-                    ):
-                        inc_amt = damage_sources[tgt]
-                    elif tt == "heal_with" and heal_sources and tgt in heal_sources:
-                        inc_amt = heal_sources[tgt]
-                    elif tt == "hunt_shared_boss" and is_shared_boss:
-                        inc_amt = 1
-                    elif tt == "fight_with_npc" and npc_ally and tgt == npc_ally:
-                        inc_amt = 1
-
-                    if inc_amt > 0:
-                        entry["prog"] += inc_amt
-                        proj_data[pid] = entry
-                        proj_changed = True
-                if proj_changed:
-                    database.update_user_stats(
-                        user_id, {"project_progress": json.dumps(proj_data)}
-                    )
+                proj_data = json.loads(u_dict.get("project_progress") or "{}")
+                if progression.advance_projects(
+                    proj_data, event, bool(u_dict.get("is_elite"))
+                ):
+                    updates["project_progress"] = json.dumps(proj_data)
             except:
                 pass
 
+        triggered_missions = set()
         try:
-            targets = m_state.get("active", [])
-            for m_id in targets:
-                mission_def = MISSIONS.get(m_id)
-                if not mission_def:
-                    continue
-                m_data = m_state["states"].get(m_id)
-                if not m_data:
-                    continue
-                step = mission_def["steps"][m_data["step"]]
-                inc_mission = False
-
-                if step["type"] == "objective_hunt":
-                    if step["target"] == "any":
-                        if not step.get("world_id") or step["world_id"] == world_id:
-                            inc_mission = True
-                    elif step["target"] == monster_id:
-                        if not step.get("world_id") or step["world_id"] == world_id:
-                            inc_mission = True
-
-                elif step["type"] == "objective_rift_boss":
-                    if rift_time is not None and step["target"] == monster_id:
-                        inc_mission = True
-
-                if inc_mission:
-                    if m_data["prog"] < step["count"]:
-                        m_data["prog"] += 1
-                        save_needed = True
-                        triggered_missions.add(m_id)
-
-                elif step["type"] == "objective_checklist":
-                    if isinstance(m_data.get("prog"), int):
-                        m_data["prog"] = [0] * len(step["targets"])
-                        save_needed = True
-
-                    for idx, target_def in enumerate(step["targets"]):
-                        t_id = target_def["id"]
-                        req = target_def["count"]
-                        t_world = target_def.get("world_id")
-                        if t_world and t_world != world_id:
-                            continue
+            missions_changed, triggered_missions = progression.advance_missions(
+                m_state, event
+            )
+            if missions_changed:
+                updates["mission_state"] = json.dumps(m_state)
+        except Exception as e:
+            print(f"Mission Update Error: {e}")
 
-                        if idx < len(m_data["prog"]) and m_data["prog"][idx] < req:
-                            match = False
-                            if t_id == "Boss" and (
-                                "boss" in str(monster_id).lower()
-                                or str(monster_id).startswith("chaos_")
-                                or str(monster_id)
-                                in [
-                                    "Draymor",
-                                    "Overlord",
-                                    "Big Papa",
-                                    "Berserker",
-                                ]
-                            ):
-                                match = True
-                            elif t_id == monster_id:
-                                match = True
-                            elif t_id == "any":
-                                match = True
-
-                            if match:
-                                m_data["prog"][idx] += 1
-                                save_needed = True
-                                triggered_missions.add(m_id)
-
-            if save_needed:
-                database.update_user_stats(
-                    user_id, {"mission_state": json.dumps(m_state)}
+        if updates:
+            database.update_user_stats(user_id, updates)
+
+        thread_id = u_dict.get("mission_thread_id")
+        if thread_id and "mission_state" in updates:
+            for mid in triggered_missions:
+                engine = MissionEngine(
+                    self.bot,
+                    user_id,
+                    thread_id,
+                    specific_mission_id=mid,
                 )
+                asyncio.run_coroutine_threadsafe(
+                    engine.update_live_message(mid), self.bot.loop
+                )
+                asyncio.run_coroutine_threadsafe(engine.progress(), self.bot.loop)
 
-                thread_id = u_dict.get("mission_thread_id")
-                if thread_id:
-                    for mid in triggered_missions:
-                        engine = MissionEngine(
-                            self.bot,
-                            user_id,
-                            thread_id,
-                            specific_mission_id=mid,
-                        )
-                        asyncio.create_task(engine.update_live_message(mid))
-                        asyncio.create_task(engine.progress())
-
-        except Exception as e:
-            print(f"Mission Update Error: {e}")
         return 0, []
 
     async def check_new_player_redirect(self, interaction):
@@ -458,7 +321,7 @@ class Hunting(commands.Cog):
             if user_id:
                 pedia.track_crate(user_id, world_id)
             return "mo.co Crate", unlock_lvl, False
-        pool = game_data.get_monsters_for_world(world_id, world_type)
+        pool = game_data.get_monster_pool(world_id, world_type)
 
         if mission_state_dict:
             try:
@@ -491,20 +354,12 @@ class Hunting(commands.Cog):
             except:
                 pass
 
-        bosses = [
-            m
-            for m in pool
-            if "boss" in m
-            or "Guardian" in m
-            or m in ["Overlord", "Bug Lord", "Smasher", "Big Papa", "Draymor"]
-        ]
-        mobs = [m for m in pool if m not in bosses]
-        if not mobs and not bosses:
+        if not pool.population:
             return "Minion", unlock_lvl, False
-        boss_weight = 1 + (active_players * 2)
-        weights = [10] * len(mobs) + [boss_weight] * len(bosses)
-        monster_id = random.choices(mobs + bosses, weights=weights, k=1)[0]
-        is_boss = (monster_id in bosses) or (monster_id.startswith("chaos_"))
+        monster_id = random.choices(
+            pool.population, cum_weights=pool.cum_weights(active_players), k=1
+        )[0]
+        is_boss = monster_id in pool.elevated
         lvl = unlock_lvl + (12 if is_boss else 6)
         return monster_id, lvl, is_boss
 
@@ -724,11 +579,14 @@ class HuntSessionView(discord.ui.View):
             user.display_name,
             self.context["level"],
             self.emblem,
-            self.context["kit"],
         )
 
     async def on_timeout(self):
         WORLD_MGR.check_out(self.world["id"], self.user_id)
+        try:
+            await WRITE_BUFFER.flush_async(self.user_id)
+        except Exception as e:
+            print(f"Hunt flush failed: {e}")
         for item in self.children:
             item.disabled = True
         try:
@@ -778,19 +636,18 @@ class HuntSessionView(discord.ui.View):
             False,
         )
 
-        self.update_action_button()
-
         try:
             await interaction.message.edit(embed=self.create_embed(), view=self)
         except:
             pass
 
     async def save_hp_background(self, hp):
-        database.update_user_stats(self.user_id, {"current_hp": hp})
+        WRITE_BUFFER.record(self.user_id, assign={"current_hp": hp})
 
-    def update_action_button(self):
+    def update_action_button(self, world=None):
         ws = WORLD_MGR.get_world(self.world["id"])
-        ws.check_boss_timeout()
+        world = world or ws.snapshot()
+        boss = None if ws.check_boss_timeout(world) else world["boss"]
 
         button = None
         for child in self.children:
@@ -813,7 +670,7 @@ class HuntSessionView(discord.ui.View):
             button.style = discord.ButtonStyle.secondary
             return
 
-        if ws.boss and self.selected_target == "boss":
+        if boss and self.selected_target == "boss":
             button.label = "Attack Threat"
             button.style = discord.ButtonStyle.danger
             button.emoji = utils.safe_emoji(config.CHAOS_ALERT)
@@ -880,10 +737,12 @@ class HuntSessionView(discord.ui.View):
             )
 
         ws = WORLD_MGR.get_world(self.world["id"])
-        boss_despawned = ws.check_boss_timeout()
+        world = ws.snapshot()
+        boss_despawned = ws.check_boss_timeout(world)
         if boss_despawned:
             self.last_activity = "💨 **The Shared Boss has fled!**"
             self.selected_target = "standard"
+            world = dict(world, boss=None)
 
         raw_ms = u_dict.get("mission_state")
         m_state = json.loads(raw_ms) if raw_ms else {}
@@ -921,7 +780,7 @@ class HuntSessionView(discord.ui.View):
                 ]:
                     continue
 
-                mob_pool = game_data.get_monsters_for_world(
+                mob_pool = game_data.get_monster_pool(
                     self.world["id"], self.world["type"]
                 )
                 if stype == "objective_hunt":
@@ -951,7 +810,7 @@ class HuntSessionView(discord.ui.View):
                         f"{config.MISSION_EMOJI} **{desc}** ({prog}/{limit})"
                     )
 
-        mob_pool = game_data.get_monsters_for_world(
+        mob_pool = game_data.get_monster_pool(
             self.world["id"], self.world["type"]
         )
         jobs_unlocked = "chaos" in completed_ms or "chaos" in active_ms
@@ -1016,7 +875,7 @@ class HuntSessionView(discord.ui.View):
             f"{self.emblem} **{self.user.display_name}** (Lvl {player_lvl})"
         ]
 
-        nearby = ws.get_nearby_allies(exlcude_id=self.user_id, count=3)
+        nearby = ws.get_nearby_allies(exlcude_id=self.user_id, count=3, world=world)
 
         for h in nearby:
             if h["type"] == "player":
@@ -1042,18 +901,19 @@ class HuntSessionView(discord.ui.View):
         if existing_select:
             self.remove_item(existing_select)
 
-        if ws.boss and ws.boss["hp"] > 0:
-            boss_pct = int((ws.boss["hp"] / ws.boss["max_hp"]) * 10)
+        boss = world["boss"]
+        if boss and boss["hp"] > 0:
+            boss_pct = int((boss["hp"] / boss["max_hp"]) * 10)
             boss_bar = "🟥" * boss_pct + "⬛" * (10 - boss_pct)
-            timer_str = f"Ends <t:{ws.boss['expiry']}:R>"
+            timer_str = f"Ends <t:{boss['expiry']}:R>"
             embed.add_field(
-                name=f"⚠️ {config.CHAOS_ALERT} {ws.boss['name'].upper()} DETECTED",
-                value=f"`{boss_bar}` {ws.boss['hp']:,}/{ws.boss['max_hp']:,}\n⏱️ {timer_str}",
+                name=f"⚠️ {config.CHAOS_ALERT} {boss['name'].upper()} DETECTED",
+                value=f"`{boss_bar}` {boss['hp']:,}/{boss['max_hp']:,}\n⏱️ {timer_str}",
                 inline=False,
             )
             self.add_item(TargetSelect(self.selected_target))
 
-        self.update_action_button()
+        self.update_action_button(world)
 
         if self.last_activity:
             embed.description = (embed.description or "") + f"### {self.last_activity}"
@@ -1134,29 +994,26 @@ class HuntSessionView(discord.ui.View):
             else 0
         )
 
-        WORLD_MGR.check_in(
+        world = WORLD_MGR.check_in(
             self.world["id"],
             self.user_id,
             self.user.display_name,
             lvl,
             self.emblem,
-            kit_data,
         )
 
-        npc_status = ws.tick_npc()
-        if npc_status == "DEPARTED" and ws.npc:
+        npc_status, npc = ws.tick_npc(world=world)
+        if npc_status:
+            world = dict(world, npc=None)
+        if npc_status == "DEPARTED":
 
             self.context["user_data"]["chaos_cores"] += 2
             asyncio.create_task(self.background_save_loot(cores=2))
 
             self.session_cores += 2
-            self.full_logs.append(f"🎁 **{ws.npc['name']}** left a gift! (+2 Cores)")
-            ws.npc = None
+            self.full_logs.append(f"🎁 **{npc['name']}** left a gift! (+2 Cores)")
         elif npc_status == "DIED":
-            self.full_logs.append(
-                f"💀 **{ws.npc['name']}** retreated! (Mission Failed)"
-            )
-            ws.npc = None
+            self.full_logs.append(f"💀 **{npc['name']}** retreated! (Mission Failed)")
 
         if self.respawn_ts:
             if datetime.now() < self.respawn_ts:
@@ -1184,7 +1041,8 @@ class HuntSessionView(discord.ui.View):
         )
         rgp = config.WORLD_RGP.get(self.world["id"], 50)
 
-        if ws.boss and ws.boss["hp"] > 0 and self.selected_target == "boss":
+        boss = world["boss"]
+        if boss and boss["hp"] > 0 and self.selected_target == "boss":
 
             engine = CombatEngine(self.bot, gamemode="hunt", mode="sim")
             player = CombatEntity(engine, self.user.display_name, is_player=True)
@@ -1202,21 +1060,21 @@ class HuntSessionView(discord.ui.View):
             )
             engine.add_entity(player, "A")
 
-            boss_lvl = ws.boss.get("level", player_lvl + 10)
+            boss_lvl = boss.get("level", player_lvl + 10)
             boss_entity = CombatEntity(
                 engine,
-                ws.boss["name"],
+                boss["name"],
                 is_player=False,
-                source_id=ws.boss["name"],
+                source_id=boss["name"],
             )
-            boss_entity.setup_stats(boss_lvl, hp=ws.boss["hp"])
+            boss_entity.setup_stats(boss_lvl, hp=boss["hp"])
 
-            if "Overcharged" in ws.boss["name"]:
+            if "Overcharged" in boss["name"]:
                 boss_entity.icon = config.OVERCHARGED_ICON
-            elif "Megacharged" in ws.boss["name"] or "Chaos" in ws.boss["name"]:
+            elif "Megacharged" in boss["name"] or "Chaos" in boss["name"]:
                 boss_entity.icon = config.CHAOS_ALERT
             else:
-                boss_entity.icon = config.MOBS.get(ws.boss["name"], "👹")
+                boss_entity.icon = config.MOBS.get(boss["name"], "👹")
 
             boss_entity.attack_pwr = int(boss_lvl * 15 * 1.5)
             engine.add_entity(boss_entity, "B")
@@ -1238,13 +1096,13 @@ class HuntSessionView(discord.ui.View):
             asyncio.create_task(self.save_hp_background(new_hp))
 
             self.last_activity = (
-                f"💥 **Skirmish with {ws.boss['name']}!** (-{dmg_dealt:,} Boss HP)"
+                f"💥 **Skirmish with {boss['name']}!** (-{dmg_dealt:,} Boss HP)"
             )
             self.full_logs = engine.logs + [self.last_activity]
 
             asyncio.create_task(
                 self.background_progression_update(
-                    monster_id=ws.boss["name"],
+                    monster_id=boss["name"],
                     modifier="Shared",
                     monster_type="Boss",
                     damage_sources=player.damage_sources,
@@ -1256,9 +1114,8 @@ class HuntSessionView(discord.ui.View):
             if is_dead:
 
                 self.full_logs.append(
-                    f"🏆 **{ws.boss['name']} DEFEATED!** Participation loot granted."
+                    f"🏆 **{boss['name']} DEFEATED!** Participation loot granted."
                 )
-                ws.boss = None
             else:
                 xp_gain = 500
                 self.session_xp += xp_gain
@@ -1277,7 +1134,7 @@ class HuntSessionView(discord.ui.View):
                         discord.ButtonStyle.secondary,
                     )
                     self.full_logs = engine.logs + [
-                        f"💀 **{ws.boss['name'] if ws.boss else 'Boss'}** defeated you!",
+                        f"💀 **{boss['name']}** defeated you!",
                         self.last_activity,
                     ]
                     asyncio.create_task(self.handle_respawn(interaction))
@@ -1296,7 +1153,7 @@ class HuntSessionView(discord.ui.View):
             )
 
         cog = self.bot.get_cog("Hunting")
-        active_count = len(ws.hunters) + len(ws.ghosts) + len(ws.bots)
+        active_count = ws.population(world)
 
         try:
             m_state = json.loads(u_dict["mission_state"])
@@ -1327,7 +1184,7 @@ class HuntSessionView(discord.ui.View):
         m_icon = f"{mod_icons} {base_icon}".strip()
 
         if (
-            ws.boss is None
+            world["boss"] is None
             and self.world["unlock_lvl"] >= 12
             and random.random() < (0.05 + active_count * 0.02)
         ):
@@ -1352,7 +1209,6 @@ class HuntSessionView(discord.ui.View):
                     f"⚠️ **{modifier} {clean_name.upper()} SPAWNED!**",
                     False,
                 )
-                self.update_action_button()
                 return await interaction.followup.edit_message(
                     message_id=interaction.message.id,
                     embed=self.create_embed(),
@@ -1397,7 +1253,7 @@ class HuntSessionView(discord.ui.View):
 
         engine.add_entity(player, "A")
 
-        allies = ws.get_nearby_allies(exlcude_id=self.user_id)
+        allies = ws.get_nearby_allies(exlcude_id=self.user_id, world=world)
         npc_ally_name = None
         for ally in allies:
             if ally["type"] in ["player", "ghost", "bot"]:
@@ -1430,35 +1286,15 @@ class HuntSessionView(discord.ui.View):
         mob.icon = m_icon
         starting_hp = int(self.local_hp)
 
-        combat_atk_mult, combat_hp_mult = 1.0, 1.0
         mob.apply_modifier(modifier)
 
-        if "Megacharged" in modifier or "Chaos" in modifier:
-            if "Megacharged" in modifier:
-                combat_atk_mult, combat_hp_mult = 2.5, 1.8
-            else:
-                combat_atk_mult = 1.2
-        elif "Overcharged" in modifier:
-            combat_atk_mult, combat_hp_mult = 1.5, 1.3
-
-        gp_deficit, atk_mult = rgp - player_gp, combat_atk_mult
-        if gp_deficit > 0:
-            atk_mult *= 1.0 + (gp_deficit / rgp) * 4
-            if player_lvl >= 5:
-                player.attack_pwr = int(player.attack_pwr * (rgp / (rgp + gp_deficit)))
-        else:
-            atk_mult *= max(0.5, 1.0 - (abs(gp_deficit) / (rgp * 2.0)))
-
-        m_hp = int(
-            (1200 + (xp_lvl * 150) + (xp_lvl**2) * 4)
-            * combat_hp_mult
-            * (1.0 + len(allies) * 0.3)
+        m_hp, m_atk, player_atk_scale = scaling.get_hunt_monster_stats(
+            xp_lvl, modifier, is_boss, player_gp, rgp, allies=len(allies)
         )
-        if is_boss:
-            m_hp *= 2.5
-            atk_mult *= 1.5
+        if player_atk_scale < 1.0 and player_lvl >= 5:
+            player.attack_pwr = int(player.attack_pwr * player_atk_scale)
         mob.setup_stats(xp_lvl, hp=m_hp)
-        mob.attack_pwr = int(xp_lvl * 8 * atk_mult)
+        mob.attack_pwr = m_atk
         engine.add_entity(mob, "B")
         engine.simulate_battle()
 
@@ -1632,35 +1468,22 @@ class HuntSessionView(discord.ui.View):
     async def background_save_loot(
         self, xp=0, shards=0, cores=0, tokens=0, hp=None, bank_c=0, fuel_c=0
     ):
-
-        updates = {}
-        if xp:
-            utils.add_user_xp(self.user_id, xp)
-
-        u_data = database.get_user_data(self.user_id)
-
-        if shards:
-            updates["chaos_shards"] = u_data["chaos_shards"] + shards
-        if cores:
-            updates["chaos_cores"] = u_data["chaos_cores"] + cores
-        if tokens:
-            updates["merch_tokens"] = u_data["merch_tokens"] + tokens
-        if hp is not None:
-            updates["current_hp"] = hp
-        if bank_c:
-            updates["daily_xp_total"] = max(0, u_data["daily_xp_total"] - bank_c)
-        if fuel_c:
-            updates["daily_xp_boosted"] = max(0, u_data["daily_xp_boosted"] - fuel_c)
-
-        if updates:
-            database.update_user_stats(self.user_id, updates)
+        WRITE_BUFFER.record(
+            self.user_id,
+            xp=xp,
+            add={"chaos_shards": shards, "chaos_cores": cores, "merch_tokens": tokens},
+            drain={"daily_xp_total": bank_c, "daily_xp_boosted": fuel_c},
+            assign={"current_hp": hp} if hp is not None else None,
+        )
 
     async def background_pedia_track(self, world_id):
-        pedia.track_world_hunt(self.user_id, world_id)
+        await async_db.call_write(pedia.track_world_hunt, self.user_id, world_id)
 
     async def background_progression_update(self, *args, **kwargs):
         cog = self.bot.get_cog("Hunting")
-        cog.update_progression(self.user_id, *args, **kwargs)
+        await async_db.call_write(
+            cog.update_progression, self.user_id, *args, **kwargs
+        )
 
     @discord.ui.button(
         label="Return Home",
@@ -1685,7 +1508,8 @@ class HuntSessionView(discord.ui.View):
             max_hp = utils.get_max_hp(
                 self.user_id, player_lvl, self.context["kit"], self.context["inv_map"]
             )
-            asyncio.create_task(self.background_save_loot(hp=max_hp))
+            await self.background_save_loot(hp=max_hp)
+            await WRITE_BUFFER.flush_async(self.user_id)
 
             actual_shards = self.session_shards if player_lvl >= 12 else 0
             summary = HuntSummaryView(
@@ -1704,7 +1528,8 @@ class HuntSessionView(discord.ui.View):
                 embed=summary.get_embed(), view=summary
             )
         else:
-            asyncio.create_task(self.background_save_loot(hp=100))
+            await self.background_save_loot(hp=100)
+            await WRITE_BUFFER.flush_async(self.user_id)
             embed = discord.Embed(
                 title="💀 Hunt Failed",
                 description="You collapsed and were emergency teleported home.\n**All session loot was lost.**",
@@ -2062,7 +1887,7 @@ class HuntSummaryView(discord.ui.View):
             w_def = game_data.get_world(self.world_id)
             if w_def:
                 world_type = w_def["type"]
-                mob_pool = game_data.get_monsters_for_world(self.world_id, world_type)
+                mob_pool = game_data.get_monster_pool(self.world_id, world_type)
 
         for mid in active_ms:
             m_def = MISSIONS.get(mid)
@@ -2170,11 +1995,12 @@ class HuntSummaryView(discord.ui.View):
         return embed
 
     async def open_cores_callback(self, interaction):
+        if not database.spend_user_fields(self.user_id, {"chaos_cores": self.cores}):
+            return await interaction.response.send_message(
+                "Not enough Chaos Cores!", ephemeral=True
+            )
         self.claimed_cores = True
         u_data = database.get_user_data(self.user_id)
-        database.update_user_stats(
-            self.user_id, {"chaos_cores": u_data["chaos_cores"] - self.cores}
-        )
         await interaction.response.edit_message(
             embed=discord.Embed(
                 description=f"{config.CHAOS_CORE_EMOJI} Opening {self.cores} Cores...",
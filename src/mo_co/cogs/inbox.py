@@ -331,8 +331,7 @@ class ClaimButton(Button):
             "elite_tokens",
         ]:
             if key in rewards:
-                current = u_dict.get(key, 0)
-                updates[key] = current + rewards[key]
+                updates[key] = rewards[key]
                 log_lines.append(
                     f"**+{rewards[key]:,}** {key.replace('_', ' ').title()}"
                 )
@@ -342,13 +341,11 @@ class ClaimButton(Button):
             log_lines.append(f"**+{rewards['xp']:,}** XP")
 
         if "xp_fuel" in rewards:
-            updates["daily_xp_boosted"] = (
-                u_dict["daily_xp_boosted"] + rewards["xp_fuel"]
-            )
+            updates["daily_xp_boosted"] = rewards["xp_fuel"]
             log_lines.append(f"**+{rewards['xp_fuel']:,}** XP Fuel")
 
         if updates:
-            database.update_user_stats(self.view.user_id, updates)
+            database.increment_user_fields(self.view.user_id, updates)
 
         if "items" in rewards:
 
@@ -1003,7 +1003,6 @@ class ClaimTaskButton(Button):
     async def callback(self, interaction):
         if interaction.user.id != self.view.user_id:
             return
-        pdata = pedia._get_data(self.view.user_id)
         key = (
             "monsters"
             if self.dtype == "monster"
@@ -1013,15 +1012,9 @@ class ClaimTaskButton(Button):
                 else ("worlds" if self.dtype == "world" else "skins")
             )
         )
-        if self.target not in pdata[key]:
-            return
-        if self.task_id not in pdata[key][self.target]["cl"]:
-            pdata[key][self.target]["cl"].append(self.task_id)
-            pedia._save_data(self.view.user_id, pdata)
-            u = database.get_user_data(self.view.user_id)
-            database.update_user_stats(
-                self.view.user_id,
-                {"xp": u["xp"] + 2000, "merch_tokens": u["merch_tokens"] + 25},
+        if pedia.claim_task(self.view.user_id, key, self.target, self.task_id):
+            database.increment_user_fields(
+                self.view.user_id, {"xp": 2000, "merch_tokens": 25}
             )
             await interaction.response.send_message(
                 f"✅ Claimed! +2,000 XP & +25 Tokens", ephemeral=True
@@ -9,6 +9,7 @@ from mo_co.game_data import scaling
 import json
 import random
 import asyncio
+from collections import Counter
 from mo_co import pedia
 
 MODIFIER_DESCRIPTIONS = {
@@ -271,6 +272,16 @@ class Inventory(commands.Cog):
 
 
 class AdvancedInventoryView(View):
+    # Rows fetched per query; page flips inside a window need no database trip.
+    WINDOW = 25
+    MAX_WINDOWS = 8
+    SORT_KEYS = {
+        "Level (High > Low)": "level_desc",
+        "Level (Low > High)": "level_asc",
+        "Newest": "newest",
+        "Rarity": "rarity",
+    }
+
     def __init__(self, bot, user_id, context=None):
         super().__init__(timeout=300)
         self.bot = bot
@@ -281,17 +292,15 @@ class AdvancedInventoryView(View):
         self.search_query = None
         self.show_advanced = False
         self.items_per_page = 5
-        self.filtered_items = []
+        self.total_items = 0
+        self.total_gp = 0
+        self.windows = {}
 
         if context:
             self.u_data = context[0]
             self.kit_data = context[1]
-            self.inv_map = context[2]
-            self.raw_inv = list(self.inv_map.values())
         else:
             self.u_data = database.get_user_data(user_id)
-            self.raw_inv = database.get_user_inventory(user_id)
-
             self.kit_data = database.get_active_kit(user_id) or {}
 
         self.skin_map = {}
@@ -311,68 +320,65 @@ class AdvancedInventoryView(View):
         self.refresh_data()
         self.update_components()
 
+    def _query_args(self):
+        return {
+            "types": [
+                x.split("_", 1)[1]
+                for x in self.selected_filters
+                if x.startswith("type_")
+            ],
+            "modifiers": [
+                x.split("_", 1)[1]
+                for x in self.selected_filters
+                if x.startswith("mod_")
+            ],
+            "search": self.search_query,
+        }
+
     def refresh_data(self):
+        """Re-count for the current filters and drop the cached windows."""
+        self.total_items, self.total_gp = database.count_inventory(
+            self.user_id, **self._query_args()
+        )
+        self.windows = {}
+        if self.page >= self.max_pages():
+            self.page = 0
 
-        selected_types = [
-            x.split("_", 1)[1] for x in self.selected_filters if x.startswith("type_")
-        ]
-        selected_mods = [
-            x.split("_", 1)[1] for x in self.selected_filters if x.startswith("mod_")
-        ]
-        processed = []
-        for row in self.raw_inv:
-            d = game_data.get_item(row["item_id"])
-            if not d:
-                continue
-            processed.append(
+    def max_pages(self):
+        return max(1, (self.total_items - 1) // self.items_per_page + 1)
+
+    def page_items(self):
+        start = self.page * self.items_per_page
+        index = start // self.WINDOW
+        window = self.windows.get(index)
+        if window is None:
+            if len(self.windows) >= self.MAX_WINDOWS:
+                self.windows.pop(next(iter(self.windows)))
+            rows = database.query_inventory(
+                self.user_id,
+                sort=self.SORT_KEYS[self.sort_method],
+                limit=self.WINDOW,
+                offset=index * self.WINDOW,
+                **self._query_args(),
+            )
+            window = self.windows[index] = [
                 {
-                    "inst": row["instance_id"],
-                    "id": row["item_id"],
-                    "name": d["name"],
-                    "type": d["type"],
-                    "lvl": row["level"],
-                    "mod": row["modifier"],
-                    "rarity": d.get("rarity", "Common"),
-                    "gp": utils.get_item_gp(row["item_id"], row["level"]),
-                    "acquired": row["acquired_at"],
-                    "quote": d.get("quote", ""),
-                    "locked": row["locked"],
+                    "inst": r["instance_id"],
+                    "id": r["item_id"],
+                    "name": r["name"],
+                    "type": r["type"],
+                    "lvl": r["level"],
+                    "mod": r["modifier"],
+                    "rarity": r["rarity"],
+                    "gp": r["gp"],
+                    "locked": r["locked"],
                 }
-            )
-
-        filtered = []
-        for item in processed:
-            if selected_types and item["type"] not in selected_types:
-                continue
-            if selected_mods and not any(m in item["mod"] for m in selected_mods):
-                continue
-            if self.search_query:
-                q = self.search_query.lower()
-                if q not in item["name"].lower() and q not in item["mod"].lower():
-                    continue
-            filtered.append(item)
-
-        if self.sort_method == "Level (High > Low)":
-            filtered.sort(key=lambda x: (x["lvl"], x["gp"]), reverse=True)
-        elif self.sort_method == "Level (Low > High)":
-            filtered.sort(key=lambda x: (x["lvl"], x["gp"]))
-        elif self.sort_method == "Newest":
-            filtered.sort(key=lambda x: x["acquired"], reverse=True)
-        elif self.sort_method == "Rarity":
-            r_map = {"Legendary": 4, "Epic": 3, "Rare": 2, "Common": 1}
-            filtered.sort(key=lambda x: r_map.get(x["rarity"], 0), reverse=True)
-
-        self.filtered_items = filtered
-        max_pages = max(1, (len(self.filtered_items) - 1) // self.items_per_page + 1)
-        if self.page >= max_pages:
-            self.page = 0
+                for r in rows
+            ]
+        offset = start - index * self.WINDOW
+        return window[offset : offset + self.items_per_page]
 
     def get_embed(self):
-
-        total_gp = sum(
-            utils.get_item_gp(i["item_id"], i["level"]) for i in self.raw_inv
-        )
-
         u_dict = dict(self.u_data)
         level, _, _ = utils.get_level_info(u_dict["xp"])
         emblem = utils.get_emblem(level)
@@ -381,12 +387,10 @@ class AdvancedInventoryView(View):
             color=0x2C3E50,
         )
         embed.set_footer(
-            text=f"Items: {len(self.filtered_items)} | GP: {total_gp:,} | Gold: {u_dict['mo_gold']:,}"
+            text=f"Items: {self.total_items} | GP: {self.total_gp:,} | Gold: {u_dict['mo_gold']:,}"
         )
 
-        start = self.page * self.items_per_page
-        end = start + self.items_per_page
-        chunk = self.filtered_items[start:end]
+        chunk = self.page_items()
 
         if not chunk:
             embed.description = "*No items found matching criteria.*"
@@ -446,7 +450,7 @@ class AdvancedInventoryView(View):
         info.append(f"Sort: {self.sort_method}")
         embed.description = (
             " • ".join(info)
-            + f"\nPage {self.page + 1} / {max(1, (len(self.filtered_items)-1)//self.items_per_page + 1)}"
+            + f"\nPage {self.page + 1} / {self.max_pages()}"
         )
         return embed
 
@@ -459,7 +463,7 @@ class AdvancedInventoryView(View):
         if self.search_query or self.selected_filters:
             self.add_item(ResetButton())
 
-        max_pages = max(1, (len(self.filtered_items) - 1) // self.items_per_page + 1)
+        max_pages = self.max_pages()
         self.add_item(
             Button(
                 label="◀",
@@ -489,15 +493,7 @@ class AdvancedInventoryView(View):
 
         self.add_item(CosmeticsButton())
         self.add_item(FusionButton())
-        self.add_item(
-            InspectModeButton(
-                self.filtered_items[
-                    self.page
-                    * self.items_per_page : (self.page + 1)
-                    * self.items_per_page
-                ]
-            )
-        )
+        self.add_item(InspectModeButton(self.page_items()))
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.user_id:
@@ -841,26 +837,8 @@ class FusionSelectView(View):
         self.user_id = user_id
 
         inv = database.get_user_inventory(user_id)
-        kits = database.get_all_kits(user_id)
-        equipped_ids = set()
-        slots = [
-            "weapon_id",
-            "gadget_1_id",
-            "gadget_2_id",
-            "gadget_3_id",
-            "passive_1_id",
-            "passive_2_id",
-            "passive_3_id",
-            "elite_module_id",
-            "ring_1_id",
-            "ring_2_id",
-            "ring_3_id",
-            "ride_id",
-        ]
-        for kit in kits:
-            for s in slots:
-                if kit[s]:
-                    equipped_ids.add(kit[s])
+        equipped_ids = database.get_equipped_instance_ids(user_id)
+        copies = Counter(r["item_id"] for r in inv)
 
         eligible = []
         for r in inv:
@@ -868,7 +846,7 @@ class FusionSelectView(View):
             if d["type"] == "ride":
                 continue
             if not r["locked"] and r["instance_id"] not in equipped_ids:
-                is_duplicate = sum(1 for x in inv if x["item_id"] == r["item_id"]) > 1
+                is_duplicate = copies[r["item_id"]] > 1
                 eligible.append({"type": "gear", "data": r, "resonant": is_duplicate})
 
         u_data = database.get_user_data(user_id)
@@ -1006,24 +984,22 @@ class FusionConfirmView(View):
 
     async def process_fusion(self, channel):
 
+        database.delete_inventory_items(
+            item["data"]["instance_id"] for item in self.items if item["type"] == "gear"
+        )
         for item in self.items:
-            if item["type"] == "gear":
-                database.delete_inventory_item(item["data"]["instance_id"])
-            else:
+            if item["type"] != "gear":
                 database.remove_user_skin(self.user_id, item["data"])
 
         rewards = utils.generate_fusion_rewards(self.rolls, self.user_id)
-        u_data = database.get_user_data(self.user_id)
-        u_dict = dict(u_data)
-
-        database.update_user_stats(
+        database.increment_user_fields(
             self.user_id,
             {
-                "chaos_cores": u_dict["chaos_cores"] + rewards["cores"],
-                "chaos_kits": u_dict["chaos_kits"] + rewards["kits"],
-                "chaos_shards": u_dict["chaos_shards"] + rewards["shards"],
-                "merch_tokens": u_dict["merch_tokens"] + rewards["tokens"],
-                "daily_fusions": u_dict["daily_fusions"] + len(self.items),
+                "chaos_cores": rewards["cores"],
+                "chaos_kits": rewards["kits"],
+                "chaos_shards": rewards["shards"],
+                "merch_tokens": rewards["tokens"],
+                "daily_fusions": len(self.items),
             },
         )
 
@@ -1277,15 +1253,11 @@ class CoreOpenModal(Modal):
 
         u_data = database.get_user_data(self.user_id)
         u_dict = dict(u_data)
-        if u_dict["chaos_cores"] < amt:
+        if not database.spend_user_fields(self.user_id, {"chaos_cores": amt}):
             return await interaction.response.send_message(
                 f"❌ You only have {u_dict['chaos_cores']} cores left!",
                 ephemeral=True,
             )
-
-        database.update_user_stats(
-            self.user_id, {"chaos_cores": u_dict["chaos_cores"] - amt}
-        )
         is_elite = bool(u_dict.get("is_elite"))
 
         loot = [
@@ -1336,17 +1308,11 @@ class ChaosKitSelect(Select):
 
         p = self.values[0].split(":")
         iid, boost = int(p[0]), int(p[1])
-        u_data = database.get_user_data(self.view.user_id)
-        u_dict = dict(u_data)
-
-        if u_dict["chaos_kits"] < 1:
+        if not database.spend_user_fields(self.view.user_id, {"chaos_kits": 1}):
             return await interaction.followup.send("No Kits!", ephemeral=True)
 
         old = database.get_item_instance(iid)
         new_lvl = old["level"] + boost
-        database.update_user_stats(
-            self.view.user_id, {"chaos_kits": u_dict["chaos_kits"] - 1}
-        )
 
         with database.get_connection() as c:
             c.execute(
@@ -1354,6 +1320,7 @@ class ChaosKitSelect(Select):
                 (new_lvl, iid),
             )
             c.commit()
+        database.invalidate_instance(iid)
 
         pedia.track_upgrade(self.view.user_id, old["item_id"], new_lvl)
         pedia.track_archive(self.view.user_id, "Kit", old["item_id"], "Upgrade")
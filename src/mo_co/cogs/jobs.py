@@ -434,9 +434,10 @@ class ClaimAllBtn(Button):
 
                 mission_updates_needed = True
 
-        database.update_user_stats(
+        database.increment_user_fields(
             self.view.user_id,
-            {"project_progress": json.dumps(prog), "xp": u["xp"] + total_xp},
+            {"xp": total_xp},
+            assign={"project_progress": json.dumps(prog)},
         )
 
         if mission_updates_needed:
@@ -492,13 +493,10 @@ class ClaimJobBtn(Button):
         job = jobs[self.idx]
         job["claimed"] = True
 
-        database.update_user_stats(
+        database.increment_user_fields(
             self.view.user_id,
-            {
-                "active_jobs": json.dumps(jobs),
-                "xp": u["xp"] + 5000,
-                "job_completion_count": u["job_completion_count"] + 1,
-            },
+            {"xp": 5000, "job_completion_count": 1},
+            assign={"active_jobs": json.dumps(jobs)},
         )
 
         try:
@@ -560,11 +558,11 @@ class ClaimProjectBtn(Button):
         xp = pdata.get("reward_xp", 1000)
         tokens = pdata.get("reward_tokens", 0)
 
-        updates = {"project_progress": json.dumps(prog), "xp": u["xp"] + xp}
-        if tokens > 0:
-            updates["merch_tokens"] = u.get("merch_tokens", 0) + tokens
-
-        database.update_user_stats(self.view.user_id, updates)
+        database.increment_user_fields(
+            self.view.user_id,
+            {"xp": xp, "merch_tokens": tokens},
+            assign={"project_progress": json.dumps(prog)},
+        )
 
         try:
             m_state = json.loads(u.get("mission_state", "{}"))
@@ -615,10 +613,10 @@ class OpenBonusKitBtn(Button):
         )
 
     async def callback(self, i):
-        u = dict(database.get_user_data(self.view.user_id))
-        database.update_user_stats(
+        database.increment_user_fields(
             self.view.user_id,
-            {"job_completion_count": 0, "chaos_kits": u["chaos_kits"] + 1},
+            {"chaos_kits": 1},
+            assign={"job_completion_count": 0},
         )
         self.view.update_components()
         await i.response.edit_message(embed=self.view.get_embed(), view=self.view)
@@ -2,6 +2,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from mo_co import database, utils, config, game_data
+from mo_co.leaderboard import LEADERBOARD
 import json
 import math
 import asyncio
@@ -377,49 +378,10 @@ class LeaderboardView(View):
         self.update_components()
 
     def _refresh_db_data(self):
-
-        raw_data = database.get_leaderboard_data(limit=100)
-
-        processed = []
-        for u in raw_data:
-            uid = u["user_id"]
-            xp = u["xp"]
-            elite_xp = u["elite_xp"]
-            is_elite = bool(u["is_elite"])
-            lvl, _, _ = utils.get_level_info(xp)
-
-            if is_elite and lvl >= 50:
-                e_lvl, _, _ = utils.get_elite_level_info(elite_xp)
-                sort_metric = xp + elite_xp
-                emblem = config.ELITE_EMBLEM
-                lvl_disp = f"Elite {e_lvl}"
-            else:
-                sort_metric = xp
-                emblem = utils.get_emblem(lvl)
-                lvl_disp = f"{lvl}"
-
-            gp = utils.get_total_gp(uid)
-
-            name = u["display_name"] or f"Hunter#{str(uid)[-4:]}"
-
-            processed.append(
-                {
-                    "id": uid,
-                    "name": name,
-                    "xp": sort_metric,
-                    "lvl": lvl_disp,
-                    "gp": gp,
-                    "emblem": emblem,
-                }
-            )
-        self.all_data = processed
         self._apply_sort()
 
     def _apply_sort(self):
-        if self.category == "Level":
-            self.all_data.sort(key=lambda x: x["xp"], reverse=True)
-        else:
-            self.all_data.sort(key=lambda x: x["gp"], reverse=True)
+        self.all_data = LEADERBOARD.ranked(self.category)
 
     def get_embed(self):
         title = (
@@ -496,19 +496,15 @@ class ShardPassView(View):
     async def buy_pass(self, i):
         if i.user.id != self.user_id:
             return
-        u = database.get_user_data(self.user_id)
-        if u["mo_gold"] < config.PREMIUM_PASS_PRICE:
+        if not database.spend_user_fields(
+            self.user_id,
+            {"mo_gold": config.PREMIUM_PASS_PRICE},
+            assign={"has_premium_pass": 1},
+        ):
             return await i.response.send_message(
                 f"Not enough mo.gold! {config.MOGOLD_EMOJI}", ephemeral=True
             )
-
-        database.update_user_stats(
-            self.user_id,
-            {
-                "mo_gold": u["mo_gold"] - config.PREMIUM_PASS_PRICE,
-                "has_premium_pass": 1,
-            },
-        )
+        u = database.get_user_data(self.user_id)
 
         rewards_granted = []
         for t in range(1, u["season_tier_claimed"] + 1):
@@ -528,32 +524,22 @@ class ShardPassView(View):
     async def grant_reward(self, info):
         u = database.get_user_data(self.user_id)
         if info["type"] == "xp":
-            database.update_user_stats(self.user_id, {"xp": u["xp"] + 2000})
+            database.increment_user_fields(self.user_id, {"xp": 2000})
         elif info["type"] == "gold":
-            database.update_user_stats(self.user_id, {"mo_gold": u["mo_gold"] + 8})
+            database.increment_user_fields(self.user_id, {"mo_gold": 8})
         elif info["type"] == "token":
-            database.update_user_stats(
-                self.user_id, {"merch_tokens": u["merch_tokens"] + 8}
-            )
+            database.increment_user_fields(self.user_id, {"merch_tokens": 8})
         elif info["type"] == "kit":
-            database.update_user_stats(
-                self.user_id, {"chaos_kits": u["chaos_kits"] + 1}
-            )
+            database.increment_user_fields(self.user_id, {"chaos_kits": 1})
         elif info["type"] == "core":
-            database.update_user_stats(
-                self.user_id, {"chaos_cores": u["chaos_cores"] + 1}
-            )
+            database.increment_user_fields(self.user_id, {"chaos_cores": 1})
         elif info["type"] == "random":
 
             roll = random.random()
             if roll < 0.5:
-                database.update_user_stats(
-                    self.user_id, {"chaos_cores": u["chaos_cores"] + 1}
-                )
+                database.increment_user_fields(self.user_id, {"chaos_cores": 1})
             else:
-                database.update_user_stats(
-                    self.user_id, {"chaos_kits": u["chaos_kits"] + 1}
-                )
+                database.increment_user_fields(self.user_id, {"chaos_kits": 1})
         elif info["type"] == "item" and info["item_id"]:
             pl, _, _ = utils.get_level_info(u["xp"])
             lvl = max(1, pl - random.randint(0, 2))
@@ -636,17 +636,15 @@ class BuyDiceButton(Button):
             return
         inv = database.get_user_inventory(self.view.user.id)
         dice = next((i for i in inv if i["item_id"] == "bunch_of_dice"), None)
-        u = database.get_user_data(self.view.user.id)
         lvl = 1
         cost = 100
         if dice:
             lvl = dice["level"]
             cost = int(100 * (1.15**lvl))
-        if u["mo_gold"] < cost:
+        if not database.spend_user_fields(self.view.user.id, {"mo_gold": cost}):
             return await interaction.response.send_message(
                 "Not enough Gold!", ephemeral=True
             )
-        database.update_user_stats(self.view.user.id, {"mo_gold": u["mo_gold"] - cost})
         if not dice:
             database.add_item_to_inventory(
                 self.view.user.id, "bunch_of_dice", "Standard", 1
@@ -706,7 +704,8 @@ class PullMerchButton(Button):
             for i in available
         ]
         chosen = random.choices(available, weights=weights, k=1)[0]
-        database.update_user_stats(self.view.user.id, {"mo_gold": u["mo_gold"] - 50})
+        if not database.spend_user_fields(self.view.user.id, {"mo_gold": 50}):
+            return await interaction.followup.send("Not enough Gold!", ephemeral=True)
         if chosen == "og_crew_title":
             owned_titles.append("OG Crew")
             database.update_user_stats(
@@ -796,21 +795,21 @@ class BuyGearButton(Button):
     async def callback(self, interaction):
         if interaction.user.id != self.view.user_id:
             return
-        u = database.get_user_data(self.view.user.id)
-        if u["merch_tokens"] < self.item_data["cost"]:
+        if not database.spend_user_fields(
+            self.view.user.id,
+            {"merch_tokens": self.item_data["cost"]},
+            append={"daily_purchases": self.item_data["slot"]},
+        ):
+            u = database.get_user_data(self.view.user.id)
+            if self.item_data["slot"] in json.loads(u["daily_purchases"] or "[]"):
+                return await interaction.response.send_message(
+                    "Already bought today!", ephemeral=True
+                )
             return await interaction.response.send_message(
                 "Not enough Tokens!", ephemeral=True
             )
+        u = database.get_user_data(self.view.user.id)
         pl, _, _ = utils.get_level_info(u["xp"])
-        purchases = json.loads(u["daily_purchases"])
-        purchases.append(self.item_data["slot"])
-        database.update_user_stats(
-            self.view.user.id,
-            {
-                "merch_tokens": u["merch_tokens"] - self.item_data["cost"],
-                "daily_purchases": json.dumps(purchases),
-            },
-        )
         database.add_item_to_inventory(
             self.view.user.id, self.item_data["id"], self.item_data["mod"], pl
         )
@@ -844,17 +843,13 @@ class BuyChaosButton(Button):
     async def callback(self, interaction):
         if interaction.user.id != self.view.user_id:
             return
-        u = database.get_user_data(self.view.user.id)
-        if u["merch_tokens"] < self.cost:
+        gain = "chaos_cores" if self.type_str == "core" else "chaos_kits"
+        if not database.spend_user_fields(
+            self.view.user.id, {"merch_tokens": self.cost}, gains={gain: 1}
+        ):
             return await interaction.response.send_message(
                 "Not enough Tokens!", ephemeral=True
             )
-        upd = {"merch_tokens": u["merch_tokens"] - self.cost}
-        if self.type_str == "core":
-            upd["chaos_cores"] = u["chaos_cores"] + 1
-        else:
-            upd["chaos_kits"] = u["chaos_kits"] + 1
-        database.update_user_stats(self.view.user.id, upd)
         self.view.u_data = database.get_user_data(self.view.user.id)
         await interaction.response.edit_message(
             embed=self.view.get_embed(), view=self.view
@@ -874,18 +869,13 @@ class BuyDealButton(Button):
     async def callback(self, interaction):
         if interaction.user.id != self.view.user_id:
             return
-        u = database.get_user_data(self.view.user.id)
         cost, ptype = self.deal["price_amount"], self.deal["price_type"]
-        bal = u["mo_gold"] if ptype == "gold" else u["merch_tokens"]
-        if bal < cost:
+        col = "mo_gold" if ptype == "gold" else "merch_tokens"
+        if not database.spend_user_fields(self.view.user.id, {col: cost}):
             return await interaction.response.send_message(
                 f"Not enough {ptype}!", ephemeral=True
             )
-
-        database.update_user_stats(
-            self.view.user.id,
-            {("mo_gold" if ptype == "gold" else "merch_tokens"): bal - cost},
-        )
+        u = database.get_user_data(self.view.user.id)
 
         it, iid = self.deal["item_type"], self.deal["item_id"]
         msg = ""
@@ -924,8 +914,7 @@ class BuyDealButton(Button):
             match = re.match(r"(\d+)x", self.deal["offer_name"])
             qty = int(match.group(1)) if match else 1
 
-            current_val = u[iid]
-            database.update_user_stats(self.view.user.id, {iid: current_val + qty})
+            database.increment_user_fields(self.view.user.id, {iid: qty})
             msg = f"**{qty}x {iid.replace('_', ' ').title()}**"
 
         self.view.u_data = database.get_user_data(self.view.user.id)
@@ -940,15 +929,11 @@ class BuyDealButton(Button):
             if i.user.id != self.user_id:
                 return
 
-            u = database.get_user_data(i.user.id)
-            if u["elite_tokens"] < cost:
+            if not database.spend_user_fields(i.user.id, {"elite_tokens": cost}):
                 return await i.response.send_message(
                     "Not enough Tokens!", ephemeral=True
                 )
-
-            database.update_user_stats(
-                i.user.id, {"elite_tokens": u["elite_tokens"] - cost}
-            )
+            u = database.get_user_data(i.user.id)
             msg = ""
 
             if item["type"] == "rotating":
@@ -989,13 +974,12 @@ class BuyDealButton(Button):
                     )
                     msg = f"✅ Acquired **{item['name']}**!"
             elif item["type"] == "consumable_xp":
-                database.update_user_stats(
-                    self.user_id,
-                    {"daily_xp_boosted": u["daily_xp_boosted"] + 10000},
+                database.increment_user_fields(
+                    self.user_id, {"daily_xp_boosted": 10000}
                 )
                 msg = "✅ **XP Booster Activated!**"
             elif item["type"] == "consumable_gold":
-                database.update_user_stats(self.user.id, {"mo_gold": u["mo_gold"] + 10})
+                database.increment_user_fields(self.user.id, {"mo_gold": 10})
                 msg = "✅ **Acquired 10 mo.gold!**"
 
             await i.response.edit_message(embed=self.get_embed(), view=self)
@@ -4,12 +4,14 @@ from discord.ext import commands, tasks
 from discord.ui import View, Button, Select
 from mo_co import database, config, utils, game_data
 from mo_co import rift_engine
+from mo_co.render import RENDER
 import asyncio
 import typing
 import json
 import time
+from mo_co.state_backend import SharedMap
 
-ACTIVE_LOBBIES = {}
+ACTIVE_LOBBIES = SharedMap("lobbies")
 
 
 class Teams(commands.Cog):
@@ -25,9 +27,10 @@ class Teams(commands.Cog):
         """Scans active lobbies with matchmaking enabled and merges them."""
 
         candidates = []
-        for tid, lob in list(ACTIVE_LOBBIES.items()):
+        for tid, lob in ACTIVE_LOBBIES.items():
             if (
-                lob.get("matchmaking")
+                self.bot.get_guild(lob["guild_id"])
+                and lob.get("matchmaking")
                 and len(lob["members"]) < 4
                 and not lob.get("game_started")
             ):
@@ -70,6 +73,7 @@ class Teams(commands.Cog):
             target["members"].append(uid)
             target["ready"][uid] = False
             target["member_info"][uid] = source["member_info"][uid]
+        ACTIVE_LOBBIES[target["thread_id"]] = target
 
         try:
             s_thread = self.bot.get_channel(source["thread_id"])
@@ -197,7 +201,9 @@ class Teams(commands.Cog):
 
             lobby_view = LobbyView(self.bot, thread.id)
             lobby_msg = await thread.send(embed=lobby_view.get_embed(), view=lobby_view)
-            ACTIVE_LOBBIES[thread.id]["lobby_message_id"] = lobby_msg.id
+            lobby = ACTIVE_LOBBIES[thread.id]
+            lobby["lobby_message_id"] = lobby_msg.id
+            ACTIVE_LOBBIES[thread.id] = lobby
 
         except Exception as e:
             print(f"Team Creation Error: {e}")
@@ -329,6 +335,7 @@ class LFGView(View):
             "gp": context["gp"],
             "emblem": utils.get_emblem(context["level"]),
         }
+        ACTIVE_LOBBIES[thread_id] = lobby
         thread = interaction.guild.get_thread(thread_id)
         if thread:
             await thread.add_user(interaction.user)
@@ -471,6 +478,7 @@ class DifficultySelect(Select):
 
         for m in lobby["ready"]:
             lobby["ready"][m] = False
+        ACTIVE_LOBBIES[interaction.channel_id] = lobby
 
         view = LobbyView(interaction.client, interaction.channel_id)
         await interaction.response.edit_message(embed=view.get_embed(), view=view)
@@ -525,6 +533,7 @@ class RiftSelectMenu(Select):
         lobby["rift"] = new_rift
         for m in lobby["ready"]:
             lobby["ready"][m] = False
+        ACTIVE_LOBBIES[interaction.channel_id] = lobby
         lfg_view = LFGView(interaction.client, lobby["leader"])
         await lfg_view.update_all_uis(interaction.guild, interaction.channel_id)
         await interaction.response.defer()
@@ -550,6 +559,7 @@ class ReadyButton(Button):
         lobby["ready"][interaction.user.id] = not lobby["ready"].get(
             interaction.user.id, False
         )
+        ACTIVE_LOBBIES[interaction.channel_id] = lobby
         view = LobbyView(interaction.client, interaction.channel_id)
         await interaction.response.edit_message(embed=view.get_embed(), view=view)
 
@@ -572,6 +582,7 @@ class StartButton(Button):
             )
 
         lobby["matchmaking"] = True
+        ACTIVE_LOBBIES[interaction.channel_id] = lobby
         matchmaking_view = MatchmakingView(interaction.client, interaction.channel_id)
         await interaction.response.edit_message(
             embed=matchmaking_view.get_embed(), view=matchmaking_view
@@ -610,6 +621,7 @@ class LeaveButton(Button):
 
         if interaction.user.id == lobby["leader"]:
             lobby["leader"] = lobby["members"][0]
+        ACTIVE_LOBBIES[thread_id] = lobby
         lfg_view = LFGView(interaction.client, lobby["leader"])
         await lfg_view.update_all_uis(interaction.guild, thread_id)
         await interaction.response.send_message("You left the team.", ephemeral=True)
@@ -680,34 +692,45 @@ class MatchmakingView(View):
         except:
             pass
 
-        while not self.cancelled:
+        key = ("matchmaking", self.thread_id)
+        RENDER.register(
+            key,
+            self.message or interaction,
+            self._render_live,
+            2.0,
+            self._live_gone,
+        )
+        try:
+            while not self.cancelled:
 
-            if self.thread_id not in ACTIVE_LOBBIES:
-                break
+                if self.thread_id not in ACTIVE_LOBBIES:
+                    break
 
-            self.lobby = ACTIVE_LOBBIES[self.thread_id]
+                self.lobby = ACTIVE_LOBBIES[self.thread_id]
 
-            if len(self.lobby["members"]) >= 4:
-                await self.launch_game(None, self.message)
-                break
+                if len(self.lobby["members"]) >= 4:
+                    await self.launch_game(None, self.message)
+                    break
 
-            await asyncio.sleep(2)
-            self.elapsed += 2
+                await asyncio.sleep(2)
+                self.elapsed += 2
+        finally:
+            RENDER.unregister(key)
 
-            try:
-                if self.message:
-                    await self.message.edit(embed=self.get_embed(), view=self)
-                else:
-                    await interaction.edit_original_response(
-                        embed=self.get_embed(), view=self
-                    )
-            except:
-                break
+    def _render_live(self):
+        if self.cancelled or self.thread_id not in ACTIVE_LOBBIES:
+            return None
+        return self.get_embed(), self
+
+    def _live_gone(self):
+        self.cancelled = True
 
     async def launch_game(self, interaction=None, message=None):
         self.cancelled = True
 
+        self.lobby = ACTIVE_LOBBIES.get(self.thread_id, self.lobby)
         self.lobby["game_started"] = True
+        ACTIVE_LOBBIES[self.thread_id] = self.lobby
 
         if interaction:
             await interaction.response.edit_message(
@@ -786,6 +809,7 @@ class CancelMatchButton(Button):
 
         if lobby:
             lobby["matchmaking"] = False
+            ACTIVE_LOBBIES[self.view.thread_id] = lobby
         view = LobbyView(self.view.bot, self.view.thread_id)
         await interaction.response.edit_message(embed=view.get_embed(), view=view)
         self.view.stop()
@@ -379,6 +379,7 @@ class ActiveTradeView(View):
             conn.commit()
 
             database.unequip_from_all_slots(self.seller.id, self.instance_id)
+            database.invalidate_kit(self.buyer.id)
 
             for child in self.children:
                 child.disabled = True
@@ -10,8 +10,33 @@ import math
 import json
 from mo_co.game_data.missions import MISSIONS
 from mo_co.mission_engine import MissionEngine
+from mo_co.render import RENDER
+from mo_co.state_backend import SharedMap
 
-MM_QUEUE = []
+MM_QUEUE = SharedMap("versus_queue")
+WAITING = {}
+
+
+def local_queue():
+    """
+    Queued players whose interaction is held by this process, oldest first.
+
+    MM_QUEUE (uid -> join time) is shared by every shard. The interaction
+    needed to open the match thread only exists where the player queued, so
+    each shard pairs the players it holds.
+    """
+    entries = [
+        (uid, join_time, WAITING[uid])
+        for uid, join_time in MM_QUEUE.items()
+        if uid in WAITING
+    ]
+    entries.sort(key=lambda e: e[1])
+    return entries
+
+
+def dequeue(uid):
+    MM_QUEUE.pop(uid)
+    return WAITING.pop(uid, None)
 
 
 class Versus(commands.Cog):
@@ -40,16 +65,19 @@ class Versus(commands.Cog):
 
     @tasks.loop(seconds=5)
     async def matchmaker(self):
-        while len(MM_QUEUE) >= 2:
-            entry1 = MM_QUEUE.pop(0)
-            entry2 = MM_QUEUE.pop(0)
+        queue = local_queue()
+        while len(queue) >= 2:
+            entry1 = queue.pop(0)
+            entry2 = queue.pop(0)
+            dequeue(entry1[0])
+            dequeue(entry2[0])
             await self.create_match(entry1, entry2)
 
         now = time.time()
-        for i in range(len(MM_QUEUE) - 1, -1, -1):
-            uid, join_time, interaction = MM_QUEUE[i]
+        for entry in queue:
+            uid, join_time, interaction = entry
             if now - join_time > 60:
-                entry = MM_QUEUE.pop(i)
+                dequeue(uid)
                 bot_name = random.choice(versus_engine.VERSUS_BOT_NAMES)
                 bot_entry = (f"BOT_{bot_name}", 0, None)
                 await self.create_match(entry, bot_entry)
@@ -130,11 +158,12 @@ class Versus(commands.Cog):
 
     async def join_queue(self, interaction):
         uid = interaction.user.id
-        if any(q[0] == uid for q in MM_QUEUE):
+        if uid in MM_QUEUE:
             return await interaction.response.send_message(
                 "Already in queue!", ephemeral=True
             )
-        MM_QUEUE.append((uid, time.time(), interaction))
+        MM_QUEUE[uid] = time.time()
+        WAITING[uid] = interaction
         view = VersusSearchingView(interaction)
         await interaction.response.send_message(
             embed=view.get_embed(), view=view, ephemeral=True
@@ -195,27 +224,35 @@ class VersusSearchingView(View):
         embed.description = f"Searching for opponent...\n{config.LOADING_EMOJI} **Time Elapsed:** {self.elapsed}s"
         return embed
 
+    def _searching(self):
+        return self.interaction.user.id in MM_QUEUE
+
     async def update_timer(self):
-        while not self.cancelled:
-            if not any(q[0] == self.interaction.user.id for q in MM_QUEUE):
-                break
-            await asyncio.sleep(2)
-            self.elapsed += 2
-
-            if self.cancelled:
-                break
-            try:
-                await self.interaction.edit_original_response(
-                    embed=self.get_embed(), view=self
-                )
-            except:
-                break
+        key = ("versus_search", self.interaction.user.id)
+        RENDER.register(
+            key, self.interaction, self._render_live, 2.0, self._live_gone
+        )
+        try:
+            while not self.cancelled:
+                if not self._searching():
+                    break
+                await asyncio.sleep(2)
+                self.elapsed += 2
+        finally:
+            RENDER.unregister(key)
+
+    def _render_live(self):
+        if self.cancelled or not self._searching():
+            return None
+        return self.get_embed(), self
+
+    def _live_gone(self):
+        self.cancelled = True
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger)
     async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.cancelled = True
-        global MM_QUEUE
-        MM_QUEUE = [entry for entry in MM_QUEUE if entry[0] != interaction.user.id]
+        dequeue(interaction.user.id)
         await interaction.response.edit_message(
             content="❌ Matchmaking Cancelled.", embed=None, view=None
         )
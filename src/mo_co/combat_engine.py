@@ -5,9 +5,76 @@ from mo_co import game_data
 from mo_co.game_data import scaling
 from mo_co import database
 from mo_co import pedia
+from mo_co.entity_state import (
+    NO_STATUS,
+    StatMults,
+    add_status,
+    has_status,
+    intern_id,
+    prune,
+)
 
 
 class CombatEntity:
+    __slots__ = (
+        "engine",
+        "is_player",
+        "is_bot",
+        "owner",
+        "user_id",
+        "source_id",
+        "name",
+        "max_hp",
+        "hp",
+        "level",
+        "attack_pwr",
+        "luck",
+        "gp",
+        "is_swarm",
+        "is_boss",
+        "windup",
+        "stunned",
+        "taunt",
+        "is_dashing",
+        "combo_triggered",
+        "weapon_id",
+        "weapon_data",
+        "gadgets",
+        "passives",
+        "rings",
+        "modules",
+        "emblem",
+        "combo_count",
+        "hits_taken_count",
+        "status_effects",
+        "dash_cd",
+        "action_queue",
+        "stat_mults",
+        "cdr_mult",
+        "modifier_cd_penalty",
+        "dash_cd_max",
+        "regen_per_turn",
+        "extra_projectiles",
+        "combo_accel",
+        "attack_speed_mult",
+        "total_dmg_dealt",
+        "dmg_boss",
+        "dmg_mobs",
+        "total_healing",
+        "healed_this_tick",
+        "total_tanked",
+        "damage_sources",
+        "heal_sources",
+        "xp_mult_bonus",
+        "loot_rolls_bonus",
+        "death_time",
+        "defense_mult",
+        "hits_taken_this_tick",
+        "icon",
+        "modifier_icons",
+        "_death_logged",
+    )
+
     def __init__(
         self,
         engine,
@@ -23,7 +90,7 @@ class CombatEntity:
         self.owner = owner
         self.user_id = None
 
-        self.source_id = source_id if source_id else name
+        self.source_id = intern_id(source_id if source_id else name)
 
         if not is_player and not is_bot and not owner:
             self.name = utils.format_monster_name(name)
@@ -55,23 +122,11 @@ class CombatEntity:
 
         self.combo_count = 0
         self.hits_taken_count = 0
-        self.status_effects = []
+        self.status_effects = NO_STATUS
         self.dash_cd = 0
         self.action_queue = None
 
-        self.stat_mults = {
-            "dmg": 1.0,
-            "heal": 1.0,
-            "hp": 1.0,
-            "cd": 1.0,
-            "weapon_crit": 0.0,
-            "gadget_crit": 0.0,
-            "passive_crit": 0.0,
-            "heal_crit": 0.0,
-            "pet_crit": 0.0,
-            "pet_dmg": 1.0,
-            "executioner": 1.0,
-        }
+        self.stat_mults = StatMults()
 
         self.cdr_mult = 1.0
         self.modifier_cd_penalty = 1.0
@@ -154,10 +209,10 @@ class CombatEntity:
             self.max_hp = int(hp) if hp else utils.get_base_hp(level)
 
         if isinstance(weapon, dict):
-            self.weapon_id = weapon.get("id")
+            self.weapon_id = intern_id(weapon.get("id"))
             self.weapon_data = weapon
         else:
-            self.weapon_id = weapon
+            self.weapon_id = intern_id(weapon)
             self.weapon_data = {
                 "id": weapon,
                 "modifier": "Standard",
@@ -174,9 +229,10 @@ class CombatEntity:
                 g_lvl = g.get("lvl", 1)
                 if self.is_player and not self.is_bot:
                     g["lvl"] = utils.get_effective_level(g_lvl, self.level)
+                g["id"] = intern_id(g["id"])
                 self.gadgets.append(g)
 
-        self.passives = passives if passives else {}
+        self.passives = {intern_id(k): v for k, v in (passives or {}).items()}
         self.rings = rings if rings else []
         self.modules = []
 
@@ -361,16 +417,15 @@ class CombatEntity:
         self.stunned = False
         self.taunt = False
 
-        active_status = []
         for s in self.status_effects:
-            s["duration"] -= delta_time
-            if s["type"] == "STUN":
+            s.duration -= delta_time
+            if s.type == "STUN":
                 self.stunned = True
-            elif s["type"] == "TAUNT":
+            elif s.type == "TAUNT":
                 self.taunt = True
-            elif s["type"] == "POISON":
+            elif s.type == "POISON":
                 self.take_damage(50 * delta_time, source="Poison")
-            elif s["type"] == "SPIN":
+            elif s.type == "SPIN":
                 targets = self.engine.get_enemies(self)
                 dmg = (
                     scaling.get_weapon_damage(self.weapon_id, self.weapon_data["level"])
@@ -381,10 +436,8 @@ class CombatEntity:
                     self.engine.deal_damage(
                         self, t, int(dmg), "spinsickle_spin", silent=True
                     )
-            if s["duration"] > 0:
-                active_status.append(s)
 
-        self.status_effects = active_status
+        self.status_effects = prune(self.status_effects)
         if self.regen_per_turn > 0:
             self.heal(self.regen_per_turn * delta_time, "regen_ring")
 
@@ -960,7 +1013,7 @@ class CombatEntity:
         return reduced_dmg
 
     def has_status(self, s_type):
-        return any(s["type"] == s_type for s in self.status_effects)
+        return has_status(self.status_effects, s_type)
 
     def apply_status(self, s_type, duration, source_id=None, icon=None):
         icon_str = icon
@@ -968,13 +1021,8 @@ class CombatEntity:
             icon_str = (
                 utils.get_emoji(self.engine.bot, source_id) if source_id else "✨"
             )
-
-        for s in self.status_effects:
-            if s["type"] == s_type:
-                s["duration"] = max(s["duration"], duration)
-                return
-        self.status_effects.append(
-            {"type": s_type, "duration": duration, "icon": icon_str}
+        self.status_effects = add_status(
+            self.status_effects, s_type, duration, icon_str
         )
 
 
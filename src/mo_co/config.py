@@ -20,6 +20,33 @@ ADMIN_ACCESS_CODE = os.getenv("ADMIN_ACCESS_CODE", "0000")
 TURSO_DB_URL = os.getenv("TURSO_DB_URL")
 TURSO_AUTH_TOKEN = os.getenv("TURSO_AUTH_TOKEN")
 
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_ASYNC = os.getenv("DB_ASYNC", "1") == "1"
+DB_READ_WORKERS = int(os.getenv("DB_READ_WORKERS", "4"))
+WRITE_BEHIND_INTERVAL = float(os.getenv("WRITE_BEHIND_INTERVAL", "2.0"))
+LEADERBOARD_REFRESH = float(os.getenv("LEADERBOARD_REFRESH", "60"))
+LEADERBOARD_SIZE = int(os.getenv("LEADERBOARD_SIZE", "100"))
+KIT_CACHE_SIZE = int(os.getenv("KIT_CACHE_SIZE", "5000"))
+KNOWN_USERS_SIZE = int(os.getenv("KNOWN_USERS_SIZE", "50000"))
+CACHE_RECHECK = float(os.getenv("CACHE_RECHECK", "5"))
+EVENT_LUCK_TTL = float(os.getenv("EVENT_LUCK_TTL", "600"))
+EVENT_LUCK_CACHE_SIZE = int(os.getenv("EVENT_LUCK_CACHE_SIZE", "2000"))
+LIVE_EDIT_INTERVAL = float(os.getenv("LIVE_EDIT_INTERVAL", "1.5"))
+RENDER_EDIT_BUDGET = float(os.getenv("RENDER_EDIT_BUDGET", "25"))
+RENDER_ROUTE_GAP = float(os.getenv("RENDER_ROUTE_GAP", "1.0"))
+GAME_CLOCK_BUDGET = float(os.getenv("GAME_CLOCK_BUDGET", "0.05"))
+GAME_CLOCK_IDLE_AFTER = float(os.getenv("GAME_CLOCK_IDLE_AFTER", "60"))
+GAME_CLOCK_IDLE_SLOWDOWN = float(os.getenv("GAME_CLOCK_IDLE_SLOWDOWN", "2.0"))
+STATE_BACKEND = os.getenv("STATE_BACKEND", "memory")
+STATE_DB_PATH = os.getenv("STATE_DB_PATH", "mo_co_state.db")
+SHARD_COUNT = int(os.getenv("SHARD_COUNT", "0"))
+SHARD_IDS = [int(s) for s in os.getenv("SHARD_IDS", "").split(",") if s.strip()]
+SHARDED = os.getenv("SHARDED", "0") == "1" or SHARD_COUNT > 0
+PRIMARY_SHARD = not SHARD_IDS or 0 in SHARD_IDS
+
 if not TOKEN:
     print("WARNING: DISCORD_TOKEN missing from environment.")
 
@@ -1,11 +1,14 @@
+import asyncio
 import sqlite3
 import json
 import random
 import shutil
 import os
 import time
+import threading
 from datetime import datetime, timedelta
-from mo_co import config, game_data
+from mo_co import config, game_data, levels, metrics, migrations
+from mo_co.state_backend import STATE
 from collections.abc import Mapping
 
 USE_TURSO = False
@@ -89,6 +92,14 @@ class TursoConnectionWrapper:
     def commit(self):
         self._conn.commit()
 
+    def rollback(self):
+        if hasattr(self._conn, "rollback"):
+            self._conn.rollback()
+
+    @property
+    def in_transaction(self):
+        return getattr(self._conn, "in_transaction", False)
+
     def close(self):
         self._conn.close()
 
@@ -102,19 +113,288 @@ class TursoConnectionWrapper:
             pass
 
 
-def get_connection():
+def _open_raw_connection():
     if USE_TURSO:
         raw_conn = libsql.connect(
             database=config.TURSO_DB_URL, auth_token=config.TURSO_AUTH_TOKEN
         )
         return TursoConnectionWrapper(raw_conn)
     else:
-        conn = sqlite3.connect(DB_PATH, timeout=20)
+        conn = sqlite3.connect(DB_PATH, timeout=20, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         return conn
 
 
+class TimedCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def execute(self, sql, params=()):
+        started = time.perf_counter()
+        try:
+            self._cursor.execute(sql, params)
+        finally:
+            metrics.record_query(sql, time.perf_counter() - started)
+        return self
+
+
+class PooledConnection:
+    """
+    A lease on a pooled connection. Behaves like the underlying connection;
+    close() (or leaving a `with` block) hands it back to the pool instead of
+    tearing it down. Every statement is reported to mo_co.metrics.
+    """
+
+    def __init__(self, pool, conn, owner):
+        self._pool = pool
+        self._conn = conn
+        self._owner = owner
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def execute(self, sql, params=()):
+        started = time.perf_counter()
+        try:
+            return self._conn.execute(sql, params)
+        finally:
+            metrics.record_query(sql, time.perf_counter() - started)
+
+    def cursor(self):
+        return TimedCursor(self._conn.cursor())
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        if not self._released:
+            self._released = True
+            self._pool.release(self._conn, self._owner)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        finally:
+            self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """
+    Bounded pool of long-lived connections, handed out per thread and, on the
+    event loop, per asyncio task.
+
+    Nested get_connection() calls in the same owner (helpers calling helpers)
+    share one connection. Two coroutines never share one, so a lease held
+    across an `await` cannot have its transaction committed or rolled back
+    by another task. Owners block up to `timeout` seconds when the pool is
+    exhausted.
+    """
+
+    def __init__(self, factory, size, timeout, recycle):
+        self._factory = factory
+        self.size = size
+        self.timeout = timeout
+        self.recycle = recycle
+        self._cond = threading.Condition()
+        self._idle = []
+        self._born = {}
+        self._open = 0
+        self._leases = {}
+        self.stats = {
+            "checkouts": 0,
+            "reused": 0,
+            "created": 0,
+            "recycled": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+        }
+
+    @staticmethod
+    def _owner():
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        return threading.get_ident(), task
+
+    def acquire(self):
+        owner = self._owner()
+        with self._cond:
+            lease = self._leases.get(owner)
+            if lease is not None:
+                lease[1] += 1
+                self.stats["checkouts"] += 1
+                self.stats["reused"] += 1
+                return PooledConnection(self, lease[0], owner)
+
+        conn = self._take()
+        with self._cond:
+            self._leases[owner] = [conn, 1]
+        return PooledConnection(self, conn, owner)
+
+    def _take(self):
+        started = time.perf_counter()
+        waited = False
+        with self._cond:
+            while True:
+                while self._idle:
+                    conn, born = self._idle.pop()
+                    if time.time() - born > self.recycle:
+                        self._open -= 1
+                        self.stats["recycled"] += 1
+                        self._discard(conn)
+                        continue
+                    self._checked_out(conn, born, started, waited)
+                    return conn
+                if self._open < self.size:
+                    self._open += 1
+                    break
+                remaining = self.timeout - (time.perf_counter() - started)
+                if remaining <= 0:
+                    self.stats["timeouts"] += 1
+                    raise TimeoutError(
+                        f"Database pool exhausted ({self.size} connections in use)"
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+        try:
+            conn = self._factory()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.stats["created"] += 1
+            self._checked_out(conn, time.time(), started, waited)
+        return conn
+
+    def _checked_out(self, conn, born, started, waited):
+        self._born[id(conn)] = born
+        self.stats["checkouts"] += 1
+        if waited:
+            wait = time.perf_counter() - started
+            self.stats["waits"] += 1
+            self.stats["wait_total"] += wait
+            self.stats["wait_max"] = max(self.stats["wait_max"], wait)
+
+    def release(self, conn, owner):
+        with self._cond:
+            lease = self._leases.get(owner)
+            if lease is None or lease[0] is not conn:
+                return
+            lease[1] -= 1
+            if lease[1] > 0:
+                return
+            del self._leases[owner]
+
+        try:
+            if getattr(conn, "in_transaction", False):
+                conn.rollback()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._born.pop(id(conn), None)
+                self._cond.notify()
+            self._discard(conn)
+            return
+
+        with self._cond:
+            born = self._born.pop(id(conn), time.time())
+            self._idle.append((conn, born))
+            self._cond.notify()
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def snapshot(self):
+        with self._cond:
+            data = dict(self.stats)
+            data["size"] = self.size
+            data["open"] = self._open
+            data["idle"] = len(self._idle)
+            data["in_use"] = self._open - len(self._idle)
+        data["backend"] = "turso" if USE_TURSO else "sqlite"
+        data["wait_avg_ms"] = (
+            round(data["wait_total"] * 1000 / data["waits"], 2) if data["waits"] else 0
+        )
+        data["wait_max_ms"] = round(data.pop("wait_max") * 1000, 2)
+        data.pop("wait_total")
+        return data
+
+
+POOL = ConnectionPool(
+    _open_raw_connection,
+    size=config.DB_POOL_SIZE,
+    timeout=config.DB_POOL_TIMEOUT,
+    recycle=config.DB_POOL_RECYCLE,
+)
+
+
+def get_connection():
+    return POOL.acquire()
+
+
+def get_pool_stats():
+    return POOL.snapshot()
+
+
+GEAR_SLOT_COLUMNS = (
+    "weapon_id",
+    "gadget_1_id",
+    "gadget_2_id",
+    "gadget_3_id",
+    "passive_1_id",
+    "passive_2_id",
+    "passive_3_id",
+    "elite_module_id",
+    "ring_1_id",
+    "ring_2_id",
+    "ring_3_id",
+)
+EQUIP_SLOTS = GEAR_SLOT_COLUMNS + ("ride_id",)
+
+_EQUIPPED_ROWS = " UNION ALL ".join(
+    f"SELECT kit_id, '{s}', {s}, user_id FROM gear_kits WHERE {s} IS NOT NULL"
+    for s in EQUIP_SLOTS
+)
+UNEQUIP_CHUNK = 64
+
+
+PEDIA_TABLES = (
+    "pedia_monsters",
+    "pedia_gear",
+    "pedia_gear_mods",
+    "pedia_worlds",
+    "pedia_skins",
+    "pedia_archive",
+)
+PEDIA_MIGRATED = '{"v": 2}'
+
+
 def init_db():
     conn = get_connection()
 
@@ -314,38 +594,136 @@ def init_db():
     )"""
     )
 
-    try:
-        conn.execute("ALTER TABLE users ADD COLUMN display_name TEXT")
-    except:
-        pass
-    try:
-        conn.execute("ALTER TABLE users ADD COLUMN active_kit_index INTEGER DEFAULT 1")
-    except:
-        pass
-    try:
-        conn.execute(
-            "ALTER TABLE users ADD COLUMN cool_zone_rules_accepted BOOLEAN DEFAULT 0"
-        )
-    except:
-        pass
-    try:
-        conn.execute("ALTER TABLE shop_state ADD COLUMN elite_shop_item TEXT")
-    except:
-        pass
-    try:
-        conn.execute("ALTER TABLE shop_state ADD COLUMN elite_refreshes_at TEXT")
-    except:
-        pass
-    try:
-        conn.execute("ALTER TABLE users ADD COLUMN account_state TEXT DEFAULT 'LEGIT'")
-    except:
-        pass
+    migrations.migrate(conn)
+    sync_item_meta(conn)
 
     conn.commit()
     conn.close()
 
 
+CACHE_VERSIONS = "cache_versions"
+
+
+def bump_cache_version(kind, key="*"):
+    """
+    Marks the cached `kind` entry for `key` ("*" for all of them) stale in every
+    shard process. The counters live in STATE, so with STATE_BACKEND=sqlite a
+    change made by one process is seen by the others within CACHE_RECHECK seconds.
+    """
+    version = STATE.update(CACHE_VERSIONS, (kind, key), lambda v: v + 1, 0)
+    _remember_version((kind, key), version, time.monotonic())
+    return version
+
+
+_seen_versions = {}
+_versions_lock = threading.Lock()
+
+
+def _remember_version(vkey, version, checked_at):
+    with _versions_lock:
+        old = _seen_versions.pop(vkey, None)
+        if old is not None:
+            version = max(version, old[0])
+        elif len(_seen_versions) >= config.KNOWN_USERS_SIZE + config.KIT_CACHE_SIZE:
+            del _seen_versions[next(iter(_seen_versions))]
+        _seen_versions[vkey] = (version, checked_at)
+    return version
+
+
+def cache_version(kind, key="*"):
+    """
+    The counter bump_cache_version last set, as seen by this process. STATE is
+    re-read at most every CACHE_RECHECK seconds per counter, so cache hits
+    stay off the STATE backend (a blocking sqlite query with STATE_BACKEND=sqlite).
+    """
+    vkey = (kind, key)
+    now = time.monotonic()
+    seen = _seen_versions.get(vkey)
+    if seen is not None and now - seen[1] < config.CACHE_RECHECK:
+        return seen[0]
+    return _remember_version(vkey, STATE.get(CACHE_VERSIONS, vkey, 0), now)
+
+
+def _cache_stamp(kind, user_id):
+    return cache_version(kind), cache_version(kind, user_id)
+
+
+KNOWN_USERS = {}
+_known_stamps = {}
+_renamed_users = {}
+_known_lock = threading.Lock()
+KNOWN_USERS_STATS = {"hits": 0, "misses": 0, "renames": 0, "names_written": 0}
+_forget_hooks = []
+
+
+def on_forget_user(hook):
+    """Registers hook(user_id) to run whenever forget_user drops a user (None for all)."""
+    _forget_hooks.append(hook)
+
+
 def register_user(user_id, display_name=None):
+    """
+    Creates the user with a starter kit if needed. Users already registered by
+    this process cost no queries; a changed display_name is queued for
+    flush_display_names().
+    """
+    stamp = _cache_stamp("user", user_id)
+    with _known_lock:
+        if user_id in KNOWN_USERS and _known_stamps.get(user_id) != stamp:
+            KNOWN_USERS.pop(user_id)
+        if user_id in KNOWN_USERS:
+            KNOWN_USERS_STATS["hits"] += 1
+            if display_name and KNOWN_USERS[user_id] != display_name:
+                KNOWN_USERS[user_id] = display_name
+                _renamed_users[user_id] = display_name
+                KNOWN_USERS_STATS["renames"] += 1
+            return
+        KNOWN_USERS_STATS["misses"] += 1
+    name = _register_user(user_id, display_name)
+    with _known_lock:
+        if len(KNOWN_USERS) >= config.KNOWN_USERS_SIZE:
+            oldest = next(iter(KNOWN_USERS))
+            del KNOWN_USERS[oldest]
+            _known_stamps.pop(oldest, None)
+        KNOWN_USERS[user_id] = name
+        _known_stamps[user_id] = stamp
+
+
+def forget_user(user_id=None):
+    """
+    Makes the next register_user check the database again (one user, or all),
+    in this process and in every other shard.
+    """
+    with _known_lock:
+        if user_id is None:
+            KNOWN_USERS.clear()
+            _known_stamps.clear()
+        else:
+            KNOWN_USERS.pop(user_id, None)
+            _known_stamps.pop(user_id, None)
+    for hook in _forget_hooks:
+        hook(user_id)
+    bump_cache_version("user", "*" if user_id is None else user_id)
+
+
+def flush_display_names():
+    """Writes the queued display-name changes in one transaction."""
+    with _known_lock:
+        batch = dict(_renamed_users)
+        _renamed_users.clear()
+    if not batch:
+        return 0
+    with get_connection() as conn:
+        for user_id, name in batch.items():
+            conn.execute(
+                "UPDATE users SET display_name = ? WHERE user_id = ?", (name, user_id)
+            )
+        conn.commit()
+    KNOWN_USERS_STATS["names_written"] += len(batch)
+    return len(batch)
+
+
+def _register_user(user_id, display_name):
     with get_connection() as conn:
         row = conn.execute(
             "SELECT user_id, display_name FROM users WHERE user_id = ?", (user_id,)
@@ -359,13 +737,13 @@ def register_user(user_id, display_name=None):
                 )
                 conn.commit()
             ensure_user_has_kit(user_id)
-            return
+            return display_name or row["display_name"]
 
         now = datetime.utcnow().isoformat()
         start_jobs_time = (datetime.utcnow() - timedelta(hours=12)).isoformat()
         conn.execute(
             """INSERT INTO users (user_id, display_name, current_hp, daily_xp_total, daily_xp_boosted, last_daily_reset, last_job_spawn, owned_titles, project_progress, active_jobs, completed_rifts, owned_skins, equipped_skins, merch_tokens, completed_dojos, dojo_best_times, daily_purchases, daily_fusions, versus_stars, mission_state, mission_thread_id, pedia_data, prestige_level, active_kit_index, cool_zone_rules_accepted, account_state) 
-                     VALUES (?, ?, 1600, ?, ?, ?, ?, '["Hunter"]', '{}', '[]', '[]', '[]', '{}', 0, '[]', '{}', '[]', 0, 0, '{"active": "welcome2moco", "step": 0, "prog": 0, "completed": []}', 0, '{}', 0, 1, 0, 'LEGIT')""",
+                     VALUES (?, ?, 1600, ?, ?, ?, ?, '["Hunter"]', '{}', '[]', '[]', '[]', '{}', 0, '[]', '{}', '[]', 0, 0, '{"active": "welcome2moco", "step": 0, "prog": 0, "completed": []}', 0, ?, 0, 1, 0, 'LEGIT')""",
             (
                 user_id,
                 display_name,
@@ -373,6 +751,7 @@ def register_user(user_id, display_name=None):
                 config.XP_BOOST_PER_DAY,
                 now,
                 start_jobs_time,
+                PEDIA_MIGRATED,
             ),
         )
         conn.execute(
@@ -384,71 +763,95 @@ def register_user(user_id, display_name=None):
             "INSERT INTO gear_kits (user_id, slot_index, name, weapon_id) VALUES (?, 1, 'Gear Kit 1', ?)",
             (user_id, starter_id),
         )
+        sync_equipped(conn, user_id)
         conn.execute(
             "INSERT INTO loadouts (user_id, weapon_id) VALUES (?, ?)",
             (user_id, starter_id),
         )
+        conn.execute(
+            "INSERT OR IGNORE INTO pedia_gear (user_id, item_id) VALUES (?, 'monster_slugger')",
+            (user_id,),
+        )
+        conn.execute(
+            "INSERT OR IGNORE INTO pedia_gear_mods (user_id, item_id, modifier) VALUES (?, 'monster_slugger', 'Standard')",
+            (user_id,),
+        )
         conn.commit()
+    return display_name
 
 
 def get_full_user_context(user_id):
     """
     BULK FETCH: Retrives User Data, Active Kit, and ALL equipped item details in
-    minimal database round-trips (ideally 2). This solves the N+1 performance issue.
+    minimal database round-trips. This solves the N+1 performance issue.
     Returns: (user_dict, kit_dict, inventory_map)
     inventory_map is dict: {instance_id: {item_row_dict}}
     """
-    with get_connection() as conn:
-
-        user_row = conn.execute(
-            "SELECT * FROM users WHERE user_id = ?", (user_id,)
-        ).fetchone()
-        if not user_row:
-            return None, None, {}
+    return get_squad_contexts([user_id]).get(user_id, (None, None, {}))
 
-        user = dict(user_row)
-        idx = user.get("active_kit_index", 1)
 
-        kit_row = conn.execute(
-            "SELECT * FROM gear_kits WHERE user_id=? AND slot_index=?", (user_id, idx)
-        ).fetchone()
-
-        if not kit_row:
-
-            kit_row = conn.execute(
-                "SELECT * FROM gear_kits WHERE user_id=? ORDER BY slot_index ASC LIMIT 1",
-                (user_id,),
-            ).fetchone()
-
-        if not kit_row:
-            return user, None, {}
+def get_squad_contexts(user_ids):
+    """
+    get_full_user_context for a whole squad: three queries whatever its size.
+    Returns {user_id: (user_dict, kit_dict, inventory_map)} for users that exist.
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return {}
+    ph = ",".join("?" * len(user_ids))
+    with get_connection() as conn:
+        users = {
+            r["user_id"]: dict(r)
+            for r in conn.execute(
+                f"SELECT * FROM users WHERE user_id IN ({ph})", tuple(user_ids)
+            ).fetchall()
+        }
+        kit_rows = conn.execute(
+            f"SELECT * FROM gear_kits WHERE user_id IN ({ph}) ORDER BY slot_index ASC",
+            tuple(user_ids),
+        ).fetchall()
 
-        kit = dict(kit_row)
+        kits = {}
+        for r in kit_rows:
+            uid = r["user_id"]
+            if uid not in users:
+                continue
+            active = users[uid].get("active_kit_index", 1)
+            if uid not in kits or r["slot_index"] == active:
+                kits[uid] = dict(r)
 
         instance_ids = []
-        for key, val in kit.items():
-            if key.endswith("_id") and val and isinstance(val, int):
-                instance_ids.append(val)
+        for kit in kits.values():
+            for slot in GEAR_SLOT_COLUMNS + ("ride_id",):
+                if kit.get(slot):
+                    instance_ids.append(kit[slot])
 
-        inv_map = {}
+        inv_rows = []
         if instance_ids:
-
             placeholders = ",".join("?" * len(instance_ids))
-            query = f"SELECT * FROM inventory WHERE instance_id IN ({placeholders})"
-            inv_rows = conn.execute(query, tuple(instance_ids)).fetchall()
-
-            for r in inv_rows:
-                d = dict(r)
-                inv_map[d["instance_id"]] = d
+            inv_rows = conn.execute(
+                f"SELECT * FROM inventory WHERE instance_id IN ({placeholders})",
+                tuple(instance_ids),
+            ).fetchall()
 
-        return user, kit, inv_map
+    items = {r["instance_id"]: dict(r) for r in inv_rows}
+    contexts = {}
+    for uid, user in users.items():
+        kit = kits.get(uid)
+        inv_map = {}
+        if kit:
+            for slot in GEAR_SLOT_COLUMNS + ("ride_id",):
+                if kit.get(slot) in items:
+                    inv_map[kit[slot]] = items[kit[slot]]
+        contexts[uid] = (user, kit, inv_map)
+    return contexts
 
 
 def load_global_cache():
     conn = get_connection()
     try:
         config_rows = conn.execute("SELECT key, value FROM system_config").fetchall()
-        configs = {r["key"]: r["value"] for r in config_rows}
+        configs = seed_config_cache({r["key"]: r["value"] for r in config_rows})
 
         user_bans = conn.execute(
             "SELECT user_id, expires_at, reason FROM user_blacklist"
@@ -476,6 +879,22 @@ def get_leaderboard_data(limit=100):
         conn.close()
 
 
+def get_leaderboard_snapshot():
+    """All ranked users plus every item in their active kit, in two set-based reads."""
+    slots = ", ".join(f"k.{s}" for s in GEAR_SLOT_COLUMNS)
+    with get_connection() as conn:
+        users = conn.execute(
+            "SELECT user_id, display_name, xp, elite_xp, is_elite, prestige_level, elite_tokens, account_state FROM users WHERE account_state = 'LEGIT' OR is_elite = 1"
+        ).fetchall()
+        equipped = conn.execute(
+            f"""SELECT u.user_id, i.item_id, i.level FROM users u
+            JOIN gear_kits k ON k.user_id = u.user_id AND k.slot_index = u.active_kit_index
+            JOIN inventory i ON i.instance_id IN ({slots})
+            WHERE u.account_state = 'LEGIT'"""
+        ).fetchall()
+        return [dict(u) for u in users], [dict(r) for r in equipped]
+
+
 def ensure_user_has_kit(user_id):
     with get_connection() as conn:
         kits = conn.execute(
@@ -534,7 +953,9 @@ def ensure_user_has_kit(user_id):
                         resolve_skin(old_loadout["ride_id"]),
                     ),
                 )
+                sync_equipped(conn, user_id)
                 conn.commit()
+                invalidate_kit(user_id)
 
 
 def create_new_kit(user_id):
@@ -562,7 +983,8 @@ def create_new_kit(user_id):
             (new_index, user_id),
         )
         conn.commit()
-        return True
+    invalidate_kit(user_id)
+    return True
 
 
 def delete_gear_kit(user_id, slot_index):
@@ -576,6 +998,7 @@ def delete_gear_kit(user_id, slot_index):
             "DELETE FROM gear_kits WHERE user_id=? AND slot_index=?",
             (user_id, slot_index),
         )
+        sync_equipped(conn, user_id)
         u = conn.execute(
             "SELECT active_kit_index FROM users WHERE user_id=?", (user_id,)
         ).fetchone()
@@ -590,7 +1013,8 @@ def delete_gear_kit(user_id, slot_index):
                     (first["slot_index"], user_id),
                 )
         conn.commit()
-        return True, "Kit deleted."
+    invalidate_kit(user_id)
+    return True, "Kit deleted."
 
 
 def get_active_kit(user_id):
@@ -613,6 +1037,7 @@ def get_active_kit(user_id):
                 (kit["slot_index"], user_id),
             )
             conn.commit()
+            invalidate_kit(user_id)
     conn.close()
     return kit
 
@@ -626,6 +1051,129 @@ def get_all_kits(user_id):
     return kits
 
 
+KIT_TABLES = ("users", "gear_kits", "inventory")
+
+KIT_CACHE = {}
+_kit_stamps = {}
+_kit_lock = threading.Lock()
+KIT_CACHE_STATS = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def invalidate_kit(user_id=None):
+    """
+    Drops the cached active kit of one user, or of everyone when user_id is None,
+    in this process and in every other shard.
+    """
+    with _kit_lock:
+        KIT_CACHE_STATS["invalidations"] += 1
+        if user_id is None:
+            KIT_CACHE.clear()
+            _kit_stamps.clear()
+        else:
+            KIT_CACHE.pop(user_id, None)
+            _kit_stamps.pop(user_id, None)
+    bump_cache_version("kit", "*" if user_id is None else user_id)
+
+
+def invalidate_instance(instance_id):
+    """
+    Drops every cached kit that has this item equipped. Other shards may cache
+    a kit this process does not, so with a shared STATE the owner is looked up.
+    """
+    with _kit_lock:
+        owners = [
+            uid
+            for uid, r in KIT_CACHE.items()
+            if instance_id in r["inventory"] or instance_id == r["dice_instance"]
+        ]
+    if not owners and STATE.name != "memory":
+        with get_connection() as conn:
+            row = conn.execute(
+                "SELECT user_id FROM inventory WHERE instance_id = ?", (instance_id,)
+            ).fetchone()
+        owners = [row["user_id"]] if row else []
+    for uid in owners:
+        invalidate_kit(uid)
+
+
+def resolve_active_kit(user_id):
+    """
+    The user's active gear kit with its equipped items resolved in one JOIN.
+    Returns {"kit": dict|None, "inventory": {instance_id: item}, "dice": level|None,
+    "dice_instance": instance_id|None}.
+    Memoized per user until the kit or one of its items changes.
+    """
+    stamp = _cache_stamp("kit", user_id)
+    with _kit_lock:
+        cached = KIT_CACHE.get(user_id)
+        if cached is not None and _kit_stamps.get(user_id) == stamp:
+            KIT_CACHE_STATS["hits"] += 1
+            return cached
+        KIT_CACHE_STATS["misses"] += 1
+
+    slots = ", ".join(f"k.{s}" for s in GEAR_SLOT_COLUMNS + ("ride_id",))
+    with get_connection() as conn:
+        rows = conn.execute(
+            f"""SELECT k.*, i.instance_id AS inv_instance_id, i.item_id AS inv_item_id,
+                i.level AS inv_level, i.modifier AS inv_modifier, i.locked AS inv_locked,
+                d.level AS dice_level, d.instance_id AS dice_instance
+            FROM users u
+            LEFT JOIN gear_kits k ON k.user_id = u.user_id AND k.slot_index = u.active_kit_index
+            LEFT JOIN inventory i ON i.instance_id IN ({slots})
+            LEFT JOIN inventory d ON d.instance_id = (
+                SELECT instance_id FROM inventory
+                WHERE user_id = u.user_id AND item_id = 'bunch_of_dice' LIMIT 1
+            )
+            WHERE u.user_id = ?""",
+            (user_id,),
+        ).fetchall()
+
+    resolved = {"kit": None, "inventory": {}, "dice": None, "dice_instance": None}
+    for r in rows:
+        r = dict(r)
+        resolved["dice"] = r.pop("dice_level")
+        resolved["dice_instance"] = r.pop("dice_instance")
+        item = {
+            "instance_id": r.pop("inv_instance_id"),
+            "item_id": r.pop("inv_item_id"),
+            "level": r.pop("inv_level"),
+            "modifier": r.pop("inv_modifier"),
+            "locked": r.pop("inv_locked"),
+        }
+        if r.get("kit_id") is not None and resolved["kit"] is None:
+            resolved["kit"] = r
+        if item["instance_id"] is not None:
+            item["user_id"] = user_id
+            resolved["inventory"][item["instance_id"]] = item
+
+    with _kit_lock:
+        KIT_CACHE.pop(user_id, None)
+        if len(KIT_CACHE) >= config.KIT_CACHE_SIZE:
+            oldest = next(iter(KIT_CACHE))
+            del KIT_CACHE[oldest]
+            _kit_stamps.pop(oldest, None)
+        KIT_CACHE[user_id] = resolved
+        _kit_stamps[user_id] = stamp
+    return resolved
+
+
+def table_changed(table, user_id=None):
+    """Hook for code that writes a table directly (admin editors, raw SQL)."""
+    if table == "system_config":
+        reload_config_cache()
+        bump_cache_version("config")
+    elif table in KIT_TABLES:
+        if table == "gear_kits":
+            with get_connection() as conn:
+                sync_equipped(conn, user_id)
+                conn.commit()
+        invalidate_kit(user_id)
+    if table in ("users", "gear_kits"):
+        forget_user(user_id)
+    if table in KIT_TABLES:
+        bump_cache_version("leaderboard")
+
+
 def update_active_kit(user_id, updates: dict):
     conn = get_connection()
     u = conn.execute(
@@ -639,8 +1187,11 @@ def update_active_kit(user_id, updates: dict):
     conn.execute(
         f"UPDATE gear_kits SET {cols} WHERE user_id = ? AND slot_index = ?", vals
     )
+    if any(k in EQUIP_SLOTS for k in updates):
+        sync_equipped(conn, user_id)
     conn.commit()
     conn.close()
+    invalidate_kit(user_id)
 
 
 def delete_user_account(user_id):
@@ -649,8 +1200,14 @@ def delete_user_account(user_id):
         conn.execute("DELETE FROM inventory WHERE user_id = ?", (user_id,))
         conn.execute("DELETE FROM loadouts WHERE user_id = ?", (user_id,))
         conn.execute("DELETE FROM gear_kits WHERE user_id = ?", (user_id,))
+        conn.execute("DELETE FROM equipped_slots WHERE user_id = ?", (user_id,))
         conn.execute("DELETE FROM user_snapshots WHERE user_id = ?", (user_id,))
+        for table in PEDIA_TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE user_id = ?", (user_id,))
         conn.commit()
+    invalidate_kit(user_id)
+    forget_user(user_id)
+    bump_cache_version("leaderboard")
 
 
 def get_user_data(user_id):
@@ -660,6 +1217,18 @@ def get_user_data(user_id):
     return user
 
 
+def get_users_data(user_ids):
+    user_ids = list(user_ids)
+    if not user_ids:
+        return {}
+    placeholders = ",".join("?" * len(user_ids))
+    with get_connection() as conn:
+        rows = conn.execute(
+            f"SELECT * FROM users WHERE user_id IN ({placeholders})", tuple(user_ids)
+        ).fetchall()
+    return {r["user_id"]: r for r in rows}
+
+
 def update_user_stats(user_id, updates: dict):
     with get_connection() as conn:
         cols = ", ".join([f"{k} = ?" for k in updates.keys()])
@@ -667,6 +1236,128 @@ def update_user_stats(user_id, updates: dict):
         vals.append(user_id)
         conn.execute(f"UPDATE users SET {cols} WHERE user_id = ?", vals)
         conn.commit()
+    if "active_kit_index" in updates:
+        invalidate_kit(user_id)
+
+
+def _max_base_xp():
+    return levels.MAX_BASE_XP
+
+
+def _xp_gain_sql(max_base_xp, with_prestige):
+    gain = (
+        "CAST(? * (1.0 + 0.10 * prestige_level) AS INTEGER)" if with_prestige else "?"
+    )
+    xp_sql = f"xp = CASE WHEN xp >= {max_base_xp} THEN xp ELSE MIN({max_base_xp}, xp + {gain}) END"
+    elite_sql = f"elite_xp = CASE WHEN is_elite THEN elite_xp + MAX(0, {gain} - MAX(0, {max_base_xp} - xp)) ELSE elite_xp END"
+    return xp_sql, elite_sql
+
+
+def _increment_clause(deltas, floors=None, assign=None, with_prestige=False):
+    """
+    Builds the SET clause for a relative users UPDATE. The pseudo-field
+    "xp_award" is split between base and elite XP the same way
+    utils.add_user_xp does; columns listed in `floors` are clamped with
+    MAX(floor, col + ?).
+    """
+    floors = floors or {}
+    cols, vals = [], []
+    for k, v in deltas.items():
+        if not v:
+            continue
+        if k == "xp_award":
+            xp_sql, elite_sql = _xp_gain_sql(_max_base_xp(), with_prestige)
+            cols += [xp_sql, elite_sql]
+            vals += [v, v]
+        elif k in floors:
+            cols.append(f"{k} = MAX(?, {k} + ?)")
+            vals += [floors[k], v]
+        else:
+            cols.append(f"{k} = {k} + ?")
+            vals.append(v)
+    for k, v in (assign or {}).items():
+        cols.append(f"{k} = ?")
+        vals.append(v)
+    return ", ".join(cols), vals
+
+
+def increment_user_fields(user_id, deltas: dict, floors=None, assign=None):
+    """
+    Atomic `SET col = col + ?` update, e.g.
+    increment_user_fields(uid, {"mo_gold": -cost, "chaos_cores": 1})
+    increment_user_fields(uid, {"daily_xp_total": -n}, floors={"daily_xp_total": 0})
+    increment_user_fields(uid, {"xp_award": 500})  # overflows into elite_xp
+    """
+    increment_users_fields({user_id: deltas}, floors, {user_id: assign or {}})
+
+
+def spend_user_fields(user_id, costs: dict, gains=None, assign=None, append=None):
+    """
+    Guarded spend: takes every cost only if the balance covers it, in the same
+    UPDATE as the gains. Returns False (and changes nothing) otherwise, e.g.
+    if spend_user_fields(uid, {"elite_tokens": 50}, gains={"chaos_cores": 1}):
+    `append` adds a value to a JSON list column, and the spend also fails when
+    the value is already in it (one-per-day shop slots).
+    """
+    costs = {k: v for k, v in costs.items() if v}
+    deltas = dict(gains or {})
+    for k, v in costs.items():
+        deltas[k] = deltas.get(k, 0) - v
+    clause, vals = _increment_clause(deltas, assign=assign)
+    guard = "".join(f" AND {k} >= ?" for k in costs)
+    guard_vals = list(costs.values())
+    sets = [clause] if clause else []
+    for k, v in (append or {}).items():
+        sets.append(f"{k} = json_insert(COALESCE({k}, '[]'), '$[#]', ?)")
+        vals.append(v)
+        guard += f" AND NOT EXISTS (SELECT 1 FROM json_each(COALESCE({k}, '[]')) WHERE value = ?)"
+        guard_vals.append(v)
+    clause = ", ".join(sets)
+    if not clause:
+        return True
+    with get_connection() as conn:
+        cursor = conn.execute(
+            f"UPDATE users SET {clause} WHERE user_id = ?{guard}",
+            (*vals, user_id, *guard_vals),
+        )
+        conn.commit()
+    return cursor.rowcount == 1
+
+
+def increment_users_fields(batch: dict, floors=None, assign=None):
+    """Applies {user_id: deltas} for many users in one transaction."""
+    assign = assign or {}
+    with get_connection() as conn:
+        for user_id, deltas in batch.items():
+            clause, vals = _increment_clause(deltas, floors, assign.get(user_id))
+            if not clause:
+                continue
+            vals.append(user_id)
+            conn.execute(f"UPDATE users SET {clause} WHERE user_id = ?", vals)
+        conn.commit()
+
+
+def apply_user_deltas(deltas):
+    """
+    Applies merged write-behind deltas in one transaction, one UPDATE per user.
+    deltas: {user_id: {"xp": n, "add": {col: n}, "drain": {col: n}, "set": {col: v}}}
+    """
+    with get_connection() as conn:
+        for user_id, d in deltas.items():
+            inc = dict(d.get("add", {}))
+            floors = {}
+            for k, v in d.get("drain", {}).items():
+                inc[k] = inc.get(k, 0) - v
+                floors[k] = 0
+            inc["xp_award"] = d.get("xp", 0)
+            clause, vals = _increment_clause(
+                inc, floors, d.get("set"), with_prestige=True
+            )
+            if not clause:
+                continue
+            vals.append(user_id)
+            conn.execute(f"UPDATE users SET {clause} WHERE user_id = ?", vals)
+        conn.commit()
 
 
 def get_user_inventory(user_id):
@@ -678,6 +1369,111 @@ def get_user_inventory(user_id):
     return items
 
 
+ITEM_META_COLUMNS = (
+    "name",
+    "type",
+    "rarity",
+    "rarity_rank",
+    "gp_a",
+    "gp_b",
+    "gp_c",
+)
+
+# GP in SQL, same arithmetic as utils.get_item_gp.
+_ITEM_GP = "CAST(m.gp_a * (i.level * i.level) + m.gp_b * i.level + m.gp_c AS INTEGER)"
+
+INVENTORY_SORTS = {
+    "level_desc": "i.level DESC, gp DESC, i.instance_id",
+    "level_asc": "i.level, gp, i.instance_id",
+    "newest": "i.acquired_at DESC, i.instance_id",
+    "rarity": "m.rarity_rank DESC, i.instance_id",
+}
+
+
+def sync_item_meta(conn):
+    """Brings item_meta in line with game_data, writing only changed rows."""
+    wanted = {}
+    for item_id, d in game_data.ALL_ITEMS.items():
+        rarity = d.get("rarity", "Common")
+        wanted[item_id] = (
+            d["name"],
+            d["type"],
+            rarity,
+            game_data.RARITY_RANKS.get(rarity, 0),
+            *(float(x) for x in game_data.get_gp_curve(d["type"])),
+        )
+    have = {
+        r[0]: tuple(r[1:])
+        for r in conn.execute(
+            f"SELECT item_id, {', '.join(ITEM_META_COLUMNS)} FROM item_meta"
+        ).fetchall()
+    }
+    cols = ", ".join(ITEM_META_COLUMNS)
+    ph = ", ".join("?" * len(ITEM_META_COLUMNS))
+    for item_id, row in wanted.items():
+        if have.get(item_id) != row:
+            conn.execute(
+                f"INSERT OR REPLACE INTO item_meta (item_id, {cols}) VALUES (?, {ph})",
+                (item_id, *row),
+            )
+    for item_id in have.keys() - wanted.keys():
+        conn.execute("DELETE FROM item_meta WHERE item_id = ?", (item_id,))
+
+
+def _inventory_filter(user_id, types=(), modifiers=(), search=None):
+    where, params = ["i.user_id = ?"], [user_id]
+    if types:
+        where.append(f"m.type IN ({','.join('?' * len(types))})")
+        params += types
+    if modifiers:
+        match = " OR ".join("instr(i.modifier, ?) > 0" for _ in modifiers)
+        where.append(f"({match})")
+        params += modifiers
+    if search:
+        where.append(
+            "(instr(lower(m.name), ?) > 0 OR instr(lower(i.modifier), ?) > 0)"
+        )
+        params += [search.lower()] * 2
+    return " AND ".join(where), params
+
+
+def count_inventory(user_id, types=(), modifiers=(), search=None):
+    """(rows matching the filters, GP of the whole inventory) in one query."""
+    where, params = _inventory_filter(user_id, types, modifiers, search)
+    with get_connection() as conn:
+        row = conn.execute(
+            f"SELECT SUM(CASE WHEN {where} THEN 1 ELSE 0 END), SUM({_ITEM_GP}) FROM inventory i JOIN item_meta m ON m.item_id = i.item_id WHERE i.user_id = ?",
+            (*params, user_id),
+        ).fetchone()
+    return row[0] or 0, row[1] or 0
+
+
+def query_inventory(
+    user_id, types=(), modifiers=(), search=None, sort="level_desc", limit=25, offset=0
+):
+    """
+    One window of a user's inventory, filtered and sorted in SQL. Rows carry the
+    item's name, type, rarity and gp next to the inventory columns; items
+    without a game_data entry are left out.
+    """
+    where, params = _inventory_filter(user_id, types, modifiers, search)
+    with get_connection() as conn:
+        rows = conn.execute(
+            f"SELECT i.*, m.name, m.type, m.rarity, {_ITEM_GP} AS gp FROM inventory i JOIN item_meta m ON m.item_id = i.item_id WHERE {where} ORDER BY {INVENTORY_SORTS[sort]} LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_equipped_instance_ids(user_id):
+    """Instance ids sitting in any of the user's gear kits."""
+    with get_connection() as conn:
+        rows = conn.execute(
+            "SELECT instance_id FROM equipped_slots WHERE user_id = ?", (user_id,)
+        ).fetchall()
+    return {r[0] for r in rows}
+
+
 def get_item_instance(instance_id):
     conn = get_connection()
     item = conn.execute(
@@ -704,7 +1500,8 @@ def upgrade_item_level(instance_id, player_level, amount=1):
             (new_lvl, instance_id),
         )
         conn.commit()
-        return True
+    invalidate_instance(instance_id)
+    return True
 
 
 def add_item_to_inventory(user_id, item_id, modifier="Standard", level=1):
@@ -716,7 +1513,9 @@ def add_item_to_inventory(user_id, item_id, modifier="Standard", level=1):
         )
         new_id = cursor.lastrowid
         conn.commit()
-        return new_id
+    if item_id == "bunch_of_dice":
+        invalidate_kit(user_id)
+    return new_id
 
 
 def toggle_item_lock(instance_id, lock_state):
@@ -729,10 +1528,29 @@ def toggle_item_lock(instance_id, lock_state):
 
 
 def delete_inventory_item(instance_id):
-    unequip_from_all_slots(None, instance_id, ignore_user_check=True)
+    delete_inventory_items([instance_id])
+
+
+def delete_inventory_items(instance_ids):
+    """Unequips and deletes many items in a few statements (fusion, admin wipes)."""
+    instance_ids = list(dict.fromkeys(instance_ids))
+    owners = set()
     with get_connection() as conn:
-        conn.execute("DELETE FROM inventory WHERE instance_id = ?", (instance_id,))
+        for start in range(0, len(instance_ids), UNEQUIP_CHUNK):
+            chunk = instance_ids[start : start + UNEQUIP_CHUNK]
+            owners |= _unequip(conn, chunk)
+            ph = ",".join("?" * len(chunk))
+            owners |= {
+                r["user_id"]
+                for r in conn.execute(
+                    f"SELECT DISTINCT user_id FROM inventory WHERE instance_id IN ({ph}) AND item_id = 'bunch_of_dice'",
+                    chunk,
+                ).fetchall()
+            }
+            conn.execute(f"DELETE FROM inventory WHERE instance_id IN ({ph})", chunk)
         conn.commit()
+    for uid in owners:
+        invalidate_kit(uid)
 
 
 def remove_user_skin(user_id, skin_id):
@@ -748,43 +1566,74 @@ def remove_user_skin(user_id, skin_id):
         pass
 
 
+def sync_equipped(conn, user_id=None):
+    """Rebuilds equipped_slots from gear_kits for one user, or for everyone."""
+    if user_id is None:
+        conn.execute("DELETE FROM equipped_slots")
+        conn.execute(
+            f"INSERT INTO equipped_slots (kit_id, slot, instance_id, user_id) {_EQUIPPED_ROWS}"
+        )
+        return
+    conn.execute("DELETE FROM equipped_slots WHERE user_id = ?", (user_id,))
+    conn.execute(
+        f"INSERT INTO equipped_slots (kit_id, slot, instance_id, user_id) SELECT * FROM ({_EQUIPPED_ROWS}) WHERE user_id = ?",
+        (user_id,),
+    )
+
+
+def _unequip(conn, instance_ids, user_id=None):
+    """
+    Clears instance_ids from every kit slot holding them, found through
+    equipped_slots, and from the legacy loadouts row. Returns the kit owners.
+    """
+    ph = ",".join("?" * len(instance_ids))
+    where = f"instance_id IN ({ph})"
+    params = tuple(instance_ids)
+    if user_id is not None:
+        where += " AND user_id = ?"
+        params += (user_id,)
+    rows = conn.execute(
+        f"SELECT kit_id, slot, user_id FROM equipped_slots WHERE {where}", params
+    ).fetchall()
+
+    kits = {}
+    for r in rows:
+        kits.setdefault(r["kit_id"], []).append(r["slot"])
+    for kit_id, slots in kits.items():
+        cols = ", ".join(f"{slot} = NULL" for slot in slots)
+        conn.execute(f"UPDATE gear_kits SET {cols} WHERE kit_id = ?", (kit_id,))
+    if rows:
+        conn.execute(f"DELETE FROM equipped_slots WHERE {where}", params)
+
+    if user_id is not None:
+        owners = {user_id}
+    else:
+        owners = {
+            r["user_id"]
+            for r in conn.execute(
+                f"SELECT user_id FROM inventory WHERE instance_id IN ({ph})",
+                tuple(instance_ids),
+            ).fetchall()
+        }
+    cols = ", ".join(
+        f"{slot} = CASE WHEN {slot} IN ({ph}) THEN NULL ELSE {slot} END"
+        for slot in EQUIP_SLOTS
+    )
+    for owner in owners:
+        conn.execute(
+            f"UPDATE loadouts SET {cols} WHERE user_id = ?",
+            tuple(instance_ids) * len(EQUIP_SLOTS) + (owner,),
+        )
+    return {r["user_id"] for r in rows}
+
+
 def unequip_from_all_slots(user_id, instance_id, ignore_user_check=False):
     with get_connection() as conn:
-        id_slots = [
-            "weapon_id",
-            "gadget_1_id",
-            "gadget_2_id",
-            "gadget_3_id",
-            "passive_1_id",
-            "passive_2_id",
-            "passive_3_id",
-            "elite_module_id",
-            "ring_1_id",
-            "ring_2_id",
-            "ring_3_id",
-            "ride_id",
-        ]
-        for slot in id_slots:
-            sql = f"UPDATE gear_kits SET {slot} = NULL WHERE {slot} = ?"
-            if not ignore_user_check:
-                sql += " AND user_id = ?"
-                exec_params = (instance_id, user_id)
-            else:
-                exec_params = (instance_id,)
-            conn.execute(sql, exec_params)
-        if not ignore_user_check:
-            for slot in id_slots:
-                conn.execute(
-                    f"UPDATE loadouts SET {slot} = NULL WHERE user_id = ? AND {slot} = ?",
-                    (user_id, instance_id),
-                )
-        else:
-            for slot in id_slots:
-                conn.execute(
-                    f"UPDATE loadouts SET {slot} = NULL WHERE {slot} = ?",
-                    (instance_id,),
-                )
+        owners = _unequip(conn, [instance_id], None if ignore_user_check else user_id)
         conn.commit()
+    invalidate_instance(instance_id)
+    for uid in owners | ({user_id} if user_id is not None else set()):
+        invalidate_kit(uid)
 
 
 def get_snapshot(user_id):
@@ -820,7 +1669,22 @@ def backup_account(user_id):
         inv_list = [dict(x) for x in inv]
         kits_list = [dict(x) for x in kits]
 
-        full_data = {"user": user_dict, "inventory": inv_list, "kits": kits_list}
+        pedia_rows = {
+            table: [
+                dict(x)
+                for x in conn.execute(
+                    f"SELECT * FROM {table} WHERE user_id = ?", (user_id,)
+                ).fetchall()
+            ]
+            for table in PEDIA_TABLES
+        }
+
+        full_data = {
+            "user": user_dict,
+            "inventory": inv_list,
+            "kits": kits_list,
+            "pedia": pedia_rows,
+        }
 
         json_str = json.dumps(full_data)
         conn.execute(
@@ -837,7 +1701,10 @@ def wipe_account_for_mode(user_id):
     with get_connection() as conn:
         conn.execute("DELETE FROM inventory WHERE user_id = ?", (user_id,))
         conn.execute("DELETE FROM gear_kits WHERE user_id = ?", (user_id,))
+        conn.execute("DELETE FROM equipped_slots WHERE user_id = ?", (user_id,))
         conn.commit()
+    invalidate_kit(user_id)
+    forget_user(user_id)
 
 
 def restore_account(user_id):
@@ -873,9 +1740,23 @@ def restore_account(user_id):
             k_vals = list(kit.values())
             k_ph = ", ".join(["?"] * len(k_keys))
             conn.execute(f"INSERT INTO gear_kits ({k_cols}) VALUES ({k_ph})", k_vals)
+        sync_equipped(conn, user_id)
+
+        if "pedia" in snap:
+            for table in PEDIA_TABLES:
+                conn.execute(f"DELETE FROM {table} WHERE user_id = ?", (user_id,))
+                for row in snap["pedia"].get(table, []):
+                    r_cols = ", ".join(row.keys())
+                    r_ph = ", ".join(["?"] * len(row))
+                    conn.execute(
+                        f"INSERT INTO {table} ({r_cols}) VALUES ({r_ph})",
+                        list(row.values()),
+                    )
 
         conn.execute("DELETE FROM user_snapshots WHERE user_id = ?", (user_id,))
         conn.commit()
+    invalidate_kit(user_id)
+    forget_user(user_id)
 
     return True, "Account restored to LEGIT state."
 
@@ -938,6 +1819,7 @@ def inject_god_mode(user_id):
             (user_id, 1, "GOD KIT"),
         )
         conn.commit()
+    invalidate_kit(user_id)
 
 
 def inject_sandbox_mode(user_id):
@@ -1113,13 +1995,76 @@ def get_active_system_events():
     return events
 
 
+CONFIG_CACHE = {}
+_CONFIG_NUMBERS = {}
+_config_loaded = False
+_config_version = 0
+_config_checked_at = 0.0
+
+
+def seed_config_cache(configs):
+    """Replace the in-process system_config cache (shared with MoCoBot.config_cache)."""
+    global _config_loaded, _config_version
+    CONFIG_CACHE.clear()
+    CONFIG_CACHE.update(configs)
+    _CONFIG_NUMBERS.clear()
+    _config_loaded = True
+    _config_version = cache_version("config")
+    return CONFIG_CACHE
+
+
+def reload_config_cache():
+    global _config_version
+    version = cache_version("config")
+    with get_connection() as conn:
+        rows = conn.execute("SELECT key, value FROM system_config").fetchall()
+    seed_config_cache({r["key"]: r["value"] for r in rows})
+    _config_version = version
+    return CONFIG_CACHE
+
+
+def _check_config():
+    """
+    Loads the cache on first use, and reloads it when another shard changed
+    system_config (checked at most every CACHE_RECHECK seconds).
+    """
+    global _config_checked_at
+    if not _config_loaded:
+        reload_config_cache()
+        return
+    now = time.monotonic()
+    if now - _config_checked_at < config.CACHE_RECHECK:
+        return
+    _config_checked_at = now
+    if cache_version("config") != _config_version:
+        reload_config_cache()
+
+
+def cache_config_value(key, value):
+    _check_config()
+    CONFIG_CACHE[key] = str(value)
+    _CONFIG_NUMBERS.clear()
+
+
 def get_config(key, default=None):
-    conn = get_connection()
-    row = conn.execute(
-        "SELECT value FROM system_config WHERE key = ?", (key,)
-    ).fetchone()
-    conn.close()
-    return row[0] if row else default
+    _check_config()
+    return CONFIG_CACHE.get(key, default)
+
+
+def get_config_float(key, default=1.0):
+    """Numeric config lookup for hot paths (balance multipliers)."""
+    _check_config()
+    try:
+        return _CONFIG_NUMBERS[(key, default)]
+    except KeyError:
+        pass
+    raw = get_config(key)
+    try:
+        val = float(raw) if raw is not None else float(default)
+    except (TypeError, ValueError):
+        val = float(default)
+    _CONFIG_NUMBERS[(key, default)] = val
+    return val
 
 
 def set_config(key, value):
@@ -1129,6 +2074,8 @@ def set_config(key, value):
             (key, str(value)),
         )
         conn.commit()
+    cache_config_value(key, value)
+    bump_cache_version("config")
 
 
 def has_claimed_promo(user_id, code_key):
@@ -1295,9 +2242,23 @@ def run_raw_sql(query):
         cursor = conn.execute(query)
         conn.commit()
         try:
-            return cursor.fetchall(), cursor.rowcount
+            rows = cursor.fetchall()
         except:
-            return [], cursor.rowcount
+            rows = []
+        rowcount = cursor.rowcount
+        lowered = query.lower()
+        if "gear_kits" in lowered:
+            sync_equipped(conn)
+            conn.commit()
+        if "system_config" in lowered:
+            reload_config_cache()
+            bump_cache_version("config")
+        if any(t in lowered for t in KIT_TABLES):
+            invalidate_kit()
+            bump_cache_version("leaderboard")
+        if "users" in lowered or "gear_kits" in lowered:
+            forget_user()
+        return rows, rowcount
     except Exception as e:
         raise e
     finally:
@@ -5,7 +5,10 @@ import time
 import random
 import json
 from mo_co import config, database, utils, game_data
+from mo_co.entity_state import NO_STATUS
 from mo_co.rift_engine import RiftPlayer, RiftBot, RiftEntity, TICK_RATE
+from mo_co.game_clock import CLOCK
+from mo_co.render import RENDER
 
 AOE_WEAPONS = {
     "monster_slugger",
@@ -46,6 +49,7 @@ class DojoInstance:
             None,
         )
         self.grace_timer = 5
+        self.last_input = time.monotonic()
 
         self.difficulty = "Normal"
 
@@ -114,37 +118,59 @@ class DojoInstance:
             content=None, embed=self._build_embed(), view=DojoCombatView(self)
         )
 
-        while self.active:
-            if self.grace_timer > 0:
-                await asyncio.sleep(1.0)
-                self.grace_timer -= 1
-                if self.grace_timer == 0:
-                    self.start_time = time.time()
-            else:
-                await asyncio.sleep(TICK_RATE)
-                await self._tick()
-
-            if not self.active:
-                break
-            try:
-                await self.message.edit(
-                    embed=self._build_embed(), view=DojoCombatView(self)
-                )
-            except:
-                self.active = False
+        RENDER.register(
+            self.message.id,
+            self.message,
+            self._render,
+            lambda: 1.0 if self.grace_timer > 0 else TICK_RATE,
+            on_gone=self._on_message_gone,
+        )
+        CLOCK.register(
+            self.message.id,
+            self._clock_step,
+            lambda: 1.0 if self.grace_timer > 0 else TICK_RATE,
+            last_input=lambda: self.last_input,
+            on_stop=lambda: RENDER.unregister(self.message.id),
+            kind="dojo",
+        )
+
+    def _clock_step(self):
+        if not self.active:
+            return False
+        if self.grace_timer > 0:
+            self.grace_timer -= 1
+            if self.grace_timer == 0:
+                self.start_time = time.time()
+        else:
+            self._tick()
+        return self.active
+
+    def note_input(self):
+        self.last_input = time.monotonic()
 
-    async def _tick(self):
+    def _finish(self, success):
+        asyncio.create_task(self._end_game(success))
+
+    def _render(self):
+        if not self.active:
+            return None
+        return self._build_embed(), DojoCombatView(self)
+
+    def _on_message_gone(self):
+        self.active = False
+
+    def _tick(self):
         self.turn_count += 1
         elapsed = time.time() - self.start_time
         if elapsed >= DOJO_TIME_LIMIT:
             self.logs.append("⏰ **OUT OF TIME!**")
             self.active = False
-            await self._end_game(False)
+            self._finish(False)
             return
         if self.player.hp <= 0:
             self.logs.append("💀 **DEFEATED!**")
             self.active = False
-            await self._end_game(False)
+            self._finish(False)
             return
 
         if self.dojo_key == "dojo_helping_hands":
@@ -153,7 +179,7 @@ class DojoInstance:
                 self.logs.append("💀 **Companions fell! Boss Enraged!**")
                 self.player.take_damage(999999)
                 self.active = False
-                await self._end_game(False)
+                self._finish(False)
                 return
 
         if self.dojo_key == "dojo_taking_hits":
@@ -161,7 +187,7 @@ class DojoInstance:
             if not alive_jax:
                 self.logs.append("💀 **Jax fell! Mission Failed.**")
                 self.active = False
-                await self._end_game(False)
+                self._finish(False)
                 return
 
         self.player.is_dashing = False
@@ -174,7 +200,7 @@ class DojoInstance:
         if not self.mobs:
             self.logs.append("🏆 **VICTORY!**")
             self.active = False
-            await self._end_game(True)
+            self._finish(True)
             return
 
         for mob in self.mobs:
@@ -289,12 +315,8 @@ class DojoInstance:
                     rift_time=clear_time,
                 )
                 claimed_projects = cleared_projs
-            database.update_user_stats(
-                self.user_id,
-                {
-                    "xp": u_data["xp"] + 500,
-                    "chaos_cores": u_data["chaos_cores"] + 1,
-                },
+            database.increment_user_fields(
+                self.user_id, {"xp_award": 500, "chaos_cores": 1}
             )
         view = DojoSummaryView(self, success, clear_time, old_best, claimed_projects)
         await self.message.edit(embed=view.get_embed(), view=view)
@@ -321,6 +343,8 @@ class DojoInstance:
 
 
 class DojoPlayer(RiftPlayer):
+    __slots__ = ()
+
     def tick(self, instance):
         if instance.grace_timer > 0:
             self.tick_status()
@@ -563,6 +587,23 @@ class DojoPlayer(RiftPlayer):
 
 
 class DojoMob:
+    __slots__ = (
+        "name",
+        "icon",
+        "is_boss",
+        "is_swarm",
+        "unit_count",
+        "level",
+        "unit_hp",
+        "max_hp",
+        "hp",
+        "status_effects",
+        "stunned",
+        "stun_duration",
+        "state",
+        "ability_cd",
+    )
+
     def __init__(self, bot, mob_id, level, is_swarm=False, count=1, is_boss=False):
         from mo_co.rift_engine import RiftMob
 
@@ -592,7 +633,7 @@ class DojoMob:
             self.state,
         ) = (
             self.max_hp,
-            [],
+            NO_STATUS,
             False,
             0,
             "IDLE",
@@ -791,6 +832,7 @@ class DojoTargetSelect(Select):
 
     async def callback(self, i):
         self.view.instance.target_focus = self.values[0]
+        self.view.instance.note_input()
         await i.response.send_message(
             f"🎯 Targeted: **{self.values[0]}**", ephemeral=True
         )
@@ -818,6 +860,7 @@ class DojoActionButton(Button):
         if player.action_queue:
             return await i.response.send_message("❌ Already queued!", ephemeral=True)
         player.action_queue = self.action
+        self.view.instance.note_input()
         await i.response.defer()
 
 
@@ -840,4 +883,5 @@ class DojoGadgetButton(Button):
         if self.view.instance.player.action_queue:
             return await i.response.send_message("❌ Already queued!", ephemeral=True)
         self.view.instance.player.action_queue = f"GADGET_{self.index}"
+        self.view.instance.note_input()
         await i.response.defer()
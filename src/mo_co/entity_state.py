@@ -0,0 +1,101 @@
+"""
+Compact per-entity state shared by the hunt, rift and dojo engines.
+
+Combat entities are created by the thousand: one set per hunt fight, plus
+every rift wave and summon. Their state avoids per-instance dicts wherever a
+fixed layout works:
+
+- StatMults is a slotted record that is still indexed like the old dict
+  (stat_mults["dmg"] += 0.3).
+- Status effects are slotted records. Entities without effects share the
+  empty NO_STATUS tuple, and the effect list is only rebuilt when an effect
+  expires.
+- Item and source ids read from the database are interned, so every entity
+  shares a single string per id.
+"""
+
+import sys
+
+
+NO_STATUS = ()
+
+
+class StatMults:
+    __slots__ = (
+        "dmg",
+        "heal",
+        "hp",
+        "cd",
+        "crit",
+        "weapon_crit",
+        "gadget_crit",
+        "passive_crit",
+        "heal_crit",
+        "pet_crit",
+        "pet_dmg",
+        "executioner",
+    )
+
+    def __init__(self):
+        self.dmg = 1.0
+        self.heal = 1.0
+        self.hp = 1.0
+        self.cd = 1.0
+        self.crit = 0.0
+        self.weapon_crit = 0.0
+        self.gadget_crit = 0.0
+        self.passive_crit = 0.0
+        self.heal_crit = 0.0
+        self.pet_crit = 0.0
+        self.pet_dmg = 1.0
+        self.executioner = 1.0
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={getattr(self, k)}" for k in self.__slots__)
+        return f"StatMults({fields})"
+
+
+class StatusEffect:
+    __slots__ = ("type", "duration", "icon")
+
+    def __init__(self, s_type, duration, icon):
+        self.type = s_type
+        self.duration = duration
+        self.icon = icon
+
+
+def add_status(effects, s_type, duration, icon):
+    """Apply s_type (refreshing a running effect) and return the effect list."""
+    for s in effects:
+        if s.type == s_type:
+            s.duration = max(s.duration, duration)
+            return effects
+    if not effects:
+        return [StatusEffect(s_type, duration, icon)]
+    effects.append(StatusEffect(s_type, duration, icon))
+    return effects
+
+
+def has_status(effects, s_type):
+    for s in effects:
+        if s.type == s_type:
+            return True
+    return False
+
+
+def prune(effects):
+    """Drop expired effects, allocating only when something expired."""
+    for s in effects:
+        if s.duration <= 0:
+            return [s for s in effects if s.duration > 0] or NO_STATUS
+    return effects
+
+
+def intern_id(value):
+    return sys.intern(value) if isinstance(value, str) else value
@@ -0,0 +1,164 @@
+"""
+Shared game clock for rift and dojo instances.
+
+Running instances register a synchronous step function here instead of each
+owning a `while self.active: await asyncio.sleep(TICK_RATE)` coroutine. A
+single loop wakes every PASS_INTERVAL and steps every instance whose tick is
+due:
+
+- Due instances run oldest-first, with active ones ahead of idle ones.
+- A pass stops once GAME_CLOCK_BUDGET seconds of work are spent. Whatever is
+  left over runs first on the next pass and is counted as deferred.
+- An instance with no player input for GAME_CLOCK_IDLE_AFTER seconds ticks
+  GAME_CLOCK_IDLE_SLOWDOWN times slower.
+
+stats keeps per-pass wall time, tick counts and overruns. Each tick's duration
+is recorded in mo_co.metrics under the session's kind.
+"""
+
+import asyncio
+import time
+from collections import deque
+from mo_co import config
+from mo_co.metrics import METRICS
+
+
+PASS_INTERVAL = 0.25
+
+
+class ClockSession:
+    __slots__ = (
+        "key",
+        "kind",
+        "step",
+        "interval",
+        "last_input",
+        "on_stop",
+        "due",
+        "idle",
+    )
+
+    def __init__(self, key, kind, step, interval, last_input, on_stop):
+        self.key = key
+        self.kind = kind
+        self.step = step
+        self.interval = interval
+        self.last_input = last_input
+        self.on_stop = on_stop
+        self.due = 0.0
+        self.idle = False
+
+    def seconds(self):
+        return self.interval() if callable(self.interval) else self.interval
+
+
+class GameClock:
+    def __init__(self, budget, idle_after, idle_slowdown):
+        self.budget = budget
+        self.idle_after = idle_after
+        self.idle_slowdown = idle_slowdown
+        self._sessions = {}
+        self._task = None
+        self.pass_times = deque(maxlen=256)
+        self.stats = {
+            "passes": 0,
+            "ticks": 0,
+            "idle_ticks": 0,
+            "overruns": 0,
+            "deferred": 0,
+            "errors": 0,
+            "max_pass_ms": 0.0,
+        }
+
+    def register(
+        self, key, step, interval, last_input=None, on_stop=None, kind="game"
+    ):
+        """
+        Call step() once per `interval` seconds (a number or a callable).
+
+        step() advances the instance by one tick and returns False once it has
+        finished; on_stop() then runs once. last_input() returns the
+        time.monotonic() of the latest player action, for idle detection.
+        """
+        session = ClockSession(key, kind, step, interval, last_input, on_stop)
+        session.due = time.monotonic() + session.seconds()
+        self._sessions[key] = session
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def unregister(self, key):
+        session = self._sessions.pop(key, None)
+        if session and session.on_stop:
+            try:
+                session.on_stop()
+            except Exception as e:
+                self.stats["errors"] += 1
+                print(f"Game Clock Error ({key}): {e}")
+
+    def __len__(self):
+        return len(self._sessions)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(PASS_INTERVAL)
+            self._pass(time.monotonic())
+
+    def _pass(self, now):
+        started = time.perf_counter()
+        due = []
+        for s in list(self._sessions.values()):
+            if s.due > now:
+                continue
+            try:
+                s.idle = s.last_input is not None and (
+                    now - s.last_input() > self.idle_after
+                )
+            except Exception as e:
+                self.stats["errors"] += 1
+                print(f"Game Clock Error ({s.key}): {e}")
+                if self._sessions.get(s.key) is s:
+                    self.unregister(s.key)
+                continue
+            due.append(s)
+        due.sort(key=lambda s: (s.idle, s.due))
+
+        for i, session in enumerate(due):
+            if time.perf_counter() - started >= self.budget:
+                self.stats["overruns"] += 1
+                self.stats["deferred"] += len(due) - i
+                break
+            self._step(session, now)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.pass_times.append(elapsed_ms)
+        self.stats["passes"] += 1
+        self.stats["max_pass_ms"] = max(self.stats["max_pass_ms"], elapsed_ms)
+
+    def _step(self, session, now):
+        started = time.perf_counter()
+        try:
+            running = session.step()
+            if running:
+                interval = session.seconds()
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"Game Clock Error ({session.key}): {e}")
+            running = False
+        METRICS.observe("tick", session.kind, time.perf_counter() - started)
+        self.stats["ticks"] += 1
+        if session.idle:
+            self.stats["idle_ticks"] += 1
+        if not running:
+            if self._sessions.get(session.key) is session:
+                self.unregister(session.key)
+            return
+        if session.idle:
+            interval *= self.idle_slowdown
+        session.due = now + interval
+
+
+CLOCK = GameClock(
+    config.GAME_CLOCK_BUDGET,
+    config.GAME_CLOCK_IDLE_AFTER,
+    config.GAME_CLOCK_IDLE_SLOWDOWN,
+)
@@ -1,4 +1,10 @@
-from .items import ALL_ITEMS, get_item, CLASSIC_COLLECTION_BOX
+from .items import (
+    ALL_ITEMS,
+    get_item,
+    CLASSIC_COLLECTION_BOX,
+    RARITY_RANKS,
+    get_gp_curve,
+)
 from .worlds import (
     WORLDS,
     RIFTS,
@@ -9,8 +15,13 @@ from .worlds import (
     ELITE_POOL_50,
     MONSTER_REGISTRY,
     WORLD_POOLS,
+    WORLDS_BY_ID,
+    CORRUPTED_WORLD_IDS,
+    MONSTER_POOLS,
     get_world,
     get_monsters_for_world,
+    get_monster_pool,
+    is_boss_monster,
 )
 from .projects import PROJECTS
 from .jobs import JOB_TEMPLATES
@@ -21,6 +32,8 @@ __all__ = [
     "ALL_ITEMS",
     "get_item",
     "CLASSIC_COLLECTION_BOX",
+    "RARITY_RANKS",
+    "get_gp_curve",
     "WORLDS",
     "RIFTS",
     "RIFT_SETS",
@@ -30,8 +43,13 @@ __all__ = [
     "ELITE_POOL_50",
     "MONSTER_REGISTRY",
     "WORLD_POOLS",
+    "WORLDS_BY_ID",
+    "CORRUPTED_WORLD_IDS",
+    "MONSTER_POOLS",
     "get_world",
     "get_monsters_for_world",
+    "get_monster_pool",
+    "is_boss_monster",
     "PROJECTS",
     "JOB_TEMPLATES",
     "MISSIONS",
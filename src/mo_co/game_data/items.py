@@ -838,3 +838,21 @@ build_registry(RIDE_ENTRIES, "ride")
 
 def get_item(item_id):
     return ALL_ITEMS.get(item_id)
+
+
+# Gear Power by item type: int(a * level**2 + b * level + c). Shared by
+# utils.get_item_gp and the item_meta table the inventory queries join.
+GP_CURVES = {
+    "weapon": (1.25, 3.0, 10),
+    "gadget": (0.4, 1.5, 20),
+    "passive": (0.4, 1.5, 20),
+    "smart_ring": (0, 13, 172),
+    "ride": (0, 0, 0),
+}
+DEFAULT_GP_CURVE = (0, 10, 0)
+
+RARITY_RANKS = {"Legendary": 4, "Epic": 3, "Rare": 2, "Common": 1}
+
+
+def get_gp_curve(item_type):
+    return GP_CURVES.get(item_type, DEFAULT_GP_CURVE)
@@ -30,8 +30,8 @@ def get_status_duration(item_id):
 
 
 def get_weapon_damage(item_id, level):
-    global_mult = database.get_config("global_damage_mult", 1.0)
-    item_mult = database.get_config(f"mult_{item_id}", 1.0)
+    global_mult = database.get_config_float("global_damage_mult", 1.0)
+    item_mult = database.get_config_float(f"mult_{item_id}", 1.0)
     final_mult = global_mult * item_mult
 
     base = 250
@@ -73,8 +73,8 @@ def get_weapon_damage(item_id, level):
 
 
 def get_gadget_value(item_id, level):
-    global_mult = database.get_config("global_damage_mult", 1.0)
-    item_mult = database.get_config(f"mult_{item_id}", 1.0)
+    global_mult = database.get_config_float("global_damage_mult", 1.0)
+    item_mult = database.get_config_float(f"mult_{item_id}", 1.0)
     final_mult = global_mult * item_mult
 
     val = 100
@@ -113,7 +113,7 @@ def get_gadget_value(item_id, level):
 
 
 def get_passive_value(item_id, level):
-    d_mult = database.get_config("global_damage_mult", 1.0)
+    d_mult = database.get_config_float("global_damage_mult", 1.0)
     if item_id == "healthy_snacks":
         return 50 + (level * 10)
     if item_id == "vampire_teeth":
@@ -153,7 +153,7 @@ def get_passive_value(item_id, level):
 
 
 def get_summon_stats(summon_id, level):
-    d_mult = database.get_config("global_damage_mult", 1.0)
+    d_mult = database.get_config_float("global_damage_mult", 1.0)
     if summon_id == "wolf":
         return (600 + (level * 50), int((120 + (level * 10)) * d_mult))
     if summon_id == "bee":
@@ -167,6 +167,34 @@ def get_summon_stats(summon_id, level):
     return (500, 50)
 
 
+def get_hunt_monster_stats(
+    level, modifier, is_boss, player_gp, recommended_gp, allies=0
+):
+    """(monster hp, monster attack, player attack scale) for a hunt encounter."""
+    atk_mult, hp_mult = 1.0, 1.0
+    if "Megacharged" in modifier or "Chaos" in modifier:
+        if "Megacharged" in modifier:
+            atk_mult, hp_mult = 2.5, 1.8
+        else:
+            atk_mult = 1.2
+    elif "Overcharged" in modifier:
+        atk_mult, hp_mult = 1.5, 1.3
+
+    player_scale = 1.0
+    gp_deficit = recommended_gp - player_gp
+    if gp_deficit > 0:
+        atk_mult *= 1.0 + (gp_deficit / recommended_gp) * 4
+        player_scale = recommended_gp / (recommended_gp + gp_deficit)
+    else:
+        atk_mult *= max(0.5, 1.0 - (abs(gp_deficit) / (recommended_gp * 2.0)))
+
+    hp = int((1200 + (level * 150) + (level**2) * 4) * hp_mult * (1.0 + allies * 0.3))
+    if is_boss:
+        hp *= 2.5
+        atk_mult *= 1.5
+    return hp, int(level * 8 * atk_mult), player_scale
+
+
 def get_ring_stats(item_id, level):
 
     idx = min(2, max(0, level - 1))
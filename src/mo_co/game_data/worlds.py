@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from mo_co import config
 
 WORLDS = [
@@ -633,12 +634,16 @@ ELITE_POOL_50 = [
 ]
 
 
+WORLDS_BY_ID = {}
+for _w in WORLDS + ELITE_POOL_30 + ELITE_POOL_50:
+    WORLDS_BY_ID.setdefault(_w["id"], _w)
+WORLDS_BY_ID = MappingProxyType(WORLDS_BY_ID)
+
+CORRUPTED_WORLD_IDS = frozenset(w["id"] for w in ELITE_POOL_30 + ELITE_POOL_50)
+
+
 def get_world(world_id):
-    all_worlds = WORLDS + ELITE_POOL_30 + ELITE_POOL_50
-    for w in all_worlds:
-        if w["id"] == world_id:
-            return w
-    return None
+    return WORLDS_BY_ID.get(world_id)
 
 
 MONSTER_REGISTRY = [
@@ -717,7 +722,18 @@ WORLD_SPECIFIC_POOLS = {
 }
 
 
-def get_monsters_for_world(world_id, world_type):
+NAMED_BOSSES = frozenset(["Overlord", "Bug Lord", "Smasher", "Big Papa", "Draymor"])
+
+
+def is_boss_monster(monster_id):
+    return (
+        "boss" in monster_id
+        or "Guardian" in monster_id
+        or monster_id in NAMED_BOSSES
+    )
+
+
+def _pool_members(world_id, world_type):
     pool_prefixes = WORLD_SPECIFIC_POOLS.get(world_id) or WORLD_POOLS.get(
         world_type, ["d_"]
     )
@@ -735,4 +751,58 @@ def get_monsters_for_world(world_id, world_type):
     if w_def and w_def.get("unlock_lvl", 1) >= 33:
         eligible.append("Draymor")
 
-    return list(set(eligible))
+    return tuple(dict.fromkeys(eligible))
+
+
+class MonsterPool:
+    """Spawn pool of one (world_id, world_type), pre-split into mobs and bosses."""
+
+    __slots__ = ("members", "mobs", "bosses", "population", "elevated", "_cum")
+
+    MOB_WEIGHT = 10
+
+    def __init__(self, members):
+        self.members = frozenset(members)
+        self.bosses = tuple(m for m in members if is_boss_monster(m))
+        self.mobs = tuple(m for m in members if m not in self.bosses)
+        self.population = self.mobs + self.bosses
+        self.elevated = frozenset(
+            m for m in members if m in self.bosses or m.startswith("chaos_")
+        )
+        self._cum = {}
+
+    def __contains__(self, monster_id):
+        return monster_id in self.members
+
+    def cum_weights(self, active_players):
+        """Cumulative weights for random.choices; bosses get 1 + 2 per hunter."""
+        cum = self._cum.get(active_players)
+        if cum is None:
+            boss_weight = 1 + (active_players * 2)
+            n_mobs = len(self.mobs)
+            cum = tuple(
+                self.MOB_WEIGHT * min(i + 1, n_mobs)
+                + boss_weight * max(0, i + 1 - n_mobs)
+                for i in range(len(self.population))
+            )
+            self._cum[active_players] = cum
+        return cum
+
+
+MONSTER_POOLS = {}
+for _w in WORLDS_BY_ID.values():
+    MONSTER_POOLS[(_w["id"], _w["type"])] = MonsterPool(
+        _pool_members(_w["id"], _w["type"])
+    )
+
+
+def get_monster_pool(world_id, world_type):
+    pool = MONSTER_POOLS.get((world_id, world_type))
+    if pool is None:
+        pool = MonsterPool(_pool_members(world_id, world_type))
+        MONSTER_POOLS[(world_id, world_type)] = pool
+    return pool
+
+
+def get_monsters_for_world(world_id, world_type):
+    return list(get_monster_pool(world_id, world_type).members)
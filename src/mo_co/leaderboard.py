@@ -0,0 +1,122 @@
+"""
+Materialized leaderboard.
+
+Rankings are rebuilt from one set-based read every LEADERBOARD_REFRESH seconds
+(on the DB reader pool) and kept pre-sorted in memory, so opening /leaderboard
+or the elite leaderboard costs no queries at all. Account deletions and admin
+edits publish a "leaderboard" cache version; every shard rebuilds early, within
+CACHE_RECHECK seconds, when it changes.
+"""
+
+import asyncio
+import threading
+import time
+from mo_co import config, database, utils, async_db, levels
+
+
+class LeaderboardCache:
+    def __init__(self, interval, size):
+        self.interval = interval
+        self.size = size
+        self.built_at = 0
+        self.build_ms = 0
+        self._ranked = {"Level": [], "Gear Power": [], "Elite": []}
+        self._lock = threading.Lock()
+        self._task = None
+
+    def rebuild(self):
+        started = time.perf_counter()
+        users, equipped = database.get_leaderboard_snapshot()
+
+        gp = {}
+        for r in equipped:
+            gp[r["user_id"]] = gp.get(r["user_id"], 0) + utils.get_item_gp(
+                r["item_id"], r["level"]
+            )
+
+        base_levels = levels.levels_for(u["xp"] for u in users)
+
+        legit, elite = [], []
+        for u, lvl in zip(users, base_levels):
+            uid = u["user_id"]
+            if u["is_elite"]:
+                elite.append(
+                    {
+                        "user_id": uid,
+                        "elite_tokens": u["elite_tokens"] or 0,
+                        "elite_xp": u["elite_xp"] or 0,
+                        "xp": u["xp"],
+                    }
+                )
+            if u["account_state"] != "LEGIT":
+                continue
+
+            if u["is_elite"] and lvl >= 50:
+                e_lvl, _, _ = levels.elite_level_info(u["elite_xp"])
+                sort_metric = u["xp"] + u["elite_xp"]
+                emblem = config.ELITE_EMBLEM
+                lvl_disp = f"Elite {e_lvl}"
+            else:
+                sort_metric = u["xp"]
+                emblem = utils.get_emblem(lvl)
+                lvl_disp = f"{lvl}"
+
+            legit.append(
+                {
+                    "id": uid,
+                    "name": u["display_name"] or f"Hunter#{str(uid)[-4:]}",
+                    "xp": sort_metric,
+                    "lvl": lvl_disp,
+                    "gp": gp.get(uid, 0),
+                    "emblem": emblem,
+                }
+            )
+
+        ranked = {
+            "Level": sorted(legit, key=lambda x: x["xp"], reverse=True)[: self.size],
+            "Gear Power": sorted(legit, key=lambda x: x["gp"], reverse=True)[
+                : self.size
+            ],
+            "Elite": sorted(elite, key=lambda x: x["elite_tokens"], reverse=True)[
+                : self.size
+            ],
+        }
+        with self._lock:
+            self._ranked = ranked
+            self.built_at = time.time()
+            self.build_ms = round((time.perf_counter() - started) * 1000, 1)
+        return len(legit)
+
+    def ranked(self, category, limit=None):
+        """
+        Pre-sorted rows for `category` ("Level", "Gear Power" or "Elite").
+        Empty until the first background build finishes; never builds inline.
+        """
+        if not self.built_at:
+            try:
+                self.start()
+            except RuntimeError:
+                pass
+        with self._lock:
+            rows = self._ranked.get(category, [])
+        return list(rows[:limit] if limit else rows)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        while True:
+            seen = database.cache_version("leaderboard")
+            try:
+                await async_db.call_read(self.rebuild)
+            except Exception as e:
+                print(f"Leaderboard rebuild failed: {e}")
+            due = time.monotonic() + self.interval
+            while time.monotonic() < due:
+                await asyncio.sleep(min(config.CACHE_RECHECK, self.interval))
+                if database.cache_version("leaderboard") != seen:
+                    break
+
+
+LEADERBOARD = LeaderboardCache(config.LEADERBOARD_REFRESH, config.LEADERBOARD_SIZE)
@@ -0,0 +1,62 @@
+"""
+Level curves precomputed from config.LEVEL_DATA / config.ELITE_LEVEL_MAP.
+
+Built once at import; lookups are a bisect over the cumulative XP tables
+instead of a walk over the level list.
+"""
+
+from bisect import bisect_right
+from mo_co import config
+
+
+LEVEL_COSTS = tuple(e["xp_cost"] for e in config.LEVEL_DATA)
+LEVEL_NUMBERS = tuple(e["lvl"] for e in config.LEVEL_DATA)
+
+LEVEL_STARTS = []
+LEVEL_ENDS = []
+_total = 0
+for _cost in LEVEL_COSTS:
+    LEVEL_STARTS.append(_total)
+    _total += _cost
+    LEVEL_ENDS.append(_total)
+LEVEL_STARTS = tuple(LEVEL_STARTS)
+LEVEL_ENDS = tuple(LEVEL_ENDS)
+
+MAX_BASE_XP = _total
+MAX_LEVEL = LEVEL_NUMBERS[-1]
+
+LEVEL_HP = {e["lvl"]: e["hp"] for e in config.LEVEL_DATA}
+LEVEL_REWARDS = {e["lvl"]: e.get("reward", "kit") for e in config.LEVEL_DATA}
+
+ELITE_THRESHOLDS = tuple(xp for _, xp in config.ELITE_LEVEL_MAP[1:])
+ELITE_MAX_LEVEL = config.ELITE_LEVEL_MAP[-1][0]
+
+
+def level_info(total_xp):
+    """(level, cost of that level, progress into it)"""
+    i = bisect_right(LEVEL_ENDS, total_xp)
+    if i == len(LEVEL_ENDS):
+        return MAX_LEVEL, 0, 0
+    return LEVEL_NUMBERS[i], LEVEL_COSTS[i], total_xp - LEVEL_STARTS[i]
+
+
+def elite_level_info(elite_xp):
+    i = bisect_right(ELITE_THRESHOLDS, elite_xp)
+    if i == len(ELITE_THRESHOLDS):
+        return ELITE_MAX_LEVEL, 0, 0
+    curr_lvl, curr_xp = config.ELITE_LEVEL_MAP[i]
+    next_lvl, next_xp = config.ELITE_LEVEL_MAP[i + 1]
+    xp_per_lvl = (next_xp - curr_xp) / (next_lvl - curr_lvl)
+    xp_in_range = elite_xp - curr_xp
+    return (
+        curr_lvl + int(xp_in_range // xp_per_lvl),
+        int(xp_per_lvl),
+        int(xp_in_range % xp_per_lvl),
+    )
+
+
+def levels_for(xp_values):
+    """Levels for a whole column of XP values (leaderboards, admin lists)."""
+    ends, numbers, last = LEVEL_ENDS, LEVEL_NUMBERS, len(LEVEL_ENDS)
+    indices = [bisect_right(ends, xp) for xp in xp_values]
+    return [numbers[i] if i < last else MAX_LEVEL for i in indices]
@@ -0,0 +1,202 @@
+"""
+Process-wide timing histograms and counters.
+
+    with track_interaction("command", "hunt"):
+        ...
+    METRICS.observe("tick", "rift", seconds)
+
+The following are recorded:
+- Slash commands, component and modal callbacks: timed by the hooks that
+  MoCoBot installs.
+- Database statements: timed by database.PooledConnection. Each statement is
+  also charged to the interaction that ran it, through a context variable
+  that async_db copies into its executor threads.
+- Game clock ticks and render passes.
+
+Histograms use fixed buckets, so recording allocates nothing. Other modules'
+live stats (loop lag, pool, clock, render) are added with add_source(). Call
+render_prometheus() to get everything in Prometheus text format; keep_alive
+serves it at /metrics.
+"""
+
+import asyncio
+import bisect
+import contextvars
+import cProfile
+import io
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total * 1000 / self.count, 2) if self.count else 0,
+            "max_ms": round(self.max * 1000, 2),
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._sources = {}
+
+    def observe(self, family, label, seconds):
+        with self._lock:
+            hist = self._histograms.get((family, label))
+            if hist is None:
+                hist = self._histograms[(family, label)] = Histogram()
+            hist.observe(seconds)
+
+    def count(self, family, label, amount=1):
+        with self._lock:
+            key = (family, label)
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def add_source(self, name, fn):
+        """Export fn()'s numeric values as gauges named moco_<name>_<key>."""
+        self._sources[name] = fn
+
+    def _read_sources(self):
+        data = {}
+        for name, fn in list(self._sources.items()):
+            try:
+                values = fn()
+            except Exception as e:
+                print(f"Metrics Source Error ({name}): {e}")
+                continue
+            data[name] = {
+                k: v
+                for k, v in values.items()
+                if isinstance(v, (int, float)) and not isinstance(v, bool)
+            }
+        return data
+
+    def snapshot(self):
+        with self._lock:
+            histograms = {}
+            for (family, label), hist in sorted(self._histograms.items()):
+                histograms.setdefault(family, {})[label] = hist.summary()
+            counters = {}
+            for (family, label), value in sorted(self._counters.items()):
+                counters.setdefault(family, {})[label] = value
+        return {
+            "histograms": histograms,
+            "counters": counters,
+            "sources": self._read_sources(),
+        }
+
+    def render_prometheus(self):
+        lines = []
+        with self._lock:
+            histograms = sorted(
+                (k, list(h.counts), h.count, h.total)
+                for k, h in self._histograms.items()
+            )
+            counters = sorted(self._counters.items())
+
+        declared = set()
+        for (family, label), counts, count, total in histograms:
+            name = f"moco_{family}_seconds"
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            running = 0
+            for bound, hits in zip(BUCKETS, counts):
+                running += hits
+                lines.append(f'{name}_bucket{{name="{label}",le="{bound}"}} {running}')
+            lines.append(f'{name}_bucket{{name="{label}",le="+Inf"}} {count}')
+            lines.append(f'{name}_sum{{name="{label}"}} {total:.6f}')
+            lines.append(f'{name}_count{{name="{label}"}} {count}')
+
+        for (family, label), value in counters:
+            name = f"moco_{family}_total"
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f'{name}{{name="{label}"}} {value}')
+
+        for source, values in self._read_sources().items():
+            for key, value in sorted(values.items()):
+                lines.append(f"# TYPE moco_{source}_{key} gauge")
+                lines.append(f"moco_{source}_{key} {value}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
+
+
+class InteractionScope:
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+_SCOPE = contextvars.ContextVar("moco_interaction_scope", default=None)
+
+
+def record_query(sql, seconds):
+    verb = sql.split(None, 1)[0].upper() if sql.strip() else "EMPTY"
+    METRICS.observe("db_query", verb, seconds)
+    scope = _SCOPE.get()
+    if scope is not None:
+        with METRICS._lock:
+            scope.queries += 1
+            scope.db_seconds += seconds
+
+
+@contextmanager
+def track_interaction(kind, name):
+    """Time one interaction handler and the database work it causes."""
+    scope = InteractionScope()
+    token = _SCOPE.set(scope)
+    started = time.perf_counter()
+    try:
+        yield scope
+    finally:
+        _SCOPE.reset(token)
+        METRICS.observe(kind, name, time.perf_counter() - started)
+        METRICS.observe(f"{kind}_db", name, scope.db_seconds)
+        METRICS.count(f"{kind}_db_queries", name, scope.queries)
+
+
+_profile_lock = asyncio.Lock()
+
+
+async def profile_loop(seconds, sort="cumulative", limit=40):
+    """cProfile the event loop thread for `seconds` and return the report."""
+    async with _profile_lock:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(limit)
+    return out.getvalue()
@@ -0,0 +1,222 @@
+"""
+Versioned schema migrations.
+
+init_db() creates the base tables; every change after that is a numbered step
+in MIGRATIONS. The schema_version table keeps one row per applied step, and
+migrate() runs the steps above the highest one, in order, committing after
+each.
+
+Steps only use execute() and commit(), so they run the same on local SQLite
+and on Turso (libsql). Each step is also safe to re-run against a database
+that already has its change: columns are checked with PRAGMA table_info and
+indexes use IF NOT EXISTS. That covers databases created before this table
+existed, and shards that start at the same moment.
+"""
+
+
+def _columns(conn, table):
+    return {r[1] for r in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+
+
+def add_column(table, column, decl):
+    def step(conn):
+        if column not in _columns(conn, table):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+    return step
+
+
+def create_indexes(*indexes):
+    def step(conn):
+        for name, table, columns in indexes:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+
+    return step
+
+
+def create_equipped_slots(conn):
+    # Kept self-contained (its own slot list) so the step never changes later.
+    slots = (
+        "weapon_id",
+        "gadget_1_id",
+        "gadget_2_id",
+        "gadget_3_id",
+        "passive_1_id",
+        "passive_2_id",
+        "passive_3_id",
+        "elite_module_id",
+        "ring_1_id",
+        "ring_2_id",
+        "ring_3_id",
+        "ride_id",
+    )
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS equipped_slots (
+        kit_id INTEGER,
+        slot TEXT,
+        instance_id INTEGER,
+        user_id INTEGER,
+        PRIMARY KEY (kit_id, slot)
+    )"""
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_equipped_instance ON equipped_slots (instance_id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_equipped_user ON equipped_slots (user_id)"
+    )
+    for slot in slots:
+        conn.execute(
+            f"INSERT OR REPLACE INTO equipped_slots (kit_id, slot, instance_id, user_id) SELECT kit_id, '{slot}', {slot}, user_id FROM gear_kits WHERE {slot} IS NOT NULL"
+        )
+
+
+def create_pedia_tables(conn):
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS pedia_monsters (
+        user_id INTEGER,
+        monster_id TEXT,
+        k INTEGER DEFAULT 0,
+        oc INTEGER DEFAULT 0,
+        ch INTEGER DEFAULT 0,
+        mg INTEGER DEFAULT 0,
+        d INTEGER DEFAULT 0,
+        cl TEXT DEFAULT '[]',
+        PRIMARY KEY (user_id, monster_id)
+    )"""
+    )
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS pedia_gear (
+        user_id INTEGER,
+        item_id TEXT,
+        shop INTEGER DEFAULT 0,
+        l50 INTEGER DEFAULT 0,
+        cl TEXT DEFAULT '[]',
+        PRIMARY KEY (user_id, item_id)
+    )"""
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pedia_gear_mods (user_id INTEGER, item_id TEXT, modifier TEXT, PRIMARY KEY (user_id, item_id, modifier))"
+    )
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS pedia_worlds (
+        user_id INTEGER,
+        world_id TEXT,
+        v INTEGER DEFAULT 0,
+        c INTEGER DEFAULT 0,
+        h INTEGER DEFAULT 0,
+        corr INTEGER DEFAULT 0,
+        cl TEXT DEFAULT '[]',
+        PRIMARY KEY (user_id, world_id)
+    )"""
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pedia_skins (user_id INTEGER, skin_id TEXT, app INTEGER DEFAULT 0, cl TEXT DEFAULT '[]', PRIMARY KEY (user_id, skin_id))"
+    )
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS pedia_archive (
+        log_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        ts INTEGER,
+        src TEXT,
+        res TEXT,
+        rar TEXT
+    )"""
+    )
+
+
+def create_item_meta(conn):
+    # Rows come from game_data on every start (database.sync_item_meta).
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS item_meta (
+        item_id TEXT PRIMARY KEY,
+        name TEXT,
+        type TEXT,
+        rarity TEXT,
+        rarity_rank INTEGER,
+        gp_a REAL,
+        gp_b REAL,
+        gp_c REAL
+    )"""
+    )
+
+
+MIGRATIONS = [
+    (1, "users.display_name", add_column("users", "display_name", "TEXT")),
+    (
+        2,
+        "users.active_kit_index",
+        add_column("users", "active_kit_index", "INTEGER DEFAULT 1"),
+    ),
+    (
+        3,
+        "users.cool_zone_rules_accepted",
+        add_column("users", "cool_zone_rules_accepted", "BOOLEAN DEFAULT 0"),
+    ),
+    (
+        4,
+        "shop_state.elite_shop_item",
+        add_column("shop_state", "elite_shop_item", "TEXT"),
+    ),
+    (
+        5,
+        "shop_state.elite_refreshes_at",
+        add_column("shop_state", "elite_refreshes_at", "TEXT"),
+    ),
+    (
+        6,
+        "users.account_state",
+        add_column("users", "account_state", "TEXT DEFAULT 'LEGIT'"),
+    ),
+    (
+        7,
+        "hot path indexes",
+        create_indexes(
+            ("idx_inventory_user", "inventory", "user_id, item_id"),
+            ("idx_inbox_user", "inbox_messages", "user_id, is_claimed, sent_at"),
+            ("idx_users_ranked_xp", "users", "account_state, xp"),
+            ("idx_users_last_hunt", "users", "last_hunt_time"),
+        ),
+    ),
+    (8, "equipped_slots reverse index", create_equipped_slots),
+    (9, "item_meta", create_item_meta),
+    (10, "mo.copedia tables", create_pedia_tables),
+    (
+        11,
+        "pedia archive and gear kit indexes",
+        create_indexes(
+            ("idx_pedia_archive_user", "pedia_archive", "user_id, log_id"),
+            ("idx_gear_kits_user_slot", "gear_kits", "user_id, slot_index"),
+        ),
+    ),
+]
+
+
+def current_version(conn):
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def migrate(conn):
+    """Apply every pending step. Returns the schema version afterwards."""
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        name TEXT,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )"""
+    )
+    conn.commit()
+    version = current_version(conn)
+    for step_version, name, step in MIGRATIONS:
+        if step_version <= version:
+            continue
+        step(conn)
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_version (version, name) VALUES (?, ?)",
+            (step_version, name),
+        )
+        conn.commit()
+        print(f"Schema migration {step_version}: {name}")
+        version = step_version
+    return version
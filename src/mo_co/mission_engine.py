@@ -3,7 +3,7 @@ from discord.ui import View, Button
 import asyncio
 import json
 import random
-from mo_co import database, config, game_data, utils
+from mo_co import database, config, game_data, utils, outbound
 from mo_co.game_data.missions import MISSIONS
 
 
@@ -65,7 +65,9 @@ class MissionEngine:
                 self.state = raw_state
 
         try:
-            self.thread = await self.bot.fetch_channel(self.thread_id)
+            self.thread = self.bot.get_channel(self.thread_id)
+            if self.thread is None:
+                self.thread = await self.bot.fetch_channel(self.thread_id)
         except:
             return False
         return True
@@ -283,6 +285,7 @@ class MissionEngine:
         await asyncio.sleep(5.0)
 
         if self.thread:
+            outbound.LIVE_EDITS.forget(self.thread.id)
             try:
                 await self.thread.edit(archived=True, locked=True)
             except:
@@ -370,16 +373,6 @@ class MissionEngine:
         if not self.thread:
             return
 
-        target_msg = None
-        async for msg in self.thread.history(limit=10):
-            if msg.author.id == self.bot.user.id and msg.embeds:
-                if "Mission" in (msg.embeds[0].title or ""):
-                    target_msg = msg
-                    break
-
-        if not target_msg:
-            return
-
         desc = ""
         m_data = self.state["states"][m_id]
         if step["type"] in [
@@ -395,16 +388,7 @@ class MissionEngine:
         elif step["type"] == "objective_checklist":
             desc = self.render_checklist(step, m_data["prog"])
 
-        embed = discord.Embed(
-            title=f"{config.MISSION_EMOJI} Mission",
-            color=0x3498DB,
-            description=desc,
-        )
-        if target_msg.embeds[0].description != desc:
-            try:
-                await target_msg.edit(embed=embed)
-            except:
-                pass
+        outbound.LIVE_EDITS.submit(self.thread, self.bot.user.id, desc)
 
     def render_progress_bar(self, prog, req, text):
         pct = min(1.0, prog / max(1, req))
@@ -424,18 +408,12 @@ class MissionEngine:
         return "\n".join(lines)
 
     async def get_webhook(self):
-        parent = self.thread.parent
-        webhooks = await parent.webhooks()
-        wh = next((w for w in webhooks if w.name == "MoCo Mission"), None)
-        if not wh:
-            wh = await parent.create_webhook(name="MoCo Mission")
-        return wh
+        return await outbound.WEBHOOKS.get(self.thread.parent)
 
     async def _safe_send(self, coro, retries=3):
         for i in range(retries):
             try:
-                await coro
-                return
+                return await coro
             except discord.HTTPException as e:
 
                 if e.status in [500, 502, 503, 504] and i < retries - 1:
@@ -452,7 +430,6 @@ class MissionEngine:
     async def send_npc_message(self, m_def, text):
         async with self.thread.typing():
             await asyncio.sleep(len(text) * 0.02 + 0.3)
-        wh = await self.get_webhook()
         char_name = m_def["character"]
         avatar_url = None
         if m_def.get("character_icon") in config.BOT_EMOJIS:
@@ -463,22 +440,21 @@ class MissionEngine:
                 )
 
         await self._safe_send(
-            wh.send(
+            outbound.WEBHOOKS.send(
+                self.thread,
                 content=text,
                 username=char_name,
                 avatar_url=avatar_url,
-                thread=self.thread,
             )
         )
 
     async def send_player_message(self, text, user):
-        wh = await self.get_webhook()
         await self._safe_send(
-            wh.send(
+            outbound.WEBHOOKS.send(
+                self.thread,
                 content=text,
                 username=user.display_name,
                 avatar_url=user.display_avatar.url,
-                thread=self.thread,
             )
         )
 
@@ -498,26 +474,24 @@ class MissionEngine:
         if step.get("type") == "objective_project":
             desc += "\n\n*Check `/missions` or `/hunt` to see Projects.*"
 
-        embed = discord.Embed(
-            title=f"{config.MISSION_EMOJI} Mission",
-            color=0x3498DB,
-            description=desc,
-        )
+        embed = outbound.mission_embed(desc)
 
-        last_msg = None
-        async for msg in self.thread.history(limit=5):
-            if msg.author.id == self.bot.user.id and msg.embeds:
-                if "Mission" in (msg.embeds[0].title or ""):
-                    last_msg = msg
-                    break
+        outbound.LIVE_EDITS.discard(self.thread.id)
+        await outbound.LIVE_EDITS.settle(self.thread.id)
+        last_msg = await outbound.LIVE_EDITS.find_message(
+            self.thread, self.bot.user.id, limit=5
+        )
 
         if last_msg:
             try:
-                await last_msg.edit(embed=embed)
+                edited = await last_msg.edit(embed=embed)
+                outbound.LIVE_EDITS.remember(self.thread.id, edited or last_msg)
             except:
-                pass
+                outbound.LIVE_EDITS.forget(self.thread.id)
         else:
-            await self._safe_send(self.thread.send(embed=embed))
+            msg = await self._safe_send(self.thread.send(embed=embed))
+            if msg:
+                outbound.LIVE_EDITS.remember(self.thread.id, msg)
 
     async def send_equip_mission_msg(self, step, m_id):
         item_name = game_data.get_item(step["item_id"])["name"]
@@ -830,23 +804,19 @@ class RewardView(View):
             result_embed.add_field(name="STATS", value=stats_text, inline=False)
 
             if step["reward_type"] == "item_xp":
-                database.update_user_stats(uid, {"xp": old_xp + step["xp"]})
+                database.increment_user_fields(uid, {"xp_award": step["xp"]})
                 result_embed.set_footer(text=f"+{step['xp']:,} XP")
 
         elif step["reward_type"] == "xp":
-            database.update_user_stats(uid, {"xp": old_xp + step["amount"]})
+            database.increment_user_fields(uid, {"xp_award": step["amount"]})
             result_embed = discord.Embed(
                 description=f"**Acquired:** {config.XP_EMOJI} **{step['amount']:,} XP**",
                 color=0x2ECC71,
             )
 
         elif step["reward_type"] == "currency":
-            database.update_user_stats(
-                uid,
-                {
-                    "mo_gold": u_data["mo_gold"] + step["gold"],
-                    "merch_tokens": u_data["merch_tokens"] + step["tokens"],
-                },
+            database.increment_user_fields(
+                uid, {"mo_gold": step["gold"], "merch_tokens": step["tokens"]}
             )
             result_embed = discord.Embed(
                 description=f"**Acquired:**\n{config.MOGOLD_EMOJI} **{step['gold']:,}**\n{config.MERCH_TOKEN_EMOJI} **{step['tokens']:,}**",
@@ -854,12 +824,8 @@ class RewardView(View):
             )
 
         elif step["reward_type"] == "xp_tokens":
-            database.update_user_stats(
-                uid,
-                {
-                    "xp": old_xp + step["xp"],
-                    "merch_tokens": u_data["merch_tokens"] + step["tokens"],
-                },
+            database.increment_user_fields(
+                uid, {"xp_award": step["xp"], "merch_tokens": step["tokens"]}
             )
             result_embed = discord.Embed(
                 description=f"**Acquired:**\n{config.XP_EMOJI} **{step['xp']:,} XP**\n{config.MERCH_TOKEN_EMOJI} **{step['tokens']:,} Tokens**",
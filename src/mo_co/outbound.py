@@ -0,0 +1,196 @@
+"""
+Outbound Discord traffic for mission threads.
+
+WEBHOOKS keeps one "MoCo Mission" webhook per parent channel instead of
+listing the channel's webhooks before every NPC line; a 404 drops the entry
+and the send is retried once with a fresh webhook.
+
+LIVE_EDITS coalesces live progress-bar edits per thread. Only the newest
+description is kept while an edit is pending, each thread is edited at most
+once per LIVE_EDIT_INTERVAL, and the live message is remembered so it is not
+looked up through the thread history on every kill.
+"""
+
+import asyncio
+import time
+import discord
+from mo_co import config
+
+
+WEBHOOK_NAME = "MoCo Mission"
+LIVE_MESSAGE_CACHE = 2000
+
+
+class WebhookCache:
+    def __init__(self):
+        self._hooks = {}
+        self._locks = {}
+        self.stats = {"hits": 0, "fetches": 0, "invalidated": 0}
+
+    async def get(self, channel):
+        wh = self._hooks.get(channel.id)
+        if wh is not None:
+            self.stats["hits"] += 1
+            return wh
+        lock = self._locks.setdefault(channel.id, asyncio.Lock())
+        async with lock:
+            wh = self._hooks.get(channel.id)
+            if wh is None:
+                self.stats["fetches"] += 1
+                webhooks = await channel.webhooks()
+                wh = next((w for w in webhooks if w.name == WEBHOOK_NAME), None)
+                if not wh:
+                    wh = await channel.create_webhook(name=WEBHOOK_NAME)
+                self._hooks[channel.id] = wh
+        return wh
+
+    def invalidate(self, channel_id):
+        if self._hooks.pop(channel_id, None) is not None:
+            self.stats["invalidated"] += 1
+
+    async def send(self, thread, **kwargs):
+        channel = thread.parent
+        wh = await self.get(channel)
+        try:
+            return await wh.send(thread=thread, **kwargs)
+        except discord.NotFound:
+            self.invalidate(channel.id)
+            wh = await self.get(channel)
+            return await wh.send(thread=thread, **kwargs)
+
+
+def mission_embed(desc):
+    return discord.Embed(
+        title=f"{config.MISSION_EMOJI} Mission",
+        color=0x3498DB,
+        description=desc,
+    )
+
+
+class LiveEditQueue:
+    def __init__(self, interval):
+        self.interval = interval
+        self._pending = {}
+        self._messages = {}
+        self._next_at = {}
+        # Bumped by discard()/forget(); an edit queued under an older value is
+        # stale and skipped, even if it was already being sent.
+        self._generation = {}
+        self._generations = 0
+        self._in_flight = {}
+        self._wake = None
+        self._task = None
+        self.stats = {
+            "queued": 0,
+            "coalesced": 0,
+            "edits": 0,
+            "unchanged": 0,
+            "rate_limited": 0,
+        }
+
+    async def find_message(self, thread, bot_user_id, limit=10):
+        """Live Mission embed of the thread, cached or found in recent history."""
+        msg = self._messages.get(thread.id)
+        if msg is not None:
+            return msg
+        async for m in thread.history(limit=limit):
+            if m.author.id == bot_user_id and m.embeds:
+                if "Mission" in (m.embeds[0].title or ""):
+                    self.remember(thread.id, m)
+                    return m
+        return None
+
+    def remember(self, thread_id, msg):
+        self._messages.pop(thread_id, None)
+        self._messages[thread_id] = msg
+        if len(self._messages) > LIVE_MESSAGE_CACHE:
+            self._messages.pop(next(iter(self._messages)))
+
+    def forget(self, thread_id):
+        self._messages.pop(thread_id, None)
+        self.discard(thread_id)
+
+    def discard(self, thread_id):
+        """Drop pending or in-flight edits that a direct status update superseded."""
+        self._pending.pop(thread_id, None)
+        self._generations += 1
+        self._generation[thread_id] = self._generations
+
+    async def settle(self, thread_id):
+        """Wait for an edit of this thread that is already on the wire."""
+        done = self._in_flight.get(thread_id)
+        if done is not None:
+            await done.wait()
+
+    def submit(self, thread, bot_user_id, desc):
+        if thread.id in self._pending:
+            self.stats["coalesced"] += 1
+        self.stats["queued"] += 1
+        gen = self._generation.get(thread.id, 0)
+        self._pending[thread.id] = (thread, bot_user_id, desc, gen)
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._wake.set()
+
+    async def _run(self):
+        while True:
+            if not self._pending:
+                now = time.monotonic()
+                self._next_at = {
+                    t: at for t, at in self._next_at.items() if at > now
+                }
+                # Nothing is queued or in flight, so no edit can be stale.
+                self._generation.clear()
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+
+            now = time.monotonic()
+            due = [t for t in self._pending if self._next_at.get(t, 0) <= now]
+            for thread_id in due:
+                thread, bot_user_id, desc, gen = self._pending.pop(thread_id)
+                self._next_at[thread_id] = time.monotonic() + self.interval
+                done = self._in_flight[thread_id] = asyncio.Event()
+                try:
+                    await self._edit(thread, bot_user_id, desc, gen)
+                except discord.HTTPException as e:
+                    if e.status != 429:
+                        continue
+                    self.stats["rate_limited"] += 1
+                    self._next_at[thread_id] = time.monotonic() + self.interval * 4
+                    if thread_id not in self._pending and not self._stale(
+                        thread_id, gen
+                    ):
+                        self._pending[thread_id] = (thread, bot_user_id, desc, gen)
+                except Exception as e:
+                    print(f"Live edit failed ({thread_id}): {e}")
+                finally:
+                    del self._in_flight[thread_id]
+                    done.set()
+
+            if self._pending:
+                wait = min(self._next_at.get(t, 0) for t in self._pending)
+                await asyncio.sleep(max(0.05, wait - time.monotonic()))
+
+    def _stale(self, thread_id, gen):
+        return self._generation.get(thread_id, 0) != gen
+
+    async def _edit(self, thread, bot_user_id, desc, gen):
+        msg = await self.find_message(thread, bot_user_id)
+        if not msg or self._stale(thread.id, gen):
+            return
+        if msg.embeds and msg.embeds[0].description == desc:
+            self.stats["unchanged"] += 1
+            return
+        try:
+            edited = await msg.edit(embed=mission_embed(desc))
+        except discord.NotFound:
+            self._messages.pop(thread.id, None)
+            return
+        self.stats["edits"] += 1
+        self.remember(thread.id, edited or msg)
+
+
+WEBHOOKS = WebhookCache()
+LIVE_EDITS = LiveEditQueue(config.LIVE_EDIT_INTERVAL)
@@ -1,4 +1,5 @@
 import json
+import threading
 import time
 from mo_co import database, game_data
 
@@ -13,6 +14,21 @@ KEY_ARCHIVE = "archive"
 MAX_ARCHIVE_LOGS = 50
 
 
+PEDIA_MIGRATED = database.PEDIA_MIGRATED
+
+
+TABLES = {
+    KEY_MONSTERS: ("pedia_monsters", "monster_id", ("k", "oc", "ch", "mg", "d")),
+    KEY_GEAR: ("pedia_gear", "item_id", ("shop", "l50")),
+    KEY_WORLDS: ("pedia_worlds", "world_id", ("v", "c", "h", "corr")),
+    KEY_SKINS: ("pedia_skins", "skin_id", ("app",)),
+}
+
+
+_ready_users = set()
+_ready_lock = threading.Lock()
+
+
 def get_default_pedia():
     return {
         KEY_MONSTERS: {},
@@ -23,41 +39,158 @@ def get_default_pedia():
     }
 
 
-def _get_data(user_id):
+def _ensure_user(user_id):
+    """Moves a user's legacy pedia_data blob (or a fresh backfill) into the tables once."""
+    if user_id in _ready_users:
+        return True
     u = database.get_user_data(user_id)
     if not u:
-        return get_default_pedia()
+        return False
     raw = u["pedia_data"]
-
-    if not raw or raw == "{}":
-        data = get_default_pedia()
-
-        _backfill_inventory(user_id, data)
-
-        _save_data(user_id, data)
-        return data
-
-    try:
-        data = json.loads(raw)
-
-        defaults = get_default_pedia()
-        changed = False
-        for k, v in defaults.items():
-            if k not in data:
-                data[k] = v
-                changed = True
-        if changed:
-            _save_data(user_id, data)
-        return data
-    except:
-
-        data = get_default_pedia()
-        _save_data(user_id, data)
-        return data
+    if raw != PEDIA_MIGRATED:
+        data = None
+        if raw and raw != "{}":
+            try:
+                data = json.loads(raw)
+            except:
+                data = None
+        if data is None:
+            data = get_default_pedia()
+            _backfill_inventory(user_id, data)
+        _import_blob(user_id, data)
+    with _ready_lock:
+        _ready_users.add(user_id)
+    return True
+
+
+def _import_blob(user_id, data):
+    with database.get_connection() as conn:
+        _write_blob(conn, user_id, data)
+        conn.execute(
+            "UPDATE users SET pedia_data = ? WHERE user_id = ?",
+            (PEDIA_MIGRATED, user_id),
+        )
+        conn.commit()
+
+
+def _write_blob(conn, user_id, data):
+    """
+    Merges a pedia dict into the user's rows without dropping anything already
+    there: counters and flags keep the larger value, claimed tasks, modifiers
+    and archive logs are unioned.
+    """
+    for category, (table, key_col, cols) in TABLES.items():
+        col_sql = ", ".join(cols)
+        ph = ", ".join(["?"] * (len(cols) + 3))
+        for entry_id, entry in (data.get(category) or {}).items():
+            if not isinstance(entry, dict):
+                continue
+            values = [int(entry.get(c, 0) or 0) for c in cols]
+            claimed = list(entry.get("cl", []))
+            row = conn.execute(
+                f"SELECT * FROM {table} WHERE user_id = ? AND {key_col} = ?",
+                (user_id, entry_id),
+            ).fetchone()
+            if row:
+                values = [max(v, row[c] or 0) for v, c in zip(values, cols)]
+                existing = json.loads(row["cl"] or "[]")
+                claimed = existing + [t for t in claimed if t not in existing]
+            conn.execute(
+                f"INSERT OR REPLACE INTO {table} (user_id, {key_col}, {col_sql}, cl) VALUES ({ph})",
+                (user_id, entry_id, *values, json.dumps(claimed)),
+            )
+    for item_id, entry in (data.get(KEY_GEAR) or {}).items():
+        if not isinstance(entry, dict):
+            continue
+        for mod in entry.get("mods", []):
+            conn.execute(
+                "INSERT OR IGNORE INTO pedia_gear_mods (user_id, item_id, modifier) VALUES (?, ?, ?)",
+                (user_id, item_id, mod),
+            )
+    archive = data.get(KEY_ARCHIVE) or []
+    if not archive:
+        return
+    fields = ("ts", "src", "res", "rar")
+    rows = conn.execute(
+        "SELECT ts, src, res, rar FROM pedia_archive WHERE user_id = ? ORDER BY log_id",
+        (user_id,),
+    ).fetchall()
+    logs = {tuple(r[f] for f in fields): None for r in rows}
+    for log in reversed(archive):
+        logs.setdefault(tuple(log.get(f) for f in fields), None)
+    merged = sorted(logs, key=lambda log: log[0] or 0)[-MAX_ARCHIVE_LOGS:]
+    conn.execute("DELETE FROM pedia_archive WHERE user_id = ?", (user_id,))
+    conn.executemany(
+        "INSERT INTO pedia_archive (user_id, ts, src, res, rar) VALUES (?, ?, ?, ?, ?)",
+        [(user_id, *log) for log in merged],
+    )
+
+
+def forget(user_id=None):
+    """Makes the next lookup re-check the user's pedia_data marker (one user, or all)."""
+    with _ready_lock:
+        if user_id is None:
+            _ready_users.clear()
+        else:
+            _ready_users.discard(user_id)
+
+
+database.on_forget_user(forget)
+
+
+def migrate_legacy_pedia():
+    """One-shot conversion of every legacy pedia_data blob into the pedia tables."""
+    with database.get_connection() as conn:
+        rows = conn.execute(
+            "SELECT user_id, pedia_data FROM users WHERE pedia_data IS NOT NULL AND pedia_data NOT IN ('', '{}', ?)",
+            (PEDIA_MIGRATED,),
+        ).fetchall()
+        migrated = 0
+        for r in rows:
+            try:
+                data = json.loads(r["pedia_data"])
+            except:
+                continue
+            _write_blob(conn, r["user_id"], data)
+            conn.execute(
+                "UPDATE users SET pedia_data = ? WHERE user_id = ?",
+                (PEDIA_MIGRATED, r["user_id"]),
+            )
+            migrated += 1
+        conn.commit()
+    return migrated
 
 
-def _save_data(user_id, data):
-    database.update_user_stats(user_id, {"pedia_data": json.dumps(data)})
+def _get_data(user_id):
+    if not _ensure_user(user_id):
+        return get_default_pedia()
+    data = get_default_pedia()
+    with database.get_connection() as conn:
+        for category, (table, key_col, cols) in TABLES.items():
+            rows = conn.execute(
+                f"SELECT * FROM {table} WHERE user_id = ?", (user_id,)
+            ).fetchall()
+            for r in rows:
+                entry = {c: r[c] for c in cols}
+                entry["cl"] = json.loads(r["cl"] or "[]")
+                data[category][r[key_col]] = entry
+        for entry in data[KEY_GEAR].values():
+            entry["mods"] = []
+        mods = conn.execute(
+            "SELECT item_id, modifier FROM pedia_gear_mods WHERE user_id = ? ORDER BY rowid",
+            (user_id,),
+        ).fetchall()
+        for r in mods:
+            entry = data[KEY_GEAR].setdefault(
+                r["item_id"], {"mods": [], "shop": 0, "l50": 0, "cl": []}
+            )
+            entry["mods"].append(r["modifier"])
+        logs = conn.execute(
+            "SELECT ts, src, res, rar FROM pedia_archive WHERE user_id = ? ORDER BY log_id DESC LIMIT ?",
+            (user_id, MAX_ARCHIVE_LOGS),
+        ).fetchall()
+        data[KEY_ARCHIVE] = [dict(r) for r in logs]
+    return data
 
 
 def _backfill_inventory(user_id, data):
@@ -86,6 +219,52 @@ def _backfill_inventory(user_id, data):
         pass
 
 
+def _bump(user_id, category, entry_id, inc=None, flag=None):
+    """Single-row upsert: counters in `inc` are added, flags in `flag` are OR'd in."""
+    if not _ensure_user(user_id):
+        return
+    table, key_col, cols = TABLES[category]
+    inc, flag = inc or {}, flag or {}
+    values = [inc.get(c, 0) + flag.get(c, 0) for c in cols]
+    updates = [f"{c} = {c} + excluded.{c}" for c in inc] + [
+        f"{c} = MAX({c}, excluded.{c})" for c in flag
+    ]
+    col_sql = ", ".join(cols)
+    ph = ", ".join(["?"] * (len(cols) + 2))
+    sql = f"INSERT INTO {table} (user_id, {key_col}, {col_sql}) VALUES ({ph})"
+    if updates:
+        sql += f" ON CONFLICT(user_id, {key_col}) DO UPDATE SET {', '.join(updates)}"
+    else:
+        sql += f" ON CONFLICT(user_id, {key_col}) DO NOTHING"
+    with database.get_connection() as conn:
+        conn.execute(sql, (user_id, entry_id, *values))
+        conn.commit()
+
+
+def claim_task(user_id, category, entry_id, task_id):
+    """Marks a research task claimed. Returns False if it was already claimed."""
+    if category not in TABLES or not _ensure_user(user_id):
+        return False
+    table, key_col, _ = TABLES[category]
+    with database.get_connection() as conn:
+        row = conn.execute(
+            f"SELECT cl FROM {table} WHERE user_id = ? AND {key_col} = ?",
+            (user_id, entry_id),
+        ).fetchone()
+        if not row:
+            return False
+        claimed = json.loads(row["cl"] or "[]")
+        if task_id in claimed:
+            return False
+        claimed.append(task_id)
+        conn.execute(
+            f"UPDATE {table} SET cl = ? WHERE user_id = ? AND {key_col} = ?",
+            (json.dumps(claimed), user_id, entry_id),
+        )
+        conn.commit()
+    return True
+
+
 def track_kill(
     user_id,
     monster_name,
@@ -93,145 +272,80 @@ def track_kill(
     is_chaos=False,
     is_megacharged=False,
 ):
-    data = _get_data(user_id)
-    if monster_name not in data[KEY_MONSTERS]:
-        data[KEY_MONSTERS][monster_name] = {
-            "k": 0,
-            "oc": 0,
-            "ch": 0,
-            "mg": 0,
-            "d": 0,
-            "cl": [],
-        }
-
-    entry = data[KEY_MONSTERS][monster_name]
-    entry["k"] += 1
-    if is_overcharged:
-        entry["oc"] += 1
-    if is_chaos:
-        entry["ch"] += 1
-    if is_megacharged:
-        entry["mg"] += 1
-
-    _save_data(user_id, data)
+    _bump(
+        user_id,
+        KEY_MONSTERS,
+        monster_name,
+        inc={
+            "k": 1,
+            "oc": int(bool(is_overcharged)),
+            "ch": int(bool(is_chaos)),
+            "mg": int(bool(is_megacharged)),
+        },
+    )
 
 
 def track_death(user_id, monster_name):
-    data = _get_data(user_id)
-    if monster_name not in data[KEY_MONSTERS]:
-        data[KEY_MONSTERS][monster_name] = {
-            "k": 0,
-            "oc": 0,
-            "ch": 0,
-            "mg": 0,
-            "d": 0,
-            "cl": [],
-        }
-
-    data[KEY_MONSTERS][monster_name]["d"] += 1
-    _save_data(user_id, data)
+    _bump(user_id, KEY_MONSTERS, monster_name, inc={"d": 1})
 
 
 def track_gear(user_id, item_id, modifier="Standard", source="drop"):
-    data = _get_data(user_id)
-    if item_id not in data[KEY_GEAR]:
-        data[KEY_GEAR][item_id] = {"mods": [], "shop": 0, "l50": 0, "cl": []}
-
-    entry = data[KEY_GEAR][item_id]
-    if modifier not in entry["mods"]:
-        entry["mods"].append(modifier)
-
-    if source == "shop":
-        entry["shop"] = 1
-
-    _save_data(user_id, data)
+    _bump(
+        user_id,
+        KEY_GEAR,
+        item_id,
+        flag={"shop": 1 if source == "shop" else 0},
+    )
+    with database.get_connection() as conn:
+        conn.execute(
+            "INSERT OR IGNORE INTO pedia_gear_mods (user_id, item_id, modifier) VALUES (?, ?, ?)",
+            (user_id, item_id, modifier),
+        )
+        conn.commit()
 
 
 def track_upgrade(user_id, item_id, new_level):
     if new_level < 50:
         return
-    data = _get_data(user_id)
-    if item_id not in data[KEY_GEAR]:
-        data[KEY_GEAR][item_id] = {"mods": [], "shop": 0, "l50": 0, "cl": []}
-
-    data[KEY_GEAR][item_id]["l50"] = 1
-    _save_data(user_id, data)
+    _bump(user_id, KEY_GEAR, item_id, flag={"l50": 1})
 
 
 def track_world_visit(user_id, world_id):
-    data = _get_data(user_id)
-    if world_id not in data[KEY_WORLDS]:
-        data[KEY_WORLDS][world_id] = {
-            "v": 0,
-            "c": 0,
-            "h": 0,
-            "corr": 0,
-            "cl": [],
-        }
-
-    entry = data[KEY_WORLDS][world_id]
-    entry["v"] += 1
-
-    is_corr = False
-    for w in game_data.ELITE_POOL_30 + game_data.ELITE_POOL_50:
-        if w["id"] == world_id:
-            is_corr = True
-            break
-
-    if is_corr:
-        entry["corr"] += 1
-    _save_data(user_id, data)
+    _bump(
+        user_id,
+        KEY_WORLDS,
+        world_id,
+        inc={
+            "v": 1,
+            "corr": 1 if world_id in game_data.CORRUPTED_WORLD_IDS else 0,
+        },
+    )
 
 
 def track_world_hunt(user_id, world_id, count=1):
-    data = _get_data(user_id)
-    if world_id not in data[KEY_WORLDS]:
-        data[KEY_WORLDS][world_id] = {
-            "v": 0,
-            "c": 0,
-            "h": 0,
-            "corr": 0,
-            "cl": [],
-        }
-
-    data[KEY_WORLDS][world_id]["h"] += count
-    _save_data(user_id, data)
+    _bump(user_id, KEY_WORLDS, world_id, inc={"h": count})
 
 
 def track_crate(user_id, world_id):
-    data = _get_data(user_id)
-    if world_id not in data[KEY_WORLDS]:
-        data[KEY_WORLDS][world_id] = {
-            "v": 0,
-            "c": 0,
-            "h": 0,
-            "corr": 0,
-            "cl": [],
-        }
-
-    data[KEY_WORLDS][world_id]["c"] += 1
-    _save_data(user_id, data)
+    _bump(user_id, KEY_WORLDS, world_id, inc={"c": 1})
 
 
 def track_skin(user_id, skin_id):
-    data = _get_data(user_id)
-    if skin_id not in data[KEY_SKINS]:
-        data[KEY_SKINS][skin_id] = {"app": 0, "cl": []}
-
-    data[KEY_SKINS][skin_id]["app"] = 1
-    _save_data(user_id, data)
+    _bump(user_id, KEY_SKINS, skin_id, flag={"app": 1})
 
 
 def track_archive(user_id, source_type, result_id, rarity):
-    data = _get_data(user_id)
-    log = {
-        "ts": int(time.time()),
-        "src": source_type,
-        "res": result_id,
-        "rar": rarity,
-    }
-    data[KEY_ARCHIVE].insert(0, log)
-    if len(data[KEY_ARCHIVE]) > MAX_ARCHIVE_LOGS:
-        data[KEY_ARCHIVE] = data[KEY_ARCHIVE][:MAX_ARCHIVE_LOGS]
-
-    _save_data(user_id, data)
+    if not _ensure_user(user_id):
+        return
+    with database.get_connection() as conn:
+        conn.execute(
+            "INSERT INTO pedia_archive (user_id, ts, src, res, rar) VALUES (?, ?, ?, ?, ?)",
+            (user_id, int(time.time()), source_type, result_id, rarity),
+        )
+        conn.execute(
+            """DELETE FROM pedia_archive WHERE user_id = ? AND log_id <= (
+                SELECT log_id FROM pedia_archive WHERE user_id = ?
+                ORDER BY log_id DESC LIMIT 1 OFFSET ?)""",
+            (user_id, user_id, MAX_ARCHIVE_LOGS),
+        )
+        conn.commit()
@@ -0,0 +1,215 @@
+"""
+Event-indexed progression matching for jobs, projects and missions.
+
+PROJECTS is compiled once into PROJECT_INDEX, keyed by (target_type, target).
+A HuntEvent lists the keys it can advance, so a kill only touches the project
+tiers that actually match instead of walking every generated tier.
+"""
+
+from mo_co import game_data
+from mo_co.game_data.missions import MISSIONS
+from mo_co.game_data.projects import PROJECTS
+
+
+UNTARGETED = frozenset(["hunt_any", "loot_xp", "hunt_shared_boss"])
+
+JOB_BOSSES = frozenset(["Draymor", "Overlord", "Big Papa"])
+CHECKLIST_BOSSES = frozenset(["Draymor", "Overlord", "Big Papa", "Berserker"])
+
+
+def _project_key(target_type, target):
+    return (target_type, None if target_type in UNTARGETED else target)
+
+
+def _build_project_index():
+    index = {}
+    for pid, p_def in PROJECTS.items():
+        key = _project_key(p_def["target_type"], p_def.get("target"))
+        index.setdefault(key, []).append((pid, bool(p_def.get("is_elite"))))
+    return {key: tuple(entries) for key, entries in index.items()}
+
+
+PROJECT_INDEX = _build_project_index()
+
+
+class HuntEvent:
+    """One kill / clear, classified once for every matcher."""
+
+    __slots__ = (
+        "monster_id",
+        "world_id",
+        "world_type",
+        "loot_xp",
+        "rift_time",
+        "damage_sources",
+        "heal_sources",
+        "npc_ally",
+        "is_shared_boss",
+        "is_chaos",
+        "is_overcharged",
+        "is_boss",
+        "is_job_boss",
+        "is_checklist_boss",
+    )
+
+    def __init__(
+        self,
+        monster_id,
+        world_id,
+        modifier,
+        rift_time=None,
+        damage_sources=None,
+        heal_sources=None,
+        loot_xp=0,
+        npc_ally=None,
+        is_shared_boss=False,
+    ):
+        self.monster_id = monster_id
+        self.world_id = world_id
+        w_def = game_data.get_world(world_id)
+        self.world_type = w_def.get("type") if w_def else "unknown"
+        self.loot_xp = loot_xp
+        self.rift_time = rift_time
+        self.damage_sources = damage_sources or {}
+        self.heal_sources = heal_sources or {}
+        self.npc_ally = npc_ally
+        self.is_shared_boss = is_shared_boss
+
+        modifier = modifier or ""
+        self.is_chaos = "Chaos" in modifier
+        self.is_overcharged = "Overcharged" in modifier or "Megacharged" in modifier
+
+        mid = str(monster_id)
+        self.is_boss = "boss" in mid.lower() or mid.startswith("chaos_")
+        self.is_job_boss = bool(monster_id) and (
+            self.is_boss or monster_id in JOB_BOSSES
+        )
+        self.is_checklist_boss = self.is_boss or mid in CHECKLIST_BOSSES
+
+    def project_hits(self):
+        """(PROJECT_INDEX key, amount) for everything this event can advance."""
+        hits = [
+            (("hunt_any", None), 1),
+            (("hunt_world", self.world_id), 1),
+            (("hunt_world_type", self.world_type), 1),
+            (("hunt_mob", self.monster_id), 1),
+        ]
+        if self.is_chaos:
+            hits.append((("hunt_type", "Chaos"), 1))
+        if self.is_overcharged:
+            hits.append((("hunt_type", "Overcharged"), 1))
+        if self.is_boss:
+            hits.append((("hunt_type", "Boss"), 1))
+        if self.loot_xp > 0:
+            hits.append((("loot_xp", None), self.loot_xp))
+        for source, amount in self.damage_sources.items():
+            hits.append((("deal_damage_with", source), amount))
+        for source, amount in self.heal_sources.items():
+            hits.append((("heal_with", source), amount))
+        if self.is_shared_boss:
+            hits.append((("hunt_shared_boss", None), 1))
+        if self.npc_ally:
+            hits.append((("fight_with_npc", self.npc_ally), 1))
+        return hits
+
+    def matches_job(self, t_type, target):
+        if t_type == "hunt_any":
+            return True
+        if t_type == "hunt_world":
+            return target == self.world_id
+        if t_type == "hunt_mob":
+            return bool(self.monster_id) and target == self.monster_id
+        if t_type == "hunt_type":
+            if target == "Overcharged":
+                return self.is_overcharged
+            if target == "Boss":
+                return self.is_job_boss
+        return False
+
+
+def advance_projects(proj_data, event, is_elite_user):
+    """Mutates proj_data in place. Returns True if anything moved."""
+    changed = False
+    for key, amount in event.project_hits():
+        if amount <= 0:
+            continue
+        for pid, elite_only in PROJECT_INDEX.get(key, ()):
+            if elite_only and not is_elite_user:
+                continue
+            entry = proj_data.get(pid, {"prog": 0, "claimed": False})
+            if isinstance(entry, int):
+                entry = {"prog": entry, "claimed": False}
+            if entry.get("claimed", False):
+                continue
+            entry["prog"] += amount
+            proj_data[pid] = entry
+            changed = True
+    return changed
+
+
+def advance_jobs(jobs, event):
+    changed = False
+    for job in jobs:
+        if job.get("completed", False):
+            continue
+        if "claimed" not in job:
+            job["claimed"] = False
+        if event.matches_job(job["target_type"], job["target"]):
+            job["progress"] += 1
+            changed = True
+            if job["progress"] >= job["count"]:
+                job["completed"] = True
+    return changed
+
+
+def advance_missions(m_state, event):
+    """Returns (changed, ids of missions whose objectives moved)."""
+    changed = False
+    triggered = set()
+    for m_id in m_state.get("active", []):
+        mission_def = MISSIONS.get(m_id)
+        if not mission_def:
+            continue
+        m_data = m_state["states"].get(m_id)
+        if not m_data:
+            continue
+        step = mission_def["steps"][m_data["step"]]
+        stype = step["type"]
+
+        hit = False
+        if stype == "objective_hunt":
+            if step["target"] == "any" or step["target"] == event.monster_id:
+                hit = not step.get("world_id") or step["world_id"] == event.world_id
+        elif stype == "objective_rift_boss":
+            hit = event.rift_time is not None and step["target"] == event.monster_id
+
+        if hit:
+            if m_data["prog"] < step["count"]:
+                m_data["prog"] += 1
+                changed = True
+                triggered.add(m_id)
+
+        elif stype == "objective_checklist":
+            if isinstance(m_data.get("prog"), int):
+                m_data["prog"] = [0] * len(step["targets"])
+                changed = True
+
+            for idx, target_def in enumerate(step["targets"]):
+                t_world = target_def.get("world_id")
+                if t_world and t_world != event.world_id:
+                    continue
+                if (
+                    idx >= len(m_data["prog"])
+                    or m_data["prog"][idx] >= target_def["count"]
+                ):
+                    continue
+                t_id = target_def["id"]
+                if (
+                    (t_id == "Boss" and event.is_checklist_boss)
+                    or t_id == event.monster_id
+                    or t_id == "any"
+                ):
+                    m_data["prog"][idx] += 1
+                    changed = True
+                    triggered.add(m_id)
+    return changed, triggered
@@ -0,0 +1,225 @@
+"""
+Central render scheduler for live game messages.
+
+Rifts, dojos, the Cool Zone and matchmaking timers register their message and
+a render callable instead of calling message.edit on their own timers. A
+single loop then:
+
+- re-renders each session once per its interval, stretched by
+  utils.get_load_factor while gateway latency is high,
+- compares the result with the last payload sent and skips no-op edits (an
+  unchanged view is left off the request entirely),
+- spends at most RENDER_EDIT_BUDGET edits per second across the process and
+  never edits through the same route faster than RENDER_ROUTE_GAP.
+
+Render time is recorded in mo_co.metrics, labelled by the first element of
+tuple keys ("coolzone", "matchmaking", ...) and "game" for rift/dojo messages.
+"""
+
+import asyncio
+import json
+import time
+import discord
+from mo_co import config, utils
+from mo_co.metrics import METRICS
+
+
+PASS_INTERVAL = 0.25
+
+
+def _strip_ids(data):
+    if isinstance(data, dict):
+        return {k: _strip_ids(v) for k, v in data.items() if k != "custom_id"}
+    if isinstance(data, list):
+        return [_strip_ids(v) for v in data]
+    return data
+
+
+def embed_signature(embed):
+    if embed is None:
+        return None
+    return json.dumps(embed.to_dict(), sort_keys=True, default=str)
+
+
+def view_signature(view):
+    """Component layout without the random custom_ids discord.py assigns."""
+    if view is None:
+        return None
+    return json.dumps(_strip_ids(view.to_components()), sort_keys=True, default=str)
+
+
+def _editor(target):
+    """(edit coroutine function, rate-limit route) for a message or interaction."""
+    if isinstance(target, discord.Interaction):
+        return target.edit_original_response, ("interaction", target.id)
+    if isinstance(target, (discord.InteractionMessage, discord.WebhookMessage)):
+        return target.edit, ("webhook", target.id)
+    return target.edit, ("channel", target.channel.id)
+
+
+class LiveRender:
+    __slots__ = (
+        "key",
+        "edit",
+        "route",
+        "render",
+        "interval",
+        "on_gone",
+        "due",
+        "embed_sig",
+        "view_sig",
+        "busy",
+    )
+
+    def __init__(self, key, target, render, interval, on_gone):
+        self.key = key
+        self.edit, self.route = _editor(target)
+        self.render = render
+        self.interval = interval
+        self.on_gone = on_gone
+        self.due = 0.0
+        self.embed_sig = None
+        self.view_sig = None
+        self.busy = False
+
+    def seconds(self):
+        return self.interval() if callable(self.interval) else self.interval
+
+
+class RenderScheduler:
+    def __init__(self, budget, route_gap):
+        self.budget = budget
+        self.route_gap = route_gap
+        self.bot = None
+        self._sessions = {}
+        self._route_next = {}
+        self._tokens = budget
+        self._refilled = time.monotonic()
+        self._task = None
+        self.stats = {
+            "edits": 0,
+            "skipped": 0,
+            "deferred": 0,
+            "rate_limited": 0,
+            "errors": 0,
+        }
+
+    def start(self, bot):
+        self.bot = bot
+        self._ensure_running()
+
+    def _ensure_running(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def register(self, key, target, render, interval, on_gone=None):
+        """
+        Keep `target` (a message or an interaction) in sync with render().
+
+        render() returns (embed, view or None), or None once the session is
+        over. The payload it returns right now is taken as already on screen.
+        """
+        session = LiveRender(key, target, render, interval, on_gone)
+        payload = render()
+        if payload:
+            session.embed_sig = embed_signature(payload[0])
+            session.view_sig = view_signature(payload[1])
+        session.due = time.monotonic() + session.seconds()
+        self._sessions[key] = session
+        self._ensure_running()
+
+    def unregister(self, key):
+        self._sessions.pop(key, None)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _refill(self, now):
+        self._tokens = min(
+            self.budget, self._tokens + (now - self._refilled) * self.budget
+        )
+        self._refilled = now
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(PASS_INTERVAL)
+            now = time.monotonic()
+            self._refill(now)
+            factor = utils.get_load_factor(self.bot)
+
+            due = [
+                s for s in self._sessions.values() if s.due <= now and not s.busy
+            ]
+            due.sort(key=lambda s: s.due)
+            for session in due:
+                if self._tokens < 1 or self._route_next.get(session.route, 0) > now:
+                    self.stats["deferred"] += 1
+                    continue
+                try:
+                    self._render(session, now, factor)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    session.due = now + session.seconds() * factor
+                    print(f"Render Error ({session.key}): {e}")
+
+            for route in [r for r, t in self._route_next.items() if t <= now]:
+                del self._route_next[route]
+
+    def _render(self, session, now, factor):
+        started = time.perf_counter()
+        payload = session.render()
+        kind = session.key[0] if isinstance(session.key, tuple) else "game"
+        METRICS.observe("render", kind, time.perf_counter() - started)
+        if not payload:
+            self.unregister(session.key)
+            return
+        embed, view = payload
+        session.due = now + session.seconds() * factor
+
+        embed_sig = embed_signature(embed)
+        view_sig = view_signature(view)
+        kwargs = {}
+        if embed_sig != session.embed_sig:
+            kwargs["embed"] = embed
+        if view is not None and view_sig != session.view_sig:
+            kwargs["view"] = view
+        if not kwargs:
+            self.stats["skipped"] += 1
+            return
+
+        self._tokens -= 1
+        self._route_next[session.route] = now + self.route_gap
+        session.busy = True
+        asyncio.create_task(self._edit(session, kwargs, embed_sig, view_sig))
+
+    async def _edit(self, session, kwargs, embed_sig, view_sig):
+        try:
+            await session.edit(**kwargs)
+            if "embed" in kwargs:
+                session.embed_sig = embed_sig
+            if "view" in kwargs:
+                session.view_sig = view_sig
+            self.stats["edits"] += 1
+        except discord.HTTPException as e:
+            if e.status == 429:
+                self.stats["rate_limited"] += 1
+                session.due = time.monotonic() + session.seconds() * 4
+            elif e.status in (401, 403, 404):
+                self._gone(session)
+            else:
+                self.stats["errors"] += 1
+                print(f"Render Error ({session.key}): {e}")
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"Render Error ({session.key}): {e}")
+        finally:
+            session.busy = False
+
+    def _gone(self, session):
+        if self._sessions.get(session.key) is session:
+            del self._sessions[session.key]
+        if session.on_gone:
+            session.on_gone()
+
+
+RENDER = RenderScheduler(config.RENDER_EDIT_BUDGET, config.RENDER_ROUTE_GAP)
@@ -7,6 +7,16 @@ import time
 from mo_co import config, database, utils, game_data
 from mo_co.game_data import scaling
 from mo_co import pedia
+from mo_co.entity_state import (
+    NO_STATUS,
+    StatMults,
+    add_status,
+    has_status,
+    intern_id,
+    prune,
+)
+from mo_co.game_clock import CLOCK
+from mo_co.render import RENDER
 
 
 TICK_RATE = 2.0
@@ -47,10 +57,13 @@ class RiftInstance:
         human_hps = []
         human_lvls = []
 
+        contexts = database.get_squad_contexts(lobby_data["members"])
         for uid in lobby_data["members"]:
             member_info = lobby_data["member_info"].get(uid, {})
             p_name = member_info.get("name", "Hunter")
-            p = RiftPlayer(bot, uid, self.rec_gp, name=p_name)
+            p = RiftPlayer(
+                bot, uid, self.rec_gp, name=p_name, context=contexts.get(uid)
+            )
             self.players.append(p)
             self.player_stats[uid] = RiftStats()
 
@@ -86,6 +99,7 @@ class RiftInstance:
         self.logs = []
         self.message = None
         self.banked_loot = {"xp": 0, "shards": 0, "cores": 0}
+        self.last_input = time.monotonic()
 
         if self.rift_key == "rift_van_defense":
             van = RiftSummon("Research Van", 50000, 0, 9999, "🚐", 0, "system")
@@ -155,20 +169,37 @@ class RiftInstance:
     async def start_loop(self):
         view = RiftCombatView(self)
         self.message = await self.channel.send(embed=self._build_embed(), view=view)
-        while self.active:
-            await asyncio.sleep(TICK_RATE)
-            await self._tick()
-            if not self.active:
-                break
-            try:
-                new_view = RiftCombatView(self)
-                await self.message.edit(embed=self._build_embed(), view=new_view)
-            except discord.NotFound:
-                self.active = False
-            except Exception as e:
-                print(f"Rift Loop Error: {e}")
+        RENDER.register(
+            self.message.id,
+            self.message,
+            lambda: (self._build_embed(), view) if self.active else None,
+            TICK_RATE,
+            on_gone=self._on_message_gone,
+        )
+        CLOCK.register(
+            self.message.id,
+            self._clock_step,
+            TICK_RATE,
+            last_input=lambda: self.last_input,
+            on_stop=lambda: RENDER.unregister(self.message.id),
+            kind="rift",
+        )
+
+    def _clock_step(self):
+        if self.active:
+            self._tick()
+        return self.active
+
+    def note_input(self):
+        self.last_input = time.monotonic()
 
-    async def _tick(self):
+    def _finish(self, success):
+        asyncio.create_task(self._end_game(success=success))
+
+    def _on_message_gone(self):
+        self.active = False
+
+    def _tick(self):
         self.turn_count += 1
 
         decay = 1
@@ -179,7 +210,7 @@ class RiftInstance:
         if self.stability <= 0:
             self.logs.append("🌀 **Rift Collapsed due to instability!**")
             self.active = False
-            await self._end_game(success=False)
+            self._finish(False)
             return
 
         if len(self.logs) > 8:
@@ -216,7 +247,7 @@ class RiftInstance:
             if not van or van.hp <= 0:
                 self.logs.append("🔥 **Research Van Destroyed!**")
                 self.active = False
-                await self._end_game(success=False)
+                self._finish(False)
                 return
 
         if not any(
@@ -224,7 +255,7 @@ class RiftInstance:
         ):
             self.logs.append("💀 **Squad Wiped!**")
             self.active = False
-            await self._end_game(success=False)
+            self._finish(False)
             return
 
         dead_mobs = [m for m in self.mobs if m.hp <= 0 and not m.loot_awarded]
@@ -245,7 +276,7 @@ class RiftInstance:
             if self.wave_index >= len(self.rift_def["waves"]):
                 self.logs.append("🏆 **Rift Cleared!**")
                 self.active = False
-                await self._end_game(success=True)
+                self._finish(True)
                 return
             else:
                 self.mobs = self._spawn_wave(self.wave_index)
@@ -308,8 +339,12 @@ class RiftInstance:
 
     def _distribute_loot(self, partial):
         real_players = [p for p in self.allies if isinstance(p, RiftPlayer)]
+        rows = database.get_users_data(p.user_id for p in real_players)
+        batch, awarded = {}, {}
         for p in real_players:
-            u = database.get_user_data(p.user_id)
+            u = rows.get(p.user_id)
+            if not u:
+                continue
             raw_xp = int(self.banked_loot["xp"] * (0.5 if partial else 1.0))
             current_daily = u["daily_xp_total"]
             can_gain = max(0, config.XP_DAILY_CAP - current_daily)
@@ -325,39 +360,26 @@ class RiftInstance:
             final_xp = (xp_to_boost * config.XP_BOOST_MULT) + xp_unboosted
             fuel_consumed = xp_to_boost
 
-            current_xp = u["xp"]
-            current_elite = u["elite_xp"]
-            max_base = utils.get_max_base_xp()
-            is_elite = bool(u["is_elite"])
+            batch[p.user_id] = {
+                "xp_award": final_xp,
+                "daily_xp_total": -actual_raw,
+                "daily_xp_boosted": -fuel_consumed,
+                "chaos_shards": self.banked_loot["shards"],
+                "chaos_cores": self.banked_loot["cores"],
+            }
+            awarded[p.user_id] = final_xp
 
-            xp_to_base = 0
-            xp_to_elite = 0
+        database.increment_users_fields(
+            batch, floors={"daily_xp_total": 0, "daily_xp_boosted": 0}
+        )
 
-            if current_xp < max_base:
-                space = max_base - current_xp
-                if final_xp <= space:
-                    xp_to_base = final_xp
-                else:
-                    xp_to_base = space
-                    if is_elite:
-                        xp_to_elite = final_xp - space
-            else:
-                if is_elite:
-                    xp_to_elite = final_xp
-
-            updates = {
-                "xp": current_xp + xp_to_base,
-                "elite_xp": current_elite + xp_to_elite,
-                "daily_xp_total": max(0, u["daily_xp_total"] - actual_raw),
-                "daily_xp_boosted": max(0, u["daily_xp_boosted"] - fuel_consumed),
-                "chaos_shards": u["chaos_shards"] + self.banked_loot["shards"],
-                "chaos_cores": u["chaos_cores"] + self.banked_loot["cores"],
-            }
-            database.update_user_stats(p.user_id, updates)
-            hunt_cog = self.bot.get_cog("Hunting")
-            if hunt_cog:
+        hunt_cog = self.bot.get_cog("Hunting")
+        if hunt_cog:
+            rift_boss_name = self.rift_def["boss"]
+            for p in real_players:
+                if p.user_id not in awarded:
+                    continue
                 p_stats = self.player_stats.get(p.user_id) or RiftStats()
-                rift_boss_name = self.rift_def["boss"]
                 hunt_cog.update_progression(
                     p.user_id,
                     rift_boss_name,
@@ -366,7 +388,7 @@ class RiftInstance:
                     "Boss",
                     damage_sources=p_stats.damage_sources,
                     heal_sources=p_stats.heal_sources,
-                    loot_xp=final_xp,
+                    loot_xp=awarded[p.user_id],
                 )
 
     async def _end_game(self, success):
@@ -497,6 +519,23 @@ class RiftInstance:
 
 
 class RiftEntity:
+    __slots__ = (
+        "name",
+        "max_hp",
+        "hp",
+        "gp",
+        "owner_id",
+        "stunned",
+        "stun_duration",
+        "status_effects",
+        "is_dashing",
+        "death_time",
+        "total_healed_this_tick",
+        "hits_taken_this_tick",
+        "is_boss",
+        "defense_mult",
+    )
+
     def __init__(self, name, hp, gp):
         self.name, self.max_hp, self.hp, self.gp = name, int(hp), int(hp), gp
         (
@@ -508,7 +547,7 @@ class RiftEntity:
             None,
             False,
             0,
-            [],
+            NO_STATUS,
         )
         self.is_dashing, self.death_time = False, 0
         self.total_healed_this_tick = 0
@@ -524,23 +563,19 @@ class RiftEntity:
                 )
                 return
 
-        for s in self.status_effects:
-            if s["type"] == s_type:
-                s["duration"] = max(s["duration"], duration)
-                return
-        self.status_effects.append({"type": s_type, "duration": duration, "icon": icon})
+        self.status_effects = add_status(self.status_effects, s_type, duration, icon)
 
     def has_status(self, s_type):
-        return any(s["type"] == s_type for s in self.status_effects)
+        return has_status(self.status_effects, s_type)
 
     def tick_status(self):
         for s in self.status_effects:
-            s["duration"] -= TICK_RATE
-            if s["type"] == "POISON":
+            s.duration -= TICK_RATE
+            if s.type == "POISON":
                 self.take_damage(50)
-            if s["type"] == "REGEN":
+            if s.type == "REGEN":
                 self.register_heal(50)
-        self.status_effects = [s for s in self.status_effects if s["duration"] > 0]
+        self.status_effects = prune(self.status_effects)
         if self.stun_duration > 0:
             self.stun_duration -= TICK_RATE
             self.stunned = True
@@ -593,13 +628,21 @@ class RiftEntity:
                 self.stun_duration, self.stunned = 4.0, True
 
     def get_status_str(self):
-        icons = [s["icon"] for s in self.status_effects]
+        icons = [s.icon for s in self.status_effects]
         if self.stunned:
             icons.append("💫")
         return " ".join(icons)
 
 
 class RiftSummon(RiftEntity):
+    __slots__ = (
+        "duration",
+        "emblem",
+        "expired",
+        "taunt",
+        "source_id",
+    )
+
     def __init__(self, name, hp, gp, duration, emblem, owner_id, source_id):
         super().__init__(name, hp, gp)
         self.duration, self.emblem, self.expired = duration, emblem, False
@@ -631,6 +674,19 @@ class RiftSummon(RiftEntity):
 
 
 class RiftBot(RiftEntity):
+    __slots__ = (
+        "bot",
+        "level",
+        "emblem",
+        "dash_cd",
+        "combo_count",
+        "passives",
+        "rec_gp",
+        "weapon_id",
+        "gadgets",
+        "attack_pwr_bonus",
+    )
+
     def __init__(self, bot, name, level, rec_gp, avg_hp):
 
         hp = int(avg_hp * 1.1)
@@ -795,10 +851,35 @@ class RiftBot(RiftEntity):
 
 
 class RiftPlayer(RiftEntity):
-    def __init__(self, bot, user_id, recommended_gp, name=None):
-        u_data = database.get_user_data(user_id)
+    __slots__ = (
+        "bot",
+        "user_id",
+        "emblem",
+        "level",
+        "action_queue",
+        "dash_cd",
+        "combo_count",
+        "hits_taken",
+        "stat_mults",
+        "cdr_mult",
+        "dash_cd_max",
+        "regen_per_turn",
+        "extra_projectiles",
+        "combo_accel",
+        "dmg_mult",
+        "weapon_id",
+        "passives",
+        "gadgets",
+        "modules",
+    )
+
+    def __init__(self, bot, user_id, recommended_gp, name=None, context=None):
+        if context is None:
+            context = database.get_full_user_context(user_id)
+        u_data, kit, inv_map = context
         lvl, _, _ = utils.get_level_info(u_data["xp"])
-        base_hp, player_gp = utils.get_max_hp(user_id, lvl), utils.get_total_gp(user_id)
+        base_hp = utils.get_max_hp(user_id, lvl, kit, inv_map)
+        player_gp = utils.get_total_gp(user_id, kit, inv_map) if kit else 0
         super().__init__(u_data["current_title"] or "Hunter", base_hp, player_gp)
         self.bot, self.user_id, self.owner_id = bot, user_id, user_id
 
@@ -819,13 +900,7 @@ class RiftPlayer(RiftEntity):
         )
         self.dash_cd, self.combo_count, self.hits_taken = 0, 0, 0
 
-        self.stat_mults = {
-            "dmg": 1.0,
-            "heal": 1.0,
-            "crit": 0.0,
-            "pet_dmg": 1.0,
-            "hp": 1.0,
-        }
+        self.stat_mults = StatMults()
         self.cdr_mult = 1.0
         self.dash_cd_max = 6.0
         self.regen_per_turn = 0
@@ -838,7 +913,7 @@ class RiftPlayer(RiftEntity):
         else:
             self.defense_mult = min(2.0, ratio**1.5)
 
-        self._load_loadout(user_id)
+        self._load_loadout(kit, inv_map)
 
         self.max_hp = int(self.max_hp * self.stat_mults["hp"])
         self.hp = self.max_hp
@@ -850,9 +925,7 @@ class RiftPlayer(RiftEntity):
 
             self.dmg_mult = min(5.0, 1.0 + (abs(deficit) / 800.0))
 
-    def _load_loadout(self, uid):
-        kit = database.get_active_kit(uid)
-
+    def _load_loadout(self, kit, inv_map):
         self.weapon_id, self.passives, self.gadgets, self.modules = (
             "monster_slugger",
             {},
@@ -862,19 +935,19 @@ class RiftPlayer(RiftEntity):
 
         if kit:
             if kit["weapon_id"]:
-                w = database.get_item_instance(kit["weapon_id"])
+                w = inv_map.get(kit["weapon_id"])
                 if w:
-                    self.weapon_id = w["item_id"]
+                    self.weapon_id = intern_id(w["item_id"])
 
             for i in range(3):
                 inst_id = kit[f"gadget_{i+1}_id"]
                 if inst_id:
-                    g = database.get_item_instance(inst_id)
+                    g = inv_map.get(inst_id)
                     if g:
                         item_def = game_data.get_item(g["item_id"])
                         lvl = utils.get_effective_level(g["level"], self.level)
                         self.gadgets[i] = {
-                            "id": g["item_id"],
+                            "id": intern_id(g["item_id"]),
                             "name": item_def["name"],
                             "cd": 0,
                             "max_cd": 15,
@@ -886,21 +959,20 @@ class RiftPlayer(RiftEntity):
                             "bunch_of_dice",
                             "overcharged_amulet",
                         ]:
-                            self.passives[g["item_id"]] = lvl
+                            self.passives[intern_id(g["item_id"])] = lvl
 
             for i in range(3):
                 inst_id = kit[f"passive_{i+1}_id"]
                 if inst_id:
-                    p = database.get_item_instance(inst_id)
+                    p = inv_map.get(inst_id)
                     if p:
-                        self.passives[p["item_id"]] = utils.get_effective_level(
-                            p["level"], self.level
-                        )
+                        lvl = utils.get_effective_level(p["level"], self.level)
+                        self.passives[intern_id(p["item_id"])] = lvl
 
             for i in range(3):
                 inst_id = kit[f"ring_{i+1}_id"]
                 if inst_id:
-                    r = database.get_item_instance(inst_id)
+                    r = inv_map.get(inst_id)
                     if r:
                         rid = r["item_id"]
                         lvl = r["level"]
@@ -938,7 +1010,7 @@ class RiftPlayer(RiftEntity):
                                 self.cdr_mult *= 1.0 - (val1 / 100.0)
 
             if kit["elite_module_id"]:
-                m = database.get_item_instance(kit["elite_module_id"])
+                m = inv_map.get(kit["elite_module_id"])
                 if m:
                     mid, mlvl = m["item_id"], m["level"]
                     self.modules.append({"id": mid, "lvl": mlvl})
@@ -1385,6 +1457,15 @@ class RiftPlayer(RiftEntity):
 
 
 class RiftMob(RiftEntity):
+    __slots__ = (
+        "level",
+        "state",
+        "bot",
+        "icon",
+        "loot_awarded",
+        "ability_cd",
+    )
+
     def __init__(self, bot, name, level, is_boss=False):
 
         base_hp = (8000 if is_boss else 800) * (1 + (level / 20.0))
@@ -1525,6 +1606,7 @@ class CombatButton(Button):
                 )
 
             player.action_queue = self.action
+            self.view.instance.note_input()
             q_emoji = (
                 player.get_weapon_emoji() if self.action == "ATTACK" else self.emoji
             )
@@ -1610,6 +1692,7 @@ class SpecificGadgetButton(Button):
                 "❌ Action already queued!", ephemeral=True
             )
         self.view.player.action_queue = f"GADGET_{self.index}"
+        self.view.instance.note_input()
         await interaction.response.edit_message(
             content=f"{self.icon_str} **{self.label}** Queued!",
             embed=None,
@@ -1722,6 +1805,7 @@ class RiftLootView(View):
                 return
             for m in lobby["members"]:
                 lobby["ready"][m] = False
+            ACTIVE_LOBBIES[thread_id] = lobby
             await interaction.response.send_message(
                 embed=LobbyView(self.instance.bot, thread_id).get_embed(),
                 view=LobbyView(self.instance.bot, thread_id),
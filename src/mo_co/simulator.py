@@ -0,0 +1,656 @@
+"""
+Headless batch combat simulator for balance runs.
+
+    from mo_co import simulator
+    kit = simulator.Loadout("monster_slugger", 30, gadgets=[("monster_taser", 30)])
+    foe = simulator.Monster.hunt(36, "Overcharged", player_gp=900, recommended_gp=900)
+    print(simulator.run_batch(kit, foe, fights=20000, seed=7).summary())
+
+Runs N independent hunt fights (one hunter against one monster, following
+CombatEngine's "sim" rules) in lockstep. Fight state lives in per-field lists
+indexed by fight. Everything the loadout contributes is resolved once, before
+the first tick, through CombatEntity.setup_stats and game_data.scaling:
+weapon, gadget and passive values, cooldowns, ring multipliers, and crit
+chance per damage source. The loop itself does no item or config lookups.
+Each fight draws from its own random.Random(seed + i), so any fight can be
+replayed on its own.
+
+Balance knobs (global_damage_mult, mult_<item>) are read through
+database.get_config_float. Seed them with database.seed_config_cache to run
+without a database. Summons are simulated. Allies, elite modules and combat
+logs are not.
+
+    python -m mo_co.simulator --weapon monster_slugger --level 30 \\
+        --gadget monster_taser:30 --monster-level 36 --fights 20000
+"""
+
+import argparse
+import json
+import random
+from mo_co import database, game_data, utils
+from mo_co.combat_engine import CombatEngine, CombatEntity
+from mo_co.game_data import scaling
+
+
+DT = 2.0
+MAX_TURNS = 100
+
+PASSIVE_GADGETS = frozenset(
+    ["really_cool_sticker", "very_mean_pendant", "bunch_of_dice", "overcharged_amulet"]
+)
+TEAM_HEALS = frozenset(["splash_heal", "revitalizing_mist"])
+SINGLE_TARGET_GADGETS = frozenset(
+    [
+        "smart_fireworks",
+        "spicy_dagger",
+        "explosive_6_pack",
+        "multi_zapper",
+        "pepper_spray",
+    ]
+)
+GADGET_STUNS = {"monster_taser": 2.0, "boom_box": 1.5}
+GADGET_SUMMONS = {
+    "sheldon": "sheldon",
+    "pew3000": "turret",
+    "feel_better_bloom": "bloom",
+}
+PASSIVE_SOURCES = (
+    "smelly_socks",
+    "very_mean_pendant",
+    "auto_zapper",
+    "unstable_lazer",
+    "unstable_beam",
+    "gadget_battery",
+    "unstable_lightning",
+)
+
+WIN, LOSS, TIMEOUT = 1, -1, 0
+
+
+class Loadout:
+    """A hunter's kit. Item levels are capped at the player level, as in hunts."""
+
+    def __init__(
+        self,
+        weapon,
+        level,
+        modifier="Standard",
+        gadgets=(),
+        passives=None,
+        rings=(),
+        player_level=None,
+    ):
+        self.weapon = weapon
+        self.level = level
+        self.modifier = modifier
+        self.gadgets = list(gadgets)
+        self.passives = dict(passives or {})
+        self.rings = list(rings)
+        self.player_level = player_level or level
+
+    def build(self):
+        lvl = self.player_level
+        entity = CombatEntity(
+            CombatEngine(None), "Simulated Hunter", is_player=True, is_bot=True
+        )
+        entity.setup_stats(
+            lvl,
+            weapon={
+                "id": self.weapon,
+                "modifier": self.modifier,
+                "level": min(self.level, lvl),
+            },
+            gadgets=[{"id": g, "lvl": min(g_lvl, lvl)} for g, g_lvl in self.gadgets],
+            passives=dict(self.passives),
+            rings=[{"id": r, "lvl": r_lvl} for r, r_lvl in self.rings],
+        )
+        return entity
+
+
+class Monster:
+    def __init__(self, level, hp, attack, is_boss=False, player_atk_scale=1.0):
+        self.level = level
+        self.hp = int(hp)
+        self.attack = int(attack)
+        self.is_boss = is_boss
+        self.player_atk_scale = player_atk_scale
+
+    @classmethod
+    def hunt(
+        cls, level, modifier="Standard", boss=False, player_gp=50, recommended_gp=50
+    ):
+        """A hunt spawn. `level` is the XP level (after modifier bumps)."""
+        hp, attack, scale = scaling.get_hunt_monster_stats(
+            level, modifier, boss, player_gp, recommended_gp
+        )
+        # Hunts scale boss stats but never flag the spawned entity as a boss.
+        return cls(level, hp, attack, player_atk_scale=scale)
+
+
+class _Kit:
+    """Per-loadout constants, resolved once per batch."""
+
+    def __init__(self, loadout, monster):
+        e = loadout.build()
+        m = e.stat_mults
+        p = e.passives
+
+        def passive(item_id):
+            return scaling.get_passive_value(item_id, p[item_id]) if item_id in p else 0
+
+        self.level = e.level
+        self.max_hp = e.max_hp
+        self.tick_cap = int(e.max_hp * 0.45)
+        self.weapon = e.weapon_id
+        self.modifier = e.weapon_data.get("modifier", "Standard")
+        self.heal_mult = m["heal"]
+        self.heal_crit = m["heal_crit"]
+        self.executioner = m["executioner"]
+        self.pet_dmg = m["pet_dmg"]
+        self.pet_crit = m["pet_crit"]
+        self.regen = e.regen_per_turn * DT
+        self.extra_projectiles = e.extra_projectiles
+        self.combo_accel = e.combo_accel
+        self.charm_mult = 1.0 + passive("healing_charm") / 100.0
+
+        weapon_dmg = scaling.get_weapon_damage(self.weapon, e.weapon_data["level"])
+        attack_pwr = e.attack_pwr
+        if monster.player_atk_scale < 1.0 and e.level >= 5:
+            attack_pwr = int(attack_pwr * monster.player_atk_scale)
+        self.hit = int((weapon_dmg + attack_pwr) * m["dmg"])
+        self.spin = int(weapon_dmg * 0.5 * DT)
+        self.staff_heal = 50 + (e.level * 5)
+        self.lightning = 150 + (e.level * 10)
+
+        socks = int(passive("smelly_socks") * (DT / 2.0))
+        self.socks = int(socks * m["dmg"]) if m["dmg"] > 1.0 else socks
+        self.pendant = (
+            int(
+                scaling.get_gadget_value("very_mean_pendant", p["very_mean_pendant"])
+                * (DT / 2.0)
+            )
+            if "very_mean_pendant" in p
+            else 0
+        )
+        self.zapper = int(passive("auto_zapper"))
+        self.mixtape = 30 + (p["randb_mixtape"] * 10) if "randb_mixtape" in p else 0
+        self.lazer = passive("unstable_lazer") if "unstable_lazer" in p else None
+        self.beam = passive("unstable_beam") if "unstable_beam" in p else None
+        self.battery = passive("gadget_battery") if "gadget_battery" in p else None
+        self.lightning_pct = passive("unstable_lightning")
+        self.vampire = passive("vampire_teeth") / 100.0
+        self.dodge = passive("pocket_airbag") + passive("bunch_of_dice")
+        self.chicken = passive("chicken_o_matic")
+        self.cactus = passive("cactus_charm") / 100.0
+        self.tank_mult = 0.7 if self.weapon == "toothpick_and_shield" else 1.0
+
+        cd_scale = e.cdr_mult * e.modifier_cd_penalty
+        self.gadgets = []
+        for g in e.gadgets:
+            gid, g_lvl = g["id"], g["lvl"]
+            val = scaling.get_gadget_value(gid, g_lvl)
+            if gid not in TEAM_HEALS and gid not in ("vitamin_shot", "life_jacket"):
+                val = int(val * m["dmg"])
+            if gid in TEAM_HEALS or gid == "vitamin_shot":
+                val = int(val * self.heal_mult)
+            cooldown = max(1.0, scaling.get_cooldown(gid) * cd_scale)
+            self.gadgets.append((gid, g_lvl, val, cooldown))
+
+        self.summon_stats = {}
+        for name, s_lvl in (("wolf", e.level), ("bee", e.level)):
+            self.summon_stats[name] = self._summon(name, s_lvl)
+        for gid, g_lvl, _, _ in self.gadgets:
+            if gid in GADGET_SUMMONS:
+                name = GADGET_SUMMONS[gid]
+                self.summon_stats[name] = self._summon(name, g_lvl)
+        self.bloom_heal = scaling.get_gadget_value("feel_better_bloom", 1)
+
+        crit_by_type = {
+            "weapon": m["weapon_crit"],
+            "gadget": m["gadget_crit"],
+            "passive": m["passive_crit"],
+        }
+        self.crit = {}
+        sources = [self.weapon] + list(PASSIVE_SOURCES) + [g[0] for g in self.gadgets]
+        for source in sources:
+            item_def = game_data.get_item(source)
+            stype = item_def["type"] if item_def else "unknown"
+            self.crit[source] = crit_by_type.get(stype, 0)
+
+    def _summon(self, name, level):
+        hp, atk = scaling.get_summon_stats(name, level)
+        return hp, int(atk * self.pet_dmg)
+
+
+class _Batch:
+    def __init__(self, kit, monster, fights, seed):
+        n = fights
+        self.kit = kit
+        self.monster = monster
+        self.rngs = [random.Random(seed + i) for i in range(n)]
+        self.p_hp = [kit.max_hp] * n
+        self.m_hp = [monster.hp] * n
+        self.combo = [0] * n
+        self.hits_taken = [0] * n
+        self.windup = [False] * n
+        self.m_stun = [0.0] * n
+        self.m_poison = [0.0] * n
+        self.p_shield = [0.0] * n
+        self.p_spin = [0.0] * n
+        self.p_taunt = [0.0] * n
+        self.taunting = [False] * n
+        self.p_healed = [0] * n
+        self.p_hits = [0] * n
+        self.m_hits = [0] * n
+        self.g_cd = [[0.0] * n for _ in kit.gadgets]
+        self.summons = [[] for _ in range(n)]
+        self.healing = [0] * n
+        self.outcome = [TIMEOUT] * n
+        self.turns = [MAX_TURNS] * n
+
+    def run(self):
+        active = list(range(len(self.p_hp)))
+        for turn in range(1, MAX_TURNS + 1):
+            still = []
+            for i in active:
+                result = self._tick(i, turn)
+                if result is None:
+                    still.append(i)
+                else:
+                    self.outcome[i] = result
+                    self.turns[i] = turn
+            active = still
+            if not active:
+                break
+        return self
+
+    def _tick(self, i, turn):
+        rng = self.rngs[i]
+        self.p_hits[i] = 0
+        self.m_hits[i] = 0
+        ready = list(self.summons[i])
+
+        self._player_tick(i, turn, rng)
+        for s in ready:
+            if s[1] > 0:
+                self._summon_tick(i, s, rng)
+        if self.m_hp[i] <= 0:
+            return WIN
+
+        self._monster_tick(i, rng)
+        self.summons[i] = [s for s in self.summons[i] if s[1] > 0]
+        if self.p_hp[i] <= 0:
+            return LOSS
+        if self.m_hp[i] <= 0:
+            return WIN
+        return None
+
+    def _player_tick(self, i, turn, rng):
+        k = self.kit
+        self.p_healed[i] = 0
+        for cds in self.g_cd:
+            if cds[i] > 0:
+                cds[i] -= DT
+
+        if self.p_shield[i] > 0:
+            self.p_shield[i] -= DT
+        self.taunting[i] = self.p_taunt[i] > 0
+        if self.taunting[i]:
+            self.p_taunt[i] -= DT
+        if self.p_spin[i] > 0:
+            self.p_spin[i] -= DT
+            self._hit_monster(i, k.spin, 0, k.executioner, rng)
+
+        if k.regen > 0:
+            self._heal(i, k.regen, rng)
+
+        if k.socks:
+            self._hit_monster(i, k.socks, k.crit["smelly_socks"], k.executioner, rng)
+        if k.pendant:
+            dealt = self._hit_monster(
+                i, k.pendant, k.crit["very_mean_pendant"], k.executioner, rng
+            )
+            if dealt > 0:
+                self._heal(i, int(dealt * 0.20), rng)
+        if k.zapper:
+            self._hit_monster(i, k.zapper, k.crit["auto_zapper"], k.executioner, rng)
+        if k.mixtape and turn % 4 == 0:
+            self._heal(i, k.mixtape, rng)
+
+        for j, cds in enumerate(self.g_cd):
+            if cds[i] <= 0:
+                self._use_gadget(i, j, rng)
+        self._attack(i, rng)
+
+    def _use_gadget(self, i, j, rng):
+        k = self.kit
+        gid, g_lvl, val, cooldown = k.gadgets[j]
+        if self.g_cd[j][i] > 0 or gid in PASSIVE_GADGETS:
+            return
+        self.g_cd[j][i] = cooldown
+
+        if gid in TEAM_HEALS:
+            self._heal_team(i, val, rng)
+        elif gid == "vitamin_shot":
+            self._heal(i, val, rng)
+        elif gid in SINGLE_TARGET_GADGETS:
+            self._hit_monster(i, val, k.crit[gid], k.executioner, rng)
+        elif gid in GADGET_STUNS:
+            self._hit_monster(i, val, k.crit[gid], k.executioner, rng)
+            self.m_stun[i] = max(self.m_stun[i], GADGET_STUNS[gid])
+        elif gid == "life_jacket":
+            self.p_shield[i] = max(self.p_shield[i], 6.0)
+        elif gid == "super_loud_whistle":
+            self.p_taunt[i] = max(self.p_taunt[i], 8.0)
+        elif gid in GADGET_SUMMONS:
+            self._spawn(i, GADGET_SUMMONS[gid])
+
+        if k.battery is not None:
+            self._hit_monster(
+                i, k.battery, k.crit["gadget_battery"], k.executioner, rng
+            )
+        if k.lightning_pct and rng.random() * 100 < k.lightning_pct:
+            self._hit_monster(
+                i, k.lightning, k.crit["unstable_lightning"], k.executioner, rng
+            )
+
+    def _attack(self, i, rng):
+        k = self.kit
+        w = k.weapon
+        boss = self.monster.is_boss
+        self.combo[i] += k.combo_accel
+        combo = self.combo[i]
+        base = k.hit
+        mult = 1.0
+
+        if w == "monster_slugger" and combo % 4 == 0:
+            mult = 1.5
+        elif w == "techno_fists":
+            if combo % 10 == 0:
+                mult = 2.0
+                if not boss:
+                    self._stun(i, 2.0)
+            else:
+                for _ in range(k.extra_projectiles):
+                    self._hit_monster(i, base, 0, k.executioner, rng)
+        elif w == "wolf_stick" and combo % 6 == 0:
+            self._spawn(i, "wolf")
+        elif w == "buzz_kill" and combo % 3 == 0:
+            self._spawn(i, "bee")
+        elif w == "staff_of_good_vibes":
+            mult = 0.5
+            heal_val = k.staff_heal
+            if combo % 10 == 0:
+                mult = 3.0
+                heal_val *= 3
+            self._heal_team(i, int(heal_val * k.heal_mult), rng)
+        elif w == "medicne_ball" and combo % 3 == 0:
+            self._heal_team(i, int(k.max_hp * 0.05 * k.heal_mult), rng)
+        elif w == "hornbow":
+            if combo % 3 == 0:
+                mult = 1.5
+        elif w == "squid_blades" and combo >= 8:
+            mult = 4.0
+            self.combo[i] = 0
+            if not boss:
+                self._stun(i, 2.0)
+        elif w == "cpu_bomb" and combo % 8 == 0:
+            mult = 2.5
+            if not boss:
+                self._stun(i, 2.0)
+        elif w == "singularity" and combo % 6 == 0:
+            mult = 1.2
+            for cds in self.g_cd:
+                cds[i] = max(0, cds[i] - 1.5)
+        elif w == "toothpick_and_shield" and self.hits_taken[i] >= 15:
+            mult = 3.0
+            self.hits_taken[i] = 0
+            if not boss:
+                self._stun(i, 2.0)
+        elif w == "portable_portal":
+            if combo % 5 == 0 and self.g_cd:
+                self.g_cd[-1][i] = 0
+                self._use_gadget(i, len(self.g_cd) - 1, rng)
+        elif w == "speedshot" and combo % 10 == 0:
+            self._hit_monster(i, int(base * 0.5), 0, k.executioner, rng)
+            self._hit_monster(i, int(base * 0.5), 0, k.executioner, rng)
+        elif w == "poison_bow" and combo % 5 == 0:
+            self.m_poison[i] = max(self.m_poison[i], 8.0)
+        elif w == "spinsickle" and combo % 6 == 0:
+            self.p_spin[i] = max(self.p_spin[i], 5.0)
+
+        final = int(base * mult)
+        if "Chaos" in k.modifier:
+            if k.modifier == "Overcharged Chaos":
+                final = int(final * rng.uniform(0.75, 2.0))
+            else:
+                final = int(final * rng.uniform(0.5, 4.0))
+        if "Toxic" in k.modifier:
+            duration = 10.0 if w == "poison_bow" else 5.0
+            self.m_poison[i] = max(self.m_poison[i], duration)
+
+        dealt = self._hit_monster(i, final, k.crit[w], k.executioner, rng)
+
+        if k.lazer is not None and rng.random() < 0.20:
+            self._hit_monster(i, k.lazer, k.crit["unstable_lazer"], k.executioner, rng)
+        if k.beam is not None and rng.random() < 0.05:
+            self._hit_monster(i, k.beam, k.crit["unstable_beam"], k.executioner, rng)
+        if k.vampire:
+            self._heal(i, dealt * k.vampire, rng)
+
+    def _stun(self, i, duration):
+        self.m_stun[i] = max(self.m_stun[i], duration)
+
+    def _spawn(self, i, name):
+        hp, atk = self.kit.summon_stats[name]
+        # [name, hp, max_hp, attack, fresh, healed_this_tick, hits_this_tick]
+        self.summons[i].append([name, hp, hp, atk, True, 0, 0])
+
+    def _summon_tick(self, i, s, rng):
+        k = self.kit
+        s[4], s[5], s[6] = False, 0, 0
+        name = s[0]
+        if name == "sheldon":
+            return
+        if name == "bloom":
+            self._heal_team(i, k.bloom_heal, rng)
+            return
+        self._hit_monster(i, s[3] * k.pet_dmg, k.pet_crit, 1.0, rng)
+
+    def _monster_tick(self, i, rng):
+        m = self.monster
+        self.m_hits[i] = 0
+        stunned = self.m_stun[i] > 0
+        if stunned:
+            self.m_stun[i] -= DT
+        if self.m_poison[i] > 0:
+            self.m_poison[i] -= DT
+            self._hit_monster(i, 50 * DT, 0, 1.0, rng)
+        if stunned:
+            self.windup[i] = False
+            return
+
+        if not self.windup[i]:
+            if rng.random() < 0.50:
+                self.windup[i] = True
+                return
+        self.windup[i] = False
+        dmg = m.attack
+        if m.is_boss and rng.random() < 0.2:
+            dmg = int(dmg * 1.5)
+
+        summons = [s for s in self.summons[i] if s[1] > 0]
+        target = None
+        if self.taunting[i]:
+            target = "player"
+        else:
+            target = next((s for s in summons if s[0] == "sheldon" and s[4]), None)
+        if target is None:
+            pick = rng.randrange(len(summons) + 1)
+            target = "player" if pick == 0 else summons[pick - 1]
+
+        if target == "player":
+            taken = self._hit_player(i, dmg, rng)
+            if taken > 0 and self.kit.cactus:
+                self._hit_monster(i, int(taken * self.kit.cactus), 0, 1.0, rng)
+        else:
+            taken = int(dmg)
+            if target[6] > 0:
+                taken = int(taken * (0.85 ** target[6]))
+            target[6] += 1
+            target[1] -= taken
+
+    def _hit_monster(self, i, amount, crit, executioner, rng):
+        if crit > 0 and rng.random() * 100 < crit:
+            amount *= 3.0
+        if self.m_hp[i] / max(1, self.monster.hp) < 0.2:
+            amount *= executioner
+        dealt = int(amount)
+        hits = self.m_hits[i]
+        if hits > 0:
+            dealt = int(dealt * (0.85**hits))
+        self.m_hits[i] = hits + 1
+        self.m_hp[i] -= dealt
+        return dealt
+
+    def _hit_player(self, i, amount, rng):
+        k = self.kit
+        if self.p_shield[i] > 0:
+            return 0
+        amount = min(amount, k.max_hp * 0.35)
+        dodge = k.dodge + (25 if self.p_spin[i] > 0 else 0)
+        if rng.random() * 100 < dodge:
+            return 0
+        if k.chicken and rng.random() * 100 < k.chicken:
+            return 0
+        taken = int(amount * k.tank_mult)
+        if self.p_hits[i] > 0:
+            taken = int(taken * (0.85 ** self.p_hits[i]))
+        self.p_hits[i] += 1
+        self.p_hp[i] -= taken
+        self.hits_taken[i] += 1
+        return taken
+
+    def _heal(self, i, amount, rng):
+        k = self.kit
+        if k.heal_crit > 0 and rng.random() * 100 < k.heal_crit:
+            amount *= 3.0
+        budget = max(0, k.tick_cap - self.p_healed[i])
+        amount *= k.charm_mult * k.heal_mult
+        actual = max(0, int(min(amount, budget, max(0, k.max_hp - self.p_hp[i]))))
+        self.p_hp[i] += actual
+        self.p_healed[i] += actual
+        self.healing[i] += actual
+        return actual
+
+    def _heal_team(self, i, amount, rng):
+        self._heal(i, amount, rng)
+        for s in self.summons[i]:
+            budget = max(0, int(s[2] * 0.45) - s[5])
+            actual = max(0, int(min(amount, budget, max(0, s[2] - s[1]))))
+            s[1] += actual
+            s[5] += actual
+
+
+def _dist(values):
+    if not values:
+        return None
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return {
+        "mean": round(sum(ordered) / len(ordered), 2),
+        "p10": ordered[int(last * 0.10)],
+        "p50": ordered[int(last * 0.50)],
+        "p90": ordered[int(last * 0.90)],
+    }
+
+
+class BatchReport:
+    def __init__(self, batch):
+        self.fights = len(batch.outcome)
+        self.outcome = batch.outcome
+        self.turns = batch.turns
+        max_hp = batch.monster.hp
+        self.damage = [min(max_hp, max_hp - hp) for hp in batch.m_hp]
+        self.hp_left = [max(0, hp) / batch.kit.max_hp for hp in batch.p_hp]
+        self.healing = batch.healing
+
+    def summary(self):
+        n = self.fights
+        wins = [t * DT for o, t in zip(self.outcome, self.turns) if o == WIN]
+        dps = [d / (t * DT) for d, t in zip(self.damage, self.turns)]
+        return {
+            "fights": n,
+            "win_rate": round(self.outcome.count(WIN) / n, 4),
+            "death_rate": round(self.outcome.count(LOSS) / n, 4),
+            "timeout_rate": round(self.outcome.count(TIMEOUT) / n, 4),
+            "ttk_seconds": _dist(wins),
+            "dps": _dist([round(v, 1) for v in dps]),
+            "hp_left_pct": _dist([round(v * 100, 1) for v in self.hp_left]),
+            "healing": _dist(self.healing),
+        }
+
+
+def run_batch(loadout, monster, fights=1000, seed=0):
+    """Simulate `fights` seeded fights of `loadout` against `monster`."""
+    kit = _Kit(loadout, monster)
+    return BatchReport(_Batch(kit, monster, fights, seed).run())
+
+
+def _pairs(values):
+    pairs = []
+    for v in values or []:
+        item_id, _, lvl = v.partition(":")
+        pairs.append((item_id, int(lvl or 1)))
+    return pairs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch hunt combat simulator")
+    parser.add_argument("--weapon", required=True)
+    parser.add_argument("--level", type=int, required=True)
+    parser.add_argument("--player-level", type=int)
+    parser.add_argument("--modifier", default="Standard")
+    parser.add_argument("--gadget", action="append", help="item_id:level")
+    parser.add_argument("--passive", action="append", help="item_id:level")
+    parser.add_argument("--ring", action="append", help="item_id:level")
+    parser.add_argument("--monster-level", type=int, required=True)
+    parser.add_argument("--monster-modifier", default="Standard")
+    parser.add_argument("--boss", action="store_true")
+    parser.add_argument("--player-gp", type=int, default=50)
+    parser.add_argument("--rgp", type=int, default=50)
+    parser.add_argument("--fights", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--set",
+        action="append",
+        metavar="KEY=VALUE",
+        help="balance knob such as global_damage_mult=1.1 (no database needed)",
+    )
+    args = parser.parse_args(argv)
+
+    knobs = dict(v.split("=", 1) for v in args.set or [])
+    database.seed_config_cache(knobs)
+
+    loadout = Loadout(
+        args.weapon,
+        args.level,
+        modifier=args.modifier,
+        gadgets=_pairs(args.gadget),
+        passives=dict(_pairs(args.passive)),
+        rings=_pairs(args.ring),
+        player_level=args.player_level,
+    )
+    monster = Monster.hunt(
+        args.monster_level,
+        args.monster_modifier,
+        boss=args.boss,
+        player_gp=args.player_gp,
+        recommended_gp=args.rgp,
+    )
+    report = run_batch(loadout, monster, fights=args.fights, seed=args.seed)
+    print(json.dumps(report.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
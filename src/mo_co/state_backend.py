@@ -0,0 +1,205 @@
+"""
+Live game state shared by every shard process.
+
+World presence, shared bosses, team lobbies, the ranked queue, the Cool Zone
+and the rotating elite/world events used to live in module globals, which
+tied the whole game to one process. They now go through STATE, picked with
+STATE_BACKEND:
+
+- "memory" (default): a dict in this process. Values are stored as live
+  objects, so single-process behaviour is unchanged.
+- "sqlite": a local SQLite file at STATE_DB_PATH that several shard
+  processes on one host open together. Values are pickled, and update() runs
+  inside one write transaction so read-modify-write is atomic across
+  processes.
+
+Both backends keep values in namespaces. Discord objects such as
+interactions and messages stay in the process that owns them; only plain
+data is stored here. A value read from the sqlite backend is a copy, so
+callers write it back after mutating it.
+
+The per-process caches in database.py (kits, known users, system_config) and
+the leaderboard publish their invalidations here as version counters in the
+"cache_versions" namespace.
+"""
+
+import pickle
+import sqlite3
+import threading
+from mo_co import config
+
+
+class MemoryBackend:
+    name = "memory"
+
+    def __init__(self):
+        self._spaces = {}
+        self._lock = threading.RLock()
+
+    def get(self, ns, key, default=None):
+        return self._spaces.get(ns, {}).get(key, default)
+
+    def set(self, ns, key, value):
+        with self._lock:
+            self._spaces.setdefault(ns, {})[key] = value
+
+    def delete(self, ns, key):
+        with self._lock:
+            self._spaces.get(ns, {}).pop(key, None)
+
+    def items(self, ns):
+        return list(self._spaces.get(ns, {}).items())
+
+    def update(self, ns, key, fn, default=None):
+        """Store fn(current) and return it. Returning None deletes the key."""
+        with self._lock:
+            space = self._spaces.setdefault(ns, {})
+            value = fn(space.get(key, default))
+            if value is None:
+                space.pop(key, None)
+            else:
+                space[key] = value
+        return value
+
+
+class SQLiteBackend:
+    name = "sqlite"
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=10, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS live_state "
+            "(ns TEXT, key BLOB, value BLOB, PRIMARY KEY (ns, key))"
+        )
+
+    @staticmethod
+    def _key(key):
+        return pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _read(self, ns, key):
+        row = self._conn.execute(
+            "SELECT value FROM live_state WHERE ns = ? AND key = ?",
+            (ns, self._key(key)),
+        ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def _write(self, ns, key, value):
+        if value is None:
+            self._conn.execute(
+                "DELETE FROM live_state WHERE ns = ? AND key = ?",
+                (ns, self._key(key)),
+            )
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO live_state (ns, key, value) VALUES (?, ?, ?)",
+            (ns, self._key(key), pickle.dumps(value, pickle.HIGHEST_PROTOCOL)),
+        )
+
+    def get(self, ns, key, default=None):
+        with self._lock:
+            value = self._read(ns, key)
+        return default if value is None else value
+
+    def set(self, ns, key, value):
+        with self._lock:
+            self._write(ns, key, value)
+
+    def delete(self, ns, key):
+        with self._lock:
+            self._write(ns, key, None)
+
+    def items(self, ns):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM live_state WHERE ns = ?", (ns,)
+            ).fetchall()
+        return [(pickle.loads(k), pickle.loads(v)) for k, v in rows]
+
+    def update(self, ns, key, fn, default=None):
+        """Store fn(current) and return it. Returning None deletes the key."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                current = self._read(ns, key)
+                value = fn(default if current is None else current)
+                self._write(ns, key, value)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return value
+
+
+def make_backend(name, path=None):
+    if name == "memory":
+        return MemoryBackend()
+    if name == "sqlite":
+        return SQLiteBackend(path or config.STATE_DB_PATH)
+    raise ValueError(f"Unknown STATE_BACKEND: {name}")
+
+
+class SharedMap:
+    """
+    Dict-style view of one STATE namespace.
+
+    Reads return a copy on shared backends: after mutating a value in place,
+    assign it back (`LOBBIES[tid] = lobby`) so other shards see the change.
+    """
+
+    def __init__(self, ns):
+        self.ns = ns
+
+    def get(self, key, default=None):
+        return STATE.get(self.ns, key, default)
+
+    def __getitem__(self, key):
+        value = STATE.get(self.ns, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        STATE.set(self.ns, key, value)
+
+    def __delitem__(self, key):
+        STATE.delete(self.ns, key)
+
+    def __contains__(self, key):
+        return STATE.get(self.ns, key) is not None
+
+    def pop(self, key, default=None):
+        taken = []
+
+        def take(current):
+            taken.append(current)
+            return None
+
+        STATE.update(self.ns, key, take)
+        return default if taken[0] is None else taken[0]
+
+    def update(self, key, fn, default=None):
+        return STATE.update(self.ns, key, fn, default)
+
+    def items(self):
+        return STATE.items(self.ns)
+
+    def keys(self):
+        return [k for k, _ in STATE.items(self.ns)]
+
+    def values(self):
+        return [v for _, v in STATE.items(self.ns)]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(STATE.items(self.ns))
+
+
+STATE = make_backend(config.STATE_BACKEND)
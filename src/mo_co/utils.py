@@ -1,5 +1,5 @@
 import discord
-from mo_co import config, database, game_data
+from mo_co import config, database, game_data, levels
 from mo_co.game_data import scaling
 from datetime import datetime, timedelta
 import asyncio
@@ -116,37 +116,15 @@ def format_item(
 
 
 def get_level_info(total_xp):
-    cumulative_xp = 0
-    for entry in config.LEVEL_DATA:
-        level = entry["lvl"]
-        cost = entry["xp_cost"]
-        if total_xp < cumulative_xp + cost:
-            current_progress = total_xp - cumulative_xp
-            return level, cost, current_progress
-        cumulative_xp += cost
-    return config.LEVEL_DATA[-1]["lvl"], 0, 0
+    return levels.level_info(total_xp)
 
 
 def get_max_base_xp():
-    return sum(e["xp_cost"] for e in config.LEVEL_DATA)
+    return levels.MAX_BASE_XP
 
 
 def get_elite_level_info(elite_xp):
-    for i in range(len(config.ELITE_LEVEL_MAP) - 1):
-        curr_lvl, curr_xp = config.ELITE_LEVEL_MAP[i]
-        next_lvl, next_xp = config.ELITE_LEVEL_MAP[i + 1]
-        if elite_xp < next_xp:
-            range_xp, range_lvls = next_xp - curr_xp, next_lvl - curr_lvl
-            xp_per_lvl = range_xp / range_lvls
-            xp_in_range = elite_xp - curr_xp
-            levels_gained = int(xp_in_range // xp_per_lvl)
-            current_elite_lvl = curr_lvl + levels_gained
-            return (
-                current_elite_lvl,
-                int(xp_per_lvl),
-                int(xp_in_range % xp_per_lvl),
-            )
-    return config.ELITE_LEVEL_MAP[-1][0], 0, 0
+    return levels.elite_level_info(elite_xp)
 
 
 def get_active_passives(user_id, kit_cache=None, inv_cache=None):
@@ -177,47 +155,13 @@ def get_active_passives(user_id, kit_cache=None, inv_cache=None):
 
         pass
     else:
-        conn = database.get_connection()
-        u = conn.execute(
-            "SELECT active_kit_index FROM users WHERE user_id=?", (user_id,)
-        ).fetchone()
-        idx = u["active_kit_index"] if u else 1
-        kit = conn.execute(
-            "SELECT * FROM gear_kits WHERE user_id=? AND slot_index=?",
-            (user_id, idx),
-        ).fetchone()
-
-        if kit:
-            slots = [
-                "weapon_id",
-                "gadget_1_id",
-                "gadget_2_id",
-                "gadget_3_id",
-                "passive_1_id",
-                "passive_2_id",
-                "passive_3_id",
-                "elite_module_id",
-                "ring_1_id",
-                "ring_2_id",
-                "ring_3_id",
-            ]
-            for s in slots:
-                inst_id = kit[s]
-                if inst_id:
-                    row = conn.execute(
-                        "SELECT item_id, level FROM inventory WHERE instance_id=?",
-                        (inst_id,),
-                    ).fetchone()
-                    if row:
-                        effects[row["item_id"]] = row["level"]
-
-        dice = conn.execute(
-            "SELECT level FROM inventory WHERE user_id=? AND item_id='bunch_of_dice'",
-            (user_id,),
-        ).fetchone()
-        if dice:
-            effects["bunch_of_dice"] = dice[0]
-        conn.close()
+        resolved = database.resolve_active_kit(user_id)
+        if resolved["kit"]:
+            effects = get_active_passives(
+                user_id, resolved["kit"], resolved["inventory"]
+            )
+        if resolved["dice"] is not None:
+            effects["bunch_of_dice"] = resolved["dice"]
 
     return effects
 
@@ -238,11 +182,7 @@ def get_max_hp(user_id, level=None, kit_cache=None, inv_cache=None):
 
 
 def get_base_hp(level):
-    level = min(50, level)
-    for entry in config.LEVEL_DATA:
-        if entry["lvl"] == level:
-            return entry["hp"]
-    return config.LEVEL_DATA[-1]["hp"]
+    return levels.LEVEL_HP.get(min(50, level), config.LEVEL_DATA[-1]["hp"])
 
 
 def calculate_healing(base_amount, passives):
@@ -287,15 +227,11 @@ def get_emblem(level, is_elite=False, prestige=0):
 
 
 def get_level_reward(level):
-    for entry in config.LEVEL_DATA:
-        if entry["lvl"] == level:
-            return entry.get("reward", "kit")
-    return "kit"
+    return levels.LEVEL_REWARDS.get(level, "kit")
 
 
 def apply_level_reward(user_id, level):
     reward_raw = get_level_reward(level)
-    u_data = database.get_user_data(user_id)
     if "world" in reward_raw:
         return f"Unlocked: {reward_raw.split(':')[-1]}"
     elif "rift" in reward_raw:
@@ -307,8 +243,7 @@ def apply_level_reward(user_id, level):
     elif "elite" in reward_raw:
         return "Unlocked: Run /elite to enroll!"
     else:
-        new_kits = u_data["chaos_kits"] + 1
-        database.update_user_stats(user_id, {"chaos_kits": new_kits})
+        database.increment_user_fields(user_id, {"chaos_kits": 1})
         return "kit"
 
 
@@ -316,16 +251,8 @@ def get_item_gp(item_id, level):
     item_def = game_data.get_item(item_id)
     if not item_def:
         return 0
-    if item_def["type"] == "ride":
-        return 0
-    type_str = item_def["type"]
-    if type_str == "weapon":
-        return int(1.25 * (level**2) + 3.0 * level + 10)
-    elif type_str in ["gadget", "passive"]:
-        return int(0.4 * (level**2) + 1.5 * level + 20)
-    elif type_str == "smart_ring":
-        return 185 + ((level - 1) * 13)
-    return level * 10
+    a, b, c = game_data.get_gp_curve(item_def["type"])
+    return int(a * (level**2) + b * level + c)
 
 
 def get_total_gp(user_id, kit_cache=None, inv_cache=None):
@@ -354,43 +281,10 @@ def get_total_gp(user_id, kit_cache=None, inv_cache=None):
                 total_gp += get_item_gp(item["item_id"], item["level"])
         return total_gp
 
-    conn = database.get_connection()
-    u = conn.execute(
-        "SELECT active_kit_index FROM users WHERE user_id=?", (user_id,)
-    ).fetchone()
-    idx = u["active_kit_index"] if u else 1
-    kit = conn.execute(
-        "SELECT * FROM gear_kits WHERE user_id=? AND slot_index=?",
-        (user_id, idx),
-    ).fetchone()
-    if not kit:
-        conn.close()
+    resolved = database.resolve_active_kit(user_id)
+    if not resolved["kit"]:
         return 0
-    slots = [
-        "weapon_id",
-        "gadget_1_id",
-        "gadget_2_id",
-        "gadget_3_id",
-        "passive_1_id",
-        "passive_2_id",
-        "passive_3_id",
-        "elite_module_id",
-        "ring_1_id",
-        "ring_2_id",
-        "ring_3_id",
-    ]
-    total_gp = 0
-    for s in slots:
-        inst_id = kit[s]
-        if inst_id:
-            row = conn.execute(
-                "SELECT item_id, level FROM inventory WHERE instance_id=?",
-                (inst_id,),
-            ).fetchone()
-            if row:
-                total_gp += get_item_gp(row["item_id"], row["level"])
-    conn.close()
-    return total_gp
+    return get_total_gp(user_id, resolved["kit"], resolved["inventory"])
 
 
 def get_item_stats(item_id, level):
@@ -672,18 +566,26 @@ def calculate_fusion_rolls(item_row):
     return 1 + (item_row["level"] // 20)
 
 
+def get_load_factor(bot):
+    """Multiplier for live refresh intervals; grows with gateway latency."""
+    latency = bot.latency if bot else 0.0
+    if latency < 0.3:
+        return 1.0
+    if latency < 1.0:
+        return 2.0
+    return 4.0
+
+
 def get_sync_rate(bot, last_action_time):
     import time
 
     """Calculates a refresh rate based on bot load and player activity."""
 
-    base_rate = 2.0 if bot.latency < 0.3 else 4.0
-
     idle_time = time.time() - last_action_time
     if idle_time > 10:
         return 10.0
 
-    return base_rate
+    return 2.0 * get_load_factor(bot)
 
 
 def get_user_combat_profile(user_id):
@@ -3,7 +3,7 @@ from discord.ui import View, Button
 import asyncio
 import json
 import random
-from mo_co import database, config, game_data, utils
+from mo_co import database, config, game_data, utils, outbound
 from mo_co.game_data.missions import MISSIONS
 
 
@@ -45,7 +45,9 @@ class MissionEngine:
             self.state = raw_state
 
         try:
-            self.thread = await self.bot.fetch_channel(self.thread_id)
+            self.thread = self.bot.get_channel(self.thread_id)
+            if self.thread is None:
+                self.thread = await self.bot.fetch_channel(self.thread_id)
         except:
             return False
         return True
@@ -326,16 +328,6 @@ class MissionEngine:
         if not self.thread:
             return
 
-        target_msg = None
-        async for msg in self.thread.history(limit=10):
-            if msg.author.id == self.bot.user.id and msg.embeds:
-                if "Mission" in (msg.embeds[0].title or ""):
-                    target_msg = msg
-                    break
-
-        if not target_msg:
-            return
-
         desc = ""
         m_data = self.state["states"][m_id]
         if step["type"] in [
@@ -348,13 +340,7 @@ class MissionEngine:
         elif step["type"] == "objective_checklist":
             desc = self.render_checklist(step, m_data["prog"])
 
-        embed = discord.Embed(
-            title=f"{config.MISSION_EMOJI} Mission",
-            color=0x3498DB,
-            description=desc,
-        )
-        if target_msg.embeds[0].description != desc:
-            await target_msg.edit(embed=embed)
+        outbound.LIVE_EDITS.submit(self.thread, self.bot.user.id, desc)
 
     def render_progress_bar(self, prog, req, text):
         pct = min(1.0, prog / max(1, req))
@@ -374,17 +360,11 @@ class MissionEngine:
         return "\n".join(lines)
 
     async def get_webhook(self):
-        parent = self.thread.parent
-        webhooks = await parent.webhooks()
-        wh = next((w for w in webhooks if w.name == "MoCo Mission"), None)
-        if not wh:
-            wh = await parent.create_webhook(name="MoCo Mission")
-        return wh
+        return await outbound.WEBHOOKS.get(self.thread.parent)
 
     async def send_npc_message(self, m_def, text):
         async with self.thread.typing():
             await asyncio.sleep(len(text) * 0.02 + 0.3)
-        wh = await self.get_webhook()
         char_name = m_def["character"]
         avatar_url = None
         if m_def.get("character_icon") in config.BOT_EMOJIS:
@@ -393,20 +373,19 @@ class MissionEngine:
                 avatar_url = (
                     f"https://cdn.discordapp.com/emojis/{parts[2].replace('>', '')}.png"
                 )
-        await wh.send(
+        await outbound.WEBHOOKS.send(
+            self.thread,
             content=text,
             username=char_name,
             avatar_url=avatar_url,
-            thread=self.thread,
         )
 
     async def send_player_message(self, text, user):
-        wh = await self.get_webhook()
-        await wh.send(
+        await outbound.WEBHOOKS.send(
+            self.thread,
             content=text,
             username=user.display_name,
             avatar_url=user.display_avatar.url,
-            thread=self.thread,
         )
 
     async def send_choice_menu(self, m_id, options):
@@ -429,7 +408,9 @@ class MissionEngine:
             desc += "\n\n*Check `/missions` or `/hunt` to see Projects.*"
 
         embed.description = desc
-        await self.thread.send(embed=embed)
+        outbound.LIVE_EDITS.discard(self.thread.id)
+        msg = await self.thread.send(embed=embed)
+        outbound.LIVE_EDITS.remember(self.thread.id, msg)
 
     async def send_equip_mission_msg(self, step, m_id):
         item_name = game_data.get_item(step["item_id"])["name"]
@@ -657,32 +638,24 @@ class RewardView(View):
                 uid, step["item_id"], "Standard", step["lvl"]
             )
             if step["reward_type"] == "item_xp":
-                database.update_user_stats(uid, {"xp": old_xp + step["xp"]})
+                database.increment_user_fields(uid, {"xp_award": step["xp"]})
                 confirmation_msg += f" | {config.XP_EMOJI} **{step['xp']} XP**"
 
         elif step["reward_type"] == "xp":
-            database.update_user_stats(uid, {"xp": old_xp + step["amount"]})
+            database.increment_user_fields(uid, {"xp_award": step["amount"]})
             confirmation_msg = (
                 f"**Acquired:** {config.XP_EMOJI} **{step['amount']} XP**"
             )
 
         elif step["reward_type"] == "currency":
-            database.update_user_stats(
-                uid,
-                {
-                    "mo_gold": u_data["mo_gold"] + step["gold"],
-                    "merch_tokens": u_data["merch_tokens"] + step["tokens"],
-                },
+            database.increment_user_fields(
+                uid, {"mo_gold": step["gold"], "merch_tokens": step["tokens"]}
             )
             confirmation_msg = f"**Acquired:** {config.MOGOLD_EMOJI} **{step['gold']}** | {config.MERCH_TOKEN_EMOJI} **{step['tokens']}**"
 
         elif step["reward_type"] == "xp_tokens":
-            database.update_user_stats(
-                uid,
-                {
-                    "xp": old_xp + step["xp"],
-                    "merch_tokens": u_data["merch_tokens"] + step["tokens"],
-                },
+            database.increment_user_fields(
+                uid, {"xp_award": step["xp"], "merch_tokens": step["tokens"]}
             )
             confirmation_msg = f"**Acquired:** {config.XP_EMOJI} **{step['xp']}** | {config.MERCH_TOKEN_EMOJI} **{step['tokens']}**"
 
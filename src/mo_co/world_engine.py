@@ -3,6 +3,7 @@ import random
 import asyncio
 from mo_co import config, game_data, utils
 from mo_co.game_data import names
+from mo_co.state_backend import STATE
 
 
 NPC_CONFIG = {
@@ -24,111 +25,137 @@ NPC_CONFIG = {
 }
 
 
+def _blank_world():
+    return {"hunters": {}, "ghosts": {}, "bots": [], "boss": None, "npc": None}
+
+
 class WorldState:
+    """
+    One world's presence, boss and NPC, stored in the shared STATE record.
+
+    On the sqlite backend every property read unpickles the whole record, so
+    handlers take one snapshot() (or the record check_in returns) and pass it
+    as `world=` to the helpers below. The record only holds what other shards
+    display: names, levels and emblems, never kits.
+    """
+
     def __init__(self, world_id):
         self.world_id = world_id
         self.world_def = game_data.get_world(world_id)
 
-        self.hunters = {}
+    def snapshot(self):
+        return STATE.get("world", self.world_id) or _blank_world()
+
+    def _update(self, fn):
+        def apply(record):
+            fn(record)
+            return record
+
+        return STATE.update("world", self.world_id, apply, _blank_world())
+
+    @property
+    def hunters(self):
+        return self.snapshot()["hunters"]
+
+    @property
+    def ghosts(self):
+        return self.snapshot()["ghosts"]
 
-        self.ghosts = {}
+    @property
+    def bots(self):
+        return self.snapshot()["bots"]
 
-        self.bots = []
+    @property
+    def boss(self):
+        return self.snapshot()["boss"]
 
-        self.boss = None
-        self.npc = None
+    @boss.setter
+    def boss(self, value):
+        self._update(lambda w: w.update(boss=value))
 
-    def add_hunter(self, user_id, name, lvl, emblem, kit_data):
+    @property
+    def npc(self):
+        return self.snapshot()["npc"]
 
-        if user_id in self.ghosts:
-            del self.ghosts[user_id]
+    @npc.setter
+    def npc(self, value):
+        self._update(lambda w: w.update(npc=value))
 
-        self.hunters[user_id] = {
+    def population(self, world=None):
+        w = world or self.snapshot()
+        return len(w["hunters"]) + len(w["ghosts"]) + len(w["bots"])
+
+    def _add_hunter(self, w, user_id, name, lvl, emblem):
+        w["ghosts"].pop(user_id, None)
+        w["hunters"][user_id] = {
             "name": name,
             "lvl": lvl,
             "emblem": emblem,
             "join_time": time.time(),
             "last_action": time.time(),
             "type": "player",
-            "kit_data": kit_data,
         }
 
+    def add_hunter(self, user_id, name, lvl, emblem):
+        def apply(w):
+            self._add_hunter(w, user_id, name, lvl, emblem)
+
+        return self._update(apply)
+
     def remove_hunter(self, user_id):
-        if user_id in self.hunters:
+        def apply(w):
+            data = w["hunters"].pop(user_id, None)
+            if data:
+                data["expiry"] = time.time() + random.randint(300, 3600)
+                data["type"] = "ghost"
+                w["ghosts"][user_id] = data
 
-            data = self.hunters[user_id]
-            data["expiry"] = time.time() + random.randint(300, 3600)
-            data["type"] = "ghost"
-            self.ghosts[user_id] = data
-            del self.hunters[user_id]
+        self._update(apply)
 
-    def _generate_bot(self):
+    def _generate_bot(self, w):
 
-        if len(self.bots) >= random.randint(0, 3):
+        if len(w["bots"]) >= random.randint(0, 3):
             return
 
         base_lvl = self.world_def.get("unlock_lvl", 1)
         lvl = random.randint(base_lvl, base_lvl + 5)
 
         name = f"*{names.get_random_bot_name()}*"
-        emblem = utils.get_emblem(lvl)
-
-        w_pool = [k for k, v in game_data.ALL_ITEMS.items() if v["type"] == "weapon"]
-        if not w_pool:
-            w_pool = ["monster_slugger"]
-        w_id = random.choice(w_pool)
-
-        g_pool = [k for k, v in game_data.ALL_ITEMS.items() if v["type"] == "gadget"]
-        if not g_pool:
-            g_pool = ["smart_fireworks"]
-        g_picks = random.sample(g_pool, k=min(len(g_pool), random.randint(1, 2)))
-        gadgets = [{"id": gid, "lvl": lvl, "cd": 0} for gid in g_picks]
-
-        p_pool = [k for k, v in game_data.ALL_ITEMS.items() if v["type"] == "passive"]
-        if not p_pool:
-            p_pool = ["healthy_snacks"]
-        p_picks = random.sample(p_pool, k=min(len(p_pool), random.randint(1, 2)))
-        passives = {pid: lvl for pid in p_picks}
-
-        mod = "Standard"
-        if random.random() < 0.10:
-            mod = random.choice(["Overcharged", "Toxic", "Chaos"])
-
-        kit_data = {
-            "weapon": {"id": w_id, "modifier": mod, "level": lvl},
-            "gadgets": gadgets,
-            "passives": passives,
-        }
-
         bot_data = {
             "name": name,
             "lvl": lvl,
-            "emblem": emblem,
+            "emblem": utils.get_emblem(lvl),
             "expiry": time.time() + random.randint(120, 300),
             "type": "bot",
-            "kit_data": kit_data,
         }
-        self.bots.append(bot_data)
-
-    def cleanup(self):
-        now = time.time()
-
-        expired_ghosts = [uid for uid, g in self.ghosts.items() if now > g["expiry"]]
-        for uid in expired_ghosts:
-            del self.ghosts[uid]
-
-        self.bots = [b for b in self.bots if now < b["expiry"]]
-
-        total_pop = len(self.hunters) + len(self.ghosts) + len(self.bots)
-        if total_pop < 3:
-            if random.random() < 0.3:
-                self._generate_bot()
-
-    def get_nearby_allies(self, exlcude_id=None, count=2):
-
+        w["bots"].append(bot_data)
+
+    def cleanup(self, world=None):
+        """Expire ghosts and bots; skips the write when nothing would change."""
+        if world is not None:
+            now = time.time()
+            expired = any(now > g["expiry"] for g in world["ghosts"].values()) or any(
+                now >= b["expiry"] for b in world["bots"]
+            )
+            if not expired and self.population(world) >= 3:
+                return
+
+        def apply(w):
+            now = time.time()
+            w["ghosts"] = {
+                uid: g for uid, g in w["ghosts"].items() if now <= g["expiry"]
+            }
+            w["bots"] = [b for b in w["bots"] if now < b["expiry"]]
+            if self.population(w) < 3 and random.random() < 0.3:
+                self._generate_bot(w)
+
+        self._update(apply)
+
+    def get_nearby_allies(self, exlcude_id=None, count=2, world=None):
+        w = world or self.snapshot()
         candidates = []
 
-        for uid, h in self.hunters.items():
+        for uid, h in w["hunters"].items():
             if uid == exlcude_id:
                 continue
             if time.time() - h["last_action"] > 300:
@@ -139,11 +166,10 @@ class WorldState:
                     "name": h["name"],
                     "lvl": h["lvl"],
                     "emblem": h["emblem"],
-                    "kit": h["kit_data"],
                 }
             )
 
-        ghost_list = list(self.ghosts.values())
+        ghost_list = list(w["ghosts"].values())
         random.shuffle(ghost_list)
         for g in ghost_list[:2]:
             candidates.append(
@@ -152,32 +178,31 @@ class WorldState:
                     "name": g["name"],
                     "lvl": g["lvl"],
                     "emblem": g["emblem"],
-                    "kit": g["kit_data"],
                 }
             )
 
-        for b in self.bots:
+        for b in w["bots"]:
             candidates.append(
                 {
                     "type": "bot",
                     "name": b["name"],
                     "lvl": b["lvl"],
                     "emblem": b["emblem"],
-                    "kit": b["kit_data"],
                 }
             )
 
-        if self.npc:
+        npc = w["npc"]
+        if npc:
             candidates.append(
                 {
                     "type": "npc",
-                    "name": self.npc["name"],
+                    "name": npc["name"],
                     "lvl": 50,
-                    "weapon": self.npc["weapon"],
-                    "hp": self.npc["hp"],
-                    "max_hp": self.npc["max_hp"],
-                    "emoji": self.npc["emoji"],
-                    "timer": self.npc["timer"],
+                    "weapon": npc["weapon"],
+                    "hp": npc["hp"],
+                    "max_hp": npc["max_hp"],
+                    "emoji": npc["emoji"],
+                    "timer": npc["timer"],
                 }
             )
 
@@ -188,7 +213,7 @@ class WorldState:
 
     def spawn_boss(self, boss_name, hp, level, duration_sec, tier_id):
         expiry_ts = int(time.time() + duration_sec)
-        self.boss = {
+        boss = {
             "name": boss_name,
             "max_hp": hp,
             "hp": hp,
@@ -198,32 +223,52 @@ class WorldState:
             "expiry": expiry_ts,
             "tier": tier_id,
         }
-        return self.boss
 
-    def check_boss_timeout(self):
-        if self.boss and time.time() > self.boss["expiry"]:
-            self.boss = None
-            return True
-        return False
+        def apply(w):
+            if not w["boss"]:
+                w["boss"] = boss
 
-    def damage_boss(self, amount, user_id):
-        if self.check_boss_timeout():
-            return False
-        if not self.boss:
+        return self._update(apply)["boss"]
+
+    def check_boss_timeout(self, world=None):
+        boss = (world or self.snapshot())["boss"]
+        if not boss or time.time() <= boss["expiry"]:
             return False
+        expired = []
 
-        self.boss["hp"] -= amount
-        current_dmg = self.boss["participants"].get(user_id, 0)
-        self.boss["participants"][user_id] = current_dmg + amount
+        def apply(w):
+            if w["boss"] and time.time() > w["boss"]["expiry"]:
+                w["boss"] = None
+                expired.append(True)
 
-        if self.boss["hp"] <= 0:
-            return True
-        return False
+        self._update(apply)
+        return bool(expired)
+
+    def damage_boss(self, amount, user_id):
+        """True when this hit kills the boss, which is then cleared."""
+        killed = []
+
+        def apply(w):
+            boss = w["boss"]
+            if not boss:
+                return
+            if time.time() > boss["expiry"]:
+                w["boss"] = None
+                return
+            boss["hp"] -= amount
+            current_dmg = boss["participants"].get(user_id, 0)
+            boss["participants"][user_id] = current_dmg + amount
+            if boss["hp"] <= 0:
+                w["boss"] = None
+                killed.append(True)
+
+        self._update(apply)
+        return bool(killed)
 
     def spawn_npc(self):
         name = random.choice(list(NPC_CONFIG.keys()))
         cfg = NPC_CONFIG[name]
-        self.npc = {
+        npc = {
             "name": name,
             "max_hp": cfg["hp"],
             "hp": cfg["hp"],
@@ -232,23 +277,51 @@ class WorldState:
             "emoji": cfg["emoji"],
         }
 
-    def tick_npc(self, amount=5):
-        if not self.npc:
-            return False
-        if self.npc["hp"] <= 0:
-            self.npc = None
-            return "DIED"
-        self.npc["timer"] -= amount
-        if self.npc["timer"] <= 0:
-            return "DEPARTED"
-        return False
+        def apply(w):
+            if not w["npc"] and not w["boss"]:
+                w["npc"] = npc
+
+        self._update(apply)
+
+    def tick_npc(self, amount=5, world=None):
+        """
+        (status, npc): status is "DIED" or "DEPARTED" when the NPC leaves (it
+        is cleared), else False.
+        """
+        if not (world or self.snapshot())["npc"]:
+            return False, None
+        result = [(False, None)]
+
+        def apply(w):
+            npc = w["npc"]
+            if not npc:
+                return
+            if npc["hp"] <= 0:
+                w["npc"] = None
+                result[0] = ("DIED", npc)
+                return
+            npc["timer"] -= amount
+            if npc["timer"] <= 0:
+                w["npc"] = None
+                result[0] = ("DEPARTED", npc)
+
+        self._update(apply)
+        return result[0]
 
     def damage_npc(self, amount):
-        if self.npc:
-            self.npc["hp"] = max(0, self.npc["hp"] - amount)
+        def apply(w):
+            if w["npc"]:
+                w["npc"]["hp"] = max(0, w["npc"]["hp"] - amount)
+
+        self._update(apply)
 
 
 class WorldManager:
+    """
+    Hands out WorldState views. The worlds themselves live in STATE, so every
+    shard sees the same presence, bosses and NPCs.
+    """
+
     def __init__(self):
         self.worlds = {}
 
@@ -257,41 +330,42 @@ class WorldManager:
             self.worlds[world_id] = WorldState(world_id)
         return self.worlds[world_id]
 
-    def check_in(self, world_id, user_id, name, lvl, emblem, kit_data):
+    def check_in(self, world_id, user_id, name, lvl, emblem):
+        """Seeds bots and marks the hunter active in one write; returns the record."""
         ws = self.get_world(world_id)
 
-        total_pop = len(ws.hunters) + len(ws.ghosts) + len(ws.bots)
-
-        if total_pop < 2:
+        def apply(w):
+            if ws.population(w) < 2:
+                ws._generate_bot(w)
+                if random.random() < 0.5:
+                    ws._generate_bot(w)
+            ws._add_hunter(w, user_id, name, lvl, emblem)
 
-            ws._generate_bot()
-            if random.random() < 0.5:
-                ws._generate_bot()
-
-        ws.add_hunter(user_id, name, lvl, emblem, kit_data)
+        return ws._update(apply)
 
     def check_out(self, world_id, user_id):
-        if world_id in self.worlds:
-            self.worlds[world_id].remove_hunter(user_id)
+        self.get_world(world_id).remove_hunter(user_id)
+
+    def active_world_ids(self):
+        return [wid for wid, w in STATE.items("world") if w["hunters"]]
 
     async def npc_spawner_loop(self):
         while True:
             await asyncio.sleep(10)
 
-            for wid, ws in self.worlds.items():
-                ws.cleanup()
+            for wid, world in STATE.items("world"):
+                self.get_world(wid).cleanup(world)
 
             if random.random() < 0.16:
-                active_worlds = [
-                    wid for wid, ws in self.worlds.items() if len(ws.hunters) > 0
-                ]
+                active_worlds = self.active_world_ids()
                 if not active_worlds:
                     continue
 
                 target = random.choice(active_worlds)
-                ws = self.worlds[target]
+                ws = self.get_world(target)
+                world = ws.snapshot()
 
-                if not ws.npc and not ws.boss and random.random() < 0.15:
+                if not world["npc"] and not world["boss"] and random.random() < 0.15:
                     ws.spawn_npc()
 
 
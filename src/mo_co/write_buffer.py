@@ -0,0 +1,96 @@
+"""
+Write-behind buffer for hot `users` columns.
+
+Hunt loops record loot, XP and HP here instead of doing a read-modify-write
+per action. Deltas are merged per user and flushed on the DB writer thread as
+one relative UPDATE (`col = col + ?`) every WRITE_BEHIND_INTERVAL seconds, or
+immediately when a session ends. The same loop writes the display names that
+database.register_user queued for renamed players.
+"""
+
+import asyncio
+import threading
+from mo_co import config, database, async_db
+
+
+def _empty():
+    return {"xp": 0, "add": {}, "drain": {}, "set": {}}
+
+
+class UserWriteBuffer:
+    def __init__(self, interval):
+        self.interval = interval
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._task = None
+        self.stats = {"recorded": 0, "flushes": 0, "rows_written": 0}
+
+    def record(self, user_id, xp=0, add=None, drain=None, assign=None):
+        with self._lock:
+            entry = self._pending.setdefault(user_id, _empty())
+            entry["xp"] += xp
+            for k, v in (add or {}).items():
+                if v:
+                    entry["add"][k] = entry["add"].get(k, 0) + v
+            for k, v in (drain or {}).items():
+                if v:
+                    entry["drain"][k] = entry["drain"].get(k, 0) + v
+            entry["set"].update(assign or {})
+            self.stats["recorded"] += 1
+
+    def has_pending(self, user_id):
+        with self._lock:
+            return user_id in self._pending
+
+    def flush(self, user_id=None):
+        """Synchronous flush of one user (or everyone). Runs on the writer thread."""
+        with self._lock:
+            if user_id is None:
+                batch, self._pending = self._pending, {}
+            elif user_id in self._pending:
+                batch = {user_id: self._pending.pop(user_id)}
+            else:
+                return 0
+        if not batch:
+            return 0
+        try:
+            database.apply_user_deltas(batch)
+        except Exception:
+            with self._lock:
+                for uid, entry in batch.items():
+                    self._merge_back(uid, entry)
+            raise
+        self.stats["flushes"] += 1
+        self.stats["rows_written"] += len(batch)
+        return len(batch)
+
+    def _merge_back(self, user_id, entry):
+        newer = self._pending.get(user_id)
+        if newer is None:
+            self._pending[user_id] = entry
+            return
+        newer["xp"] += entry["xp"]
+        for bucket in ("add", "drain"):
+            for k, v in entry[bucket].items():
+                newer[bucket][k] = newer[bucket].get(k, 0) + v
+        for k, v in entry["set"].items():
+            newer["set"].setdefault(k, v)
+
+    async def flush_async(self, user_id=None):
+        return await async_db.call_write(self.flush, user_id)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush_async()
+                await async_db.call_write(database.flush_display_names)
+            except Exception as e:
+                print(f"Write-behind flush failed: {e}")
+
+
+WRITE_BUFFER = UserWriteBuffer(config.WRITE_BEHIND_INTERVAL)